@@ -0,0 +1,159 @@
+# autoscale.py — self-tuning concurrency for detail-page fetching
+# AdaptiveExecutor keeps a pool of up to max_workers threads but only lets
+# `limit` tasks run at once. A controller thread adjusts the limit between
+# min_workers and max_workers (additive increase, multiplicative decrease)
+# from per-job latency, error/timeout rate, free memory and CPU load, and
+# logs every change.
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import psutil
+
+import config
+import metrics
+
+# Completions remembered for the rolling latency/error window
+WINDOW = 30
+# Control intervals before re-probing a level that was too slow
+REPROBE_INTERVALS = 10
+
+
+def default_outcome(result) -> str:
+    """Classify a finished job: "ok", "timeout" or "error"."""
+    description = getattr(result, "description", None)
+    return "timeout" if description == "None" else "ok"
+
+
+class AdaptiveExecutor:
+    def __init__(self, min_workers: int = config.AUTOSCALE_MIN_THREADS,
+                 max_workers: int = config.MAX_THREADS,
+                 initial: Optional[int] = None,
+                 interval: float = config.AUTOSCALE_INTERVAL,
+                 outcome: Callable[[object], str] = default_outcome):
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers)
+        self.limit = min(max(initial or self.min_workers, self.min_workers), self.max_workers)
+        self.interval = interval
+        self.outcome = outcome
+
+        self.pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.cond = threading.Condition()
+        self.active = 0
+        self.pending = 0
+        self.window: deque = deque(maxlen=WINDOW)
+        # Best median latency seen at each concurrency level
+        self.latency_by_limit = {}
+        # Levels backed off for latency -> time they may be tried again
+        self.retry_at = {}
+        self.history: List[Tuple[float, int, str]] = []
+
+        self._stop = threading.Event()
+        self._controller = threading.Thread(target=self._control_loop, daemon=True)
+        self._controller.start()
+        self._log(self.limit, "initial")
+
+    # --- Task execution -----------------------------------------------------
+
+    def _run(self, fn, args, kwargs):
+        with self.cond:
+            while self.active >= self.limit:
+                self.cond.wait()
+            self.active += 1
+            self.pending -= 1
+        start = time.perf_counter()
+        status = "error"
+        try:
+            result = fn(*args, **kwargs)
+            status = self.outcome(result)
+            return result
+        finally:
+            with self.cond:
+                self.active -= 1
+                self.window.append((time.perf_counter() - start, status))
+                self.cond.notify_all()
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn like ThreadPoolExecutor.submit; returns a Future."""
+        with self.cond:
+            self.pending += 1
+        return self.pool.submit(self._run, fn, args, kwargs)
+
+    # --- Control loop -------------------------------------------------------
+
+    def _signals(self):
+        with self.cond:
+            samples = list(self.window)
+            backlog = self.pending
+        latencies = sorted(s for s, _ in samples)
+        failures = sum(1 for _, status in samples if status != "ok")
+        memory = psutil.virtual_memory()
+        return {
+            "samples": len(samples),
+            "p50": latencies[len(latencies) // 2] if latencies else None,
+            "error_rate": failures / len(samples) if samples else 0.0,
+            "free_memory": memory.available / memory.total,
+            "cpu": psutil.cpu_percent(interval=None),
+            "backlog": backlog,
+        }
+
+    def _decide(self, s) -> Tuple[int, str]:
+        limit = self.limit
+        if s["free_memory"] < config.AUTOSCALE_MIN_FREE_MEMORY:
+            return max(self.min_workers, limit // 2), f"free memory {s['free_memory']:.0%}"
+        if s["cpu"] > config.AUTOSCALE_MAX_CPU_PERCENT:
+            return max(self.min_workers, limit // 2), f"CPU {s['cpu']:.0f}%"
+        # Wait for a window's worth of jobs at this level before judging it
+        if s["samples"] < min(WINDOW, 2 * limit):
+            return limit, ""
+        if s["error_rate"] > config.AUTOSCALE_MAX_ERROR_RATE:
+            return max(self.min_workers, limit // 2), f"error/timeout rate {s['error_rate']:.0%}"
+
+        self.latency_by_limit[limit] = min(self.latency_by_limit.get(limit, s["p50"]), s["p50"])
+        best = min(self.latency_by_limit.values())
+        if limit > self.min_workers and s["p50"] > best * config.AUTOSCALE_LATENCY_TOLERANCE:
+            self.retry_at[limit] = time.time() + REPROBE_INTERVALS * self.interval
+            return limit - 1, f"p50 {s['p50']:.1f}s vs best {best:.1f}s"
+        if (s["backlog"] > 0 and limit < self.max_workers
+                and time.time() >= self.retry_at.get(limit + 1, 0)):
+            return limit + 1, f"healthy, {s['backlog']} queued"
+        return limit, ""
+
+    def _control_loop(self):
+        psutil.cpu_percent(interval=None)
+        while not self._stop.wait(self.interval):
+            signals = self._signals()
+            new_limit, reason = self._decide(signals)
+            if new_limit != self.limit:
+                with self.cond:
+                    self.limit = new_limit
+                    # Judge the new level on fresh samples only
+                    self.window.clear()
+                    self.cond.notify_all()
+                self._log(new_limit, reason, signals)
+
+    def _log(self, limit, reason, signals=None):
+        self.history.append((time.time(), limit, reason))
+        metrics.REGISTRY.log({"ts": round(time.time(), 3), "metric": "scrape_concurrency",
+                              "value": limit, "reason": reason,
+                              **({k: v for k, v in signals.items() if v is not None}
+                                 if signals else {})})
+        if reason != "initial":
+            with config.print_lock:
+                print(f"[autoscale] concurrency -> {limit} ({reason})")
+
+    # --- Lifecycle ----------------------------------------------------------
+
+    def shutdown(self, wait: bool = True):
+        self._stop.set()
+        self.pool.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        return False
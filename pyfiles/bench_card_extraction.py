@@ -0,0 +1,88 @@
+# bench_card_extraction.py — benchmark listing-card extraction strategies
+# Usage:  python bench_card_extraction.py [--repeat N] [--browser]
+# Parses the saved listing page in fixtures/ with lxml; --browser also loads
+# it in headless Chrome and compares per-card find_element calls, the single
+# execute_script batch and page_source + lxml, counting chromedriver calls.
+
+import argparse
+import os
+import pathlib
+import time
+
+import config
+import utils
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "fixtures", "indeed_listing_page.html")
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def per_card(driver):
+    """The old Phase 1 loop: four find_element calls per card."""
+    posts = driver.find_elements(config.By.CLASS_NAME, "job_seen_beacon")
+    return [info for info in (utils.get_job_basic_info(p) for p in posts) if info]
+
+
+def count_calls(driver):
+    """Wrap driver.execute so every chromedriver command is counted."""
+    counter = {"calls": 0}
+    execute = driver.execute
+
+    def counting(*args, **kwargs):
+        counter["calls"] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = counting
+    return counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark listing-card extraction")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--browser", action="store_true",
+                        help="Also measure in headless Chrome")
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding="utf-8") as f:
+        html = f.read()
+
+    print(f"Fixture: {FIXTURE} ({len(html) / 1024:.0f} KB)")
+    print(f"{'Strategy':<28}{'Cards':>7}{'Calls':>7}{'ms/page':>10}")
+    print("-" * 52)
+
+    seconds, cards = best_of(lambda: utils.parse_job_cards(html, "https://www.indeed.com/"),
+                             args.repeat)
+    print(f"{'lxml (HTML in memory)':<28}{len(cards):>7}{0:>7}{seconds * 1000:>10.2f}")
+
+    if not args.browser:
+        return
+
+    driver = utils.create_driver()
+    try:
+        driver.get(pathlib.Path(FIXTURE).as_uri())
+        counter = count_calls(driver)
+        strategies = [
+            ("find_element per card", lambda: per_card(driver)),
+            ("execute_script batch", lambda: utils.get_job_cards(driver)),
+            ("page_source + lxml",
+             lambda: utils.parse_job_cards(driver.page_source, driver.current_url)),
+        ]
+        for name, fn in strategies:
+            counter["calls"] = 0
+            seconds, cards = best_of(fn, args.repeat)
+            calls = counter["calls"] // args.repeat
+            print(f"{name:<28}{len(cards):>7}{calls:>7}{seconds * 1000:>10.2f}")
+    finally:
+        utils.quit_driver(driver)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# bench_chrome_profiles.py — compare the default and lean Chrome profiles
+# Usage:  python bench_chrome_profiles.py [URL ...] [--drivers N] [--repeat N]
+# Starts N drivers per profile, loads every URL with each of them and reports
+# startup time, driver.get() time and memory per driver (chromedriver plus
+# all Chrome processes it spawned). Without URLs the saved listing page in
+# fixtures/ is used; pass real Indeed search/detail URLs for network numbers.
+
+import argparse
+import os
+import pathlib
+import statistics
+import time
+
+import psutil
+
+import utils
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "fixtures", "indeed_listing_page.html")
+
+
+def driver_memory(driver):
+    """RSS and USS (MB) of chromedriver and every process under it."""
+    root = psutil.Process(driver.service.process.pid)
+    rss = uss = 0
+    for proc in [root] + root.children(recursive=True):
+        try:
+            info = proc.memory_full_info()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        rss += info.rss
+        uss += getattr(info, "uss", info.rss)
+    return rss / 2**20, uss / 2**20
+
+
+def run_profile(lean, urls, drivers, repeat):
+    startups, loads, rss, uss = [], [], [], []
+    running = []
+    try:
+        for _ in range(drivers):
+            start = time.perf_counter()
+            running.append(utils.create_driver(lean=lean))
+            startups.append(time.perf_counter() - start)
+
+        for driver in running:
+            for _ in range(repeat):
+                for url in urls:
+                    start = time.perf_counter()
+                    driver.get(url)
+                    loads.append(time.perf_counter() - start)
+            # Measure with every driver alive, after its pages have loaded
+            r, u = driver_memory(driver)
+            rss.append(r)
+            uss.append(u)
+    finally:
+        for driver in running:
+            utils.quit_driver(driver)
+
+    return {
+        "startup_s": statistics.mean(startups),
+        "load_p50_ms": statistics.median(loads) * 1000,
+        "load_max_ms": max(loads) * 1000,
+        "rss_mb": statistics.mean(rss),
+        "uss_mb": statistics.mean(uss),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chrome scraping profiles")
+    parser.add_argument("urls", nargs="*", help="Pages to load (default: fixture page)")
+    parser.add_argument("--drivers", type=int, default=3, help="Drivers alive at once")
+    parser.add_argument("--repeat", type=int, default=3, help="Loads per URL per driver")
+    args = parser.parse_args()
+
+    urls = args.urls or [pathlib.Path(FIXTURE).as_uri()]
+    print(f"{len(urls)} URL(s), {args.drivers} drivers, {args.repeat} loads each\n")
+    print(f"{'Profile':<10}{'Start s':>9}{'get p50 ms':>12}{'get max ms':>12}"
+          f"{'RSS MB':>9}{'USS MB':>9}")
+    print("-" * 61)
+
+    results = {}
+    for name, lean in (("default", False), ("lean", True)):
+        results[name] = r = run_profile(lean, urls, args.drivers, args.repeat)
+        print(f"{name:<10}{r['startup_s']:>9.2f}{r['load_p50_ms']:>12.0f}"
+              f"{r['load_max_ms']:>12.0f}{r['rss_mb']:>9.0f}{r['uss_mb']:>9.0f}")
+
+    base, lean = results["default"], results["lean"]
+    print(f"\nlean vs default: get p50 {lean['load_p50_ms'] / base['load_p50_ms']:.2f}x, "
+          f"USS per driver {lean['uss_mb'] / base['uss_mb']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
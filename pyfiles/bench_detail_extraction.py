@@ -0,0 +1,96 @@
+# bench_detail_extraction.py — benchmark job detail page extraction
+# Usage:  python bench_detail_extraction.py [--pages N] [--repeat N] [--browser]
+# Renders detail pages with fixture_server.py and times parse_job_details
+# (lxml) per page, with the share of pages on which each field was found;
+# --browser also serves them to headless Chrome and compares the old
+# find_element sequence (description + three salary lookups), the single
+# execute_script call and page_source + lxml, counting chromedriver calls.
+
+import argparse
+import statistics
+import time
+
+import config
+import fixture_server
+import utils
+from bench_card_extraction import count_calls
+
+
+def per_selector(driver):
+    """The old detail extraction: one find_element per lookup, misses raise."""
+    description = driver.find_element(config.By.ID, "jobDescriptionText").text
+    return utils.JobDetails(description, utils.get_detail_salary(driver), "", "", "")
+
+
+def time_pages(fn, pages, repeat):
+    """Best-of-repeat seconds for each page, plus the last results."""
+    seconds, results = [], []
+    for page in pages:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = fn(page)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        seconds.append(best)
+        results.append(result)
+    return seconds, results
+
+
+def report(name, seconds, results, calls=None):
+    found = {field: sum(1 for r in results if getattr(r, field) not in ("", "None"))
+             for field in utils.JobDetails._fields}
+    shares = " ".join(f"{field}={n / len(results):.0%}" for field, n in found.items())
+    print(f"{name:<26}{calls if calls is not None else '-':>7}"
+          f"{statistics.median(seconds) * 1000:>10.2f}{max(seconds) * 1000:>10.2f}  {shares}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job detail extraction")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--browser", action="store_true",
+                        help="Also measure in headless Chrome")
+    args = parser.parse_args()
+
+    site = fixture_server.FixtureSite(fixture_server.load_postings())
+    jks = [p["jk"] for p in site.postings[:args.pages]]
+    html_pages = [site.detail(jk) for jk in jks]
+    table = utils.load_detail_selectors()
+
+    print(f"{len(html_pages)} detail pages, selectors from {config.DETAIL_SELECTORS_FILE}")
+    print(f"{'Strategy':<26}{'Calls':>7}{'p50 ms':>10}{'max ms':>10}  Fields found")
+    print("-" * 100)
+    seconds, results = time_pages(lambda html: utils.parse_job_details(html, table),
+                                  html_pages, args.repeat)
+    report("lxml (HTML in memory)", seconds, results)
+
+    if not args.browser:
+        return
+
+    server, _, base_url = fixture_server.start_server()
+    driver = utils.create_driver()
+    try:
+        counter = count_calls(driver)
+        strategies = [
+            ("find_element sequence", per_selector),
+            ("execute_script", utils.extract_job_details),
+            ("page_source + lxml", lambda d: utils.parse_job_details(d.page_source, table)),
+        ]
+        for name, fn in strategies:
+            seconds, results, calls = [], [], 0
+            for jk in jks:
+                driver.get(f"{base_url}/viewjob?jk={jk}")
+                counter["calls"] = 0
+                page_seconds, page_results = time_pages(lambda _: fn(driver), [jk], args.repeat)
+                calls = counter["calls"] // args.repeat
+                seconds += page_seconds
+                results += page_results
+            report(name, seconds, results, calls)
+    finally:
+        utils.quit_driver(driver)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
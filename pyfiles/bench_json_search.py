@@ -0,0 +1,77 @@
+# bench_json_search.py — microbenchmark for the regions-dict search in run_all
+# Usage:  python bench_json_search.py [payload.json ...]
+# Defaults to the payloads captured in debug_dump/json_*.json; falls back to a
+# synthetic Levels.fyi-shaped payload when nothing has been captured yet.
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import run_all
+from run_all import find_regions_dict, looks_like_regions_dict
+
+REPEAT = 5
+
+
+def legacy_search(payload):
+    """The stack-based DFS previously inlined in run_all."""
+    if looks_like_regions_dict(payload):
+        return payload
+    stack = [payload]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            if looks_like_regions_dict(cur):
+                return cur
+            stack.extend(cur.values())
+        elif isinstance(cur, list):
+            stack.extend(cur)
+    return None
+
+
+def synthetic_payload(n_regions=300, n_noise=2000):
+    """Regions table buried under a Next.js-like page payload."""
+    regions = {
+        str(i): {
+            "primary_name": f"Region {i}", "secondary_name": f"City {i}, CA",
+            "rank": i, "p10": 1, "p25": 2, "p50": 3, "p75": 4, "p90": 5,
+        }
+        for i in range(n_regions)
+    }
+    def noise():
+        return [{"id": i, "tags": ["a", "b", "c"], "meta": {"k": "v" * 20}}
+                for i in range(n_noise)]
+    return {"props": {"pageProps": {
+        "header": noise(), "heatmap": {"dma": regions}, "footer": noise()}}}
+
+
+def load_payloads(paths):
+    payloads = []
+    for path in paths:
+        try:
+            payloads.append((path.name, json.loads(path.read_text(encoding="utf-8"))))
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+    return payloads
+
+
+def main():
+    paths = [Path(p) for p in sys.argv[1:]] or sorted(run_all.DEBUG_DIR.glob("json_*.json"))
+    payloads = load_payloads(paths)
+    if not payloads:
+        print("No captured payloads found, using a synthetic payload.")
+        payloads = [("synthetic", synthetic_payload()),
+                    ("synthetic-miss", synthetic_payload(n_regions=0))]
+
+    print(f"{'payload':<24}{'legacy (ms)':>14}{'indexed (ms)':>14}{'speedup':>10}")
+    for name, payload in payloads:
+        assert (legacy_search(payload) is None) == (find_regions_dict(payload) is None)
+        old = min(timeit.repeat(lambda: legacy_search(payload), number=1, repeat=REPEAT))
+        new = min(timeit.repeat(lambda: find_regions_dict(payload), number=1, repeat=REPEAT))
+        speedup = old / new if new else float("inf")
+        print(f"{name:<24}{old * 1000:>14.2f}{new * 1000:>14.2f}{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+# bench_resume_pipeline.py — microbenchmarks for the resume/keyword pipeline
+# Usage:  python bench_resume_pipeline.py [--repeat N] [--resume FILE.pdf ...]
+#                                         [--out results.json] [--compare OLD.json]
+# Times ResumeParser.extract_text, KeywordSuggester.suggest_keywords,
+# ResumeScorer.score_resume and OnetAPI.get_keywords across document and
+# keyword-set sizes, with a tracemalloc pass per case for allocations.
+# O*NET calls go to a local stub serving the payloads in fixtures/onet/
+# (details for code X.xN are the recorded payload for X scaled N times).
+# Results are saved as JSON tagged with the current commit so runs can be
+# compared with --compare.
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from keyword_suggester import KeywordSuggester
+from resume_parser import ResumeParser
+from resume_scorer import ResumeScorer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ONET_FIXTURES = os.path.join(SCRIPT_DIR, "fixtures", "onet")
+ONET_CODE = "15-2051.00"
+
+RESUME_PAGES = [1, 2, 5, 10]
+KEYWORD_SET_SIZES = [10, 50, 200, 1000]
+PAYLOAD_SCALES = [1, 4, 16]
+WORDS_PER_PAGE = 450
+
+FILLER = ("led built designed improved reduced delivered analyzed automated managed "
+          "developed partnered launched team project customer revenue pipeline "
+          "model dashboard report stakeholders quarterly accuracy latency cost "
+          "the a of and to in for with on by from across using").split()
+
+
+# --- Inputs -----------------------------------------------------------------
+
+def onet_vocabulary():
+    """Keyword-like terms from the recorded O*NET payload."""
+    with open(os.path.join(ONET_FIXTURES, f"{ONET_CODE}.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    terms = [ex["name"] for cat in data["technology_skills"]["category"] for ex in cat["example"]]
+    for task in data["tasks"]["task"]:
+        terms += re.findall(r"[a-z]{5,}", task["statement"].lower())
+    return list(dict.fromkeys(terms))
+
+
+def keyword_set(size, vocabulary):
+    """size keywords: the O*NET terms first, then synthetic skills."""
+    terms = vocabulary[:size]
+    return terms + [f"skill{i:04d}" for i in range(size - len(terms))]
+
+
+def synthetic_resume(pages, vocabulary, seed=0):
+    """Resume text with contact info, the usual sections and some keywords."""
+    rng = random.Random(seed)
+    lines = ["Jordan Example", "jordan@example.com | 555-123-4567", "",
+             "EDUCATION", "M.S. Statistics, Example University", "",
+             "SKILLS", ", ".join(rng.sample(vocabulary, min(25, len(vocabulary)))), "",
+             "PROFESSIONAL EXPERIENCE"]
+    words = 0
+    while words < pages * WORDS_PER_PAGE:
+        sentence = [rng.choice(FILLER) for _ in range(rng.randint(8, 16))]
+        if rng.random() < 0.4:
+            sentence.insert(rng.randrange(len(sentence)), rng.choice(vocabulary))
+        lines.append("- " + " ".join(sentence).capitalize() + ".")
+        words += len(sentence)
+        if rng.random() < 0.05:
+            lines += ["", rng.choice(["PROJECTS", "EXPERIENCE"])]
+    return "\n".join(lines)
+
+
+def write_pdf(text, path, lines_per_page=60, width=95):
+    """Write text to a minimal multi-page PDF (Helvetica, no dependencies)."""
+    wrapped = []
+    for line in text.split("\n"):
+        while len(line) > width:
+            cut = line.rfind(" ", 0, width)
+            cut = cut if cut > 0 else width
+            wrapped.append(line[:cut])
+            line = line[cut:].lstrip()
+        wrapped.append(line)
+    pages = [wrapped[i:i + lines_per_page] for i in range(0, len(wrapped), lines_per_page)]
+
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in pages:
+        body = ["BT /F1 10 Tf 12 TL 50 770 Td"]
+        for line in page:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            body.append(f"({escaped}) '")
+        body.append("ET")
+        stream = "\n".join(body).encode("latin-1", "replace")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream")
+        kids.append(len(objects) + 1)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Contents {len(objects)} 0 R /Resources << /Font << /F1 3 0 R >> >> >>")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        data = obj if isinstance(obj, bytes) else obj.encode("latin-1")
+        out += f"{num} 0 obj\n".encode() + data + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{o:010d} 00000 n \n".encode() for o in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+# --- O*NET stub -------------------------------------------------------------
+
+def scaled_details(code):
+    """Recorded details payload, repeated `scale` times with renamed terms."""
+    base, _, scale = code.partition(".x")
+    with open(os.path.join(ONET_FIXTURES, f"{base}.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    copies = int(scale or 1)
+    if copies > 1:
+        for key, items in (("tasks", "task"), ("detailed_work_activities", "activity")):
+            field = "statement" if items == "task" else "name"
+            original = data[key][items]
+            data[key][items] = [{**item, field: f"{item[field]} variant{n}"}
+                                for n in range(copies) for item in original]
+        cats = data["technology_skills"]["category"]
+        data["technology_skills"]["category"] = [
+            {**cat, "example": [{"name": f"{ex['name']} {n}" if n else ex["name"]} for ex in cat["example"]]}
+            for n in range(copies) for cat in cats]
+    return data
+
+
+def start_onet_stub():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            match = re.search(r"/occupations/([^/]+)/details/?$", path)
+            try:
+                if path.endswith("/search"):
+                    with open(os.path.join(ONET_FIXTURES, "search.json"), encoding="utf-8") as f:
+                        payload = json.load(f)
+                elif match:
+                    payload = scaled_details(match.group(1))
+                else:
+                    raise FileNotFoundError(path)
+            except FileNotFoundError:
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# --- Measurement ------------------------------------------------------------
+
+def measure(stage, params, fn, repeat):
+    """Time fn `repeat` times, then once more under tracemalloc."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    current, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    result = {"stage": stage, "params": params,
+              "best_ms": round(min(times) * 1000, 3),
+              "median_ms": round(statistics.median(times) * 1000, 3),
+              "peak_alloc_kb": round(peak / 1024, 1),
+              "retained_kb": round(current / 1024, 1),
+              "retained_blocks": blocks}
+    label = " ".join(f"{k}={v}" for k, v in params.items())
+    print(f"{stage:<20}{label:<28}{result['best_ms']:>10.2f}{result['median_ms']:>10.2f}"
+          f"{result['peak_alloc_kb']:>12.0f}")
+    return result
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               cwd=SCRIPT_DIR, capture_output=True, text=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_onet(results, repeat):
+    """OnetAPI stages; skipped when spaCy/NLTK data is not installed."""
+    try:
+        from onet_api import OnetAPI
+        start = time.perf_counter()
+        onet = OnetAPI("bench", "bench")
+        init_ms = (time.perf_counter() - start) * 1000
+    except (ImportError, OSError, LookupError) as e:
+        print(f"{'onet':<20}skipped: {type(e).__name__}: {str(e).splitlines()[0][:60]}")
+        return
+
+    server, base = start_onet_stub()
+    onet.base_url = f"{base}/v1.9/ws/online/occupations/"
+    onet.search_url = f"{base}/ws/online/search"
+    try:
+        results.append({"stage": "onet_init", "params": {}, "best_ms": round(init_ms, 3),
+                        "median_ms": round(init_ms, 3)})
+        print(f"{'onet_init':<20}{'':<28}{init_ms:>10.2f}{init_ms:>10.2f}")
+        results.append(measure("onet_search_job", {}, lambda: onet.search_job("data scientist"), repeat))
+        for scale in PAYLOAD_SCALES:
+            code = ONET_CODE if scale == 1 else f"{ONET_CODE}.x{scale}"
+            n = len(onet.get_keywords(code))
+            results.append(measure("onet_get_keywords", {"payload_scale": scale, "keywords": n},
+                                   lambda: onet.get_keywords(code), repeat))
+    finally:
+        server.shutdown()
+
+
+def compare(results, old_path):
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    key = lambda r: (r["stage"], json.dumps(r["params"], sort_keys=True))
+    before = {key(r): r for r in old["results"]}
+    print(f"\nCompared with {old['commit']} ({old_path}):")
+    for r in results:
+        prev = before.get(key(r))
+        if prev and prev["best_ms"]:
+            ratio = r["best_ms"] / prev["best_ms"]
+            flag = "  <-- slower" if ratio > 1.2 else ""
+            label = " ".join(f"{k}={v}" for k, v in r["params"].items())
+            print(f"  {r['stage']:<20}{label:<28}{ratio:>6.2f}x{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resume/keyword pipeline")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--resume", nargs="*", default=[], help="Sample resume PDFs")
+    parser.add_argument("--out", help="Results file (default: bench_results/resume_pipeline-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    vocabulary = onet_vocabulary()
+    commit = git_commit()
+    results = []
+    print(f"{'Stage':<20}{'Case':<28}{'best ms':>10}{'median ms':>10}{'peak KB':>12}")
+    print("-" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        documents = []
+        for pages in RESUME_PAGES:
+            path = os.path.join(tmp, f"synthetic_{pages}p.pdf")
+            write_pdf(synthetic_resume(pages, vocabulary, seed=pages), path)
+            documents.append((f"synthetic-{pages}p", path))
+        documents += [(os.path.basename(p), p) for p in args.resume]
+
+        texts = []
+        for name, path in documents:
+            text = ResumeParser.extract_text(path)
+            texts.append((name, text))
+            results.append(measure("parse", {"resume": name, "chars": len(text)},
+                                   lambda: ResumeParser.extract_text(path), args.repeat))
+
+    for name, text in texts:
+        for size in KEYWORD_SET_SIZES:
+            keywords = keyword_set(size, vocabulary)
+            params = {"resume": name, "keywords": size}
+            results.append(measure("suggest_keywords", params,
+                                   lambda: KeywordSuggester.suggest_keywords(text, keywords), args.repeat))
+            results.append(measure("score_resume", params,
+                                   lambda: ResumeScorer.score_resume(text, keywords), args.repeat))
+
+    run_onet(results, args.repeat)
+
+    out = args.out or os.path.join(SCRIPT_DIR, "bench_results", f"resume_pipeline-{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"commit": commit,
+                   "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                   "python": platform.python_version(),
+                   "platform": platform.platform(),
+                   "repeat": args.repeat,
+                   "results": results}, f, indent=2)
+    print(f"\n✓ Results written to {out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# bench_scraper.py — end-to-end scraper benchmark against fixture_server.py
+# Usage:  python bench_scraper.py [--pages N] [--only NAME ...] [--keep-sleeps]
+#                                 [--json results.json]
+# Runs the unmodified scraper_main.py flow headless, once per configuration,
+# against the local fixture site (answers its prompts on stdin and points it
+# at the site through DFP_* overrides). Reports jobs/min, Chrome starts,
+# p50/p95 per-job latency and peak RSS of the whole process tree.
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import psutil
+
+import fixture_server
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# name, scraper threads, extra DFP_* overrides, fixture site options
+CONFIGURATIONS = [
+    ("threads-3", 3, {}, {}),
+    ("threads-6", 6, {}, {}),
+    ("threads-3-full-profile", 3, {"DFP_LEAN_CHROME_PROFILE": "0"}, {}),
+    ("threads-3-latency-300ms", 3, {}, {"latency_ms": 300, "jitter_ms": 200}),
+    # Short breaker pause so a run with blocks stays comparable
+    ("threads-3-block-10pct", 3, {"DFP_BLOCK_COOLDOWN": "5"}, {"block_rate": 0.1}),
+]
+
+# The scraper's deliberate human-like pauses; zeroed unless --keep-sleeps
+NO_SLEEPS = {
+    "DFP_PAGE_LOAD_MIN": "0", "DFP_PAGE_LOAD_MAX": "0",
+    "DFP_JOB_LOAD_MIN": "0", "DFP_JOB_LOAD_MAX": "0",
+    "DFP_THREAD_DELAY_MIN": "0", "DFP_THREAD_DELAY_MAX": "0",
+    "DFP_PAGE_SWITCH_MIN": "0", "DFP_PAGE_SWITCH_MAX": "0",
+}
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(int(q * len(ordered)), len(ordered) - 1)], 2)
+
+
+def sample_peak_rss(proc, stop, peak):
+    """Track the largest summed RSS of proc and its descendants."""
+    root = psutil.Process(proc.pid)
+    while not stop.is_set():
+        total = 0
+        try:
+            for p in [root] + root.children(recursive=True):
+                try:
+                    total += p.memory_info().rss
+                except psutil.NoSuchProcess:
+                    pass
+        except psutil.NoSuchProcess:
+            break
+        peak[0] = max(peak[0], total)
+        time.sleep(0.2)
+
+
+def run_configuration(name, threads, overrides, site_options, pages, keep_sleeps, workdir):
+    server, site, base_url = fixture_server.start_server(**site_options)
+    log_path = os.path.join(workdir, f"{name}.jsonl")
+    prom_path = os.path.join(workdir, f"{name}.prom")
+    env = {
+        **os.environ,
+        "PYTHONPATH": SCRIPT_DIR + os.pathsep + os.environ.get("PYTHONPATH", ""),
+        "DFP_INDEED_BASE_URL": base_url,
+        "DFP_METRICS_LOG": log_path,
+        "DFP_METRICS_PROM_FILE": prom_path,
+        "DFP_DEDUP_SEED_FILES": "[]",
+        **({} if keep_sleeps else NO_SLEEPS),
+        **overrides,
+    }
+    # job title, city, state, start page, pages, threads, save option (4 = quit)
+    answers = "\n".join(["Data Scientist", "Arlington", "VA", "1", str(pages), str(threads), "4"]) + "\n"
+
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, os.path.join(SCRIPT_DIR, "scraper_main.py")],
+                            cwd=workdir, env=env, stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    stop, peak = threading.Event(), [0]
+    sampler = threading.Thread(target=sample_peak_rss, args=(proc, stop, peak), daemon=True)
+    sampler.start()
+    output, _ = proc.communicate(answers)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    sampler.join()
+    server.shutdown()
+
+    match = re.search(r"Total jobs collected: (\d+)", output)
+    if proc.returncode != 0 or not match:
+        tail = "\n".join(output.splitlines()[-15:])
+        raise RuntimeError(f"{name}: scraper exited with {proc.returncode}\n{tail}")
+    jobs = int(match.group(1))
+
+    chrome_starts = 0
+    if os.path.exists(prom_path):
+        with open(prom_path, encoding="utf-8") as f:
+            found = re.search(r"^scrape_chrome_starts_total (\S+)$", f.read(), re.MULTILINE)
+        chrome_starts = int(float(found.group(1))) if found else 0
+
+    latencies = []
+    if os.path.exists(log_path):
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                if event.get("metric") == "scrape_job_seconds":
+                    latencies.append(event["value"])
+
+    return {
+        "name": name,
+        "threads": threads,
+        "jobs": jobs,
+        "seconds": round(elapsed, 2),
+        "jobs_per_min": round(jobs / elapsed * 60, 1),
+        "chrome_starts": chrome_starts,
+        "job_p50_s": percentile(latencies, 0.50),
+        "job_p95_s": percentile(latencies, 0.95),
+        "peak_rss_mb": round(peak[0] / 2**20),
+        "requests": dict(site.stats),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scraper benchmark")
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--only", nargs="*", help="Configuration names to run")
+    parser.add_argument("--keep-sleeps", action="store_true",
+                        help="Keep the scraper's randomized pauses")
+    parser.add_argument("--json", help="Write results to this file")
+    args = parser.parse_args()
+
+    configs = [c for c in CONFIGURATIONS if not args.only or c[0] in args.only]
+    results = []
+    print(f"{'Configuration':<26}{'Jobs':>6}{'Jobs/min':>10}{'Chrome':>8}"
+          f"{'p50 s':>8}{'p95 s':>8}{'Peak RSS MB':>13}{'Blocked':>9}")
+    print("-" * 88)
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, threads, overrides, site_options in configs:
+            r = run_configuration(name, threads, overrides, site_options,
+                                  args.pages, args.keep_sleeps, workdir)
+            results.append(r)
+            print(f"{name:<26}{r['jobs']:>6}{r['jobs_per_min']:>10.1f}{r['chrome_starts']:>8}"
+                  f"{r['job_p50_s'] or 0:>8.2f}{r['job_p95_s'] or 0:>8.2f}"
+                  f"{r['peak_rss_mb']:>13}{r['requests']['blocked']:>9}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n✓ Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# bench_startup.py — cold-start time of every cli.py command against a budget
+# Usage:  python bench_startup.py [--repeat N] [--only scrape search ...]
+#                                 [--profile COMMAND]
+# Starts each command in a fresh interpreter the way a user would and times
+# it until it is ready for input: --help for argparse commands, the first
+# prompt (stdin is closed, so the prompt's input() ends the run) for the
+# interactive ones. Exits 1 when a command's best time is over its budget.
+# --profile prints the slowest imports of one command (python -X importtime).
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# command -> (cli.py arguments, budget in ms). Budgets leave ~50% headroom
+# over a warm-disk laptop run; a command that starts importing pandas,
+# selenium or spaCy before it needs them will blow through its budget.
+BUDGETS = {
+    "help": (["--help"], 150),
+    "scrape": (["scrape"], 400),
+    "search": (["search", "--help"], 250),
+    "index": (["index", "--help"], 250),
+    "reap": (["reap", "--help"], 250),
+    "fixtures": (["fixtures", "--help"], 200),
+    "distributed": (["distributed", "--help"], 300),
+    "classify": (["classify", "--help"], 400),
+    "semantic": (["semantic", "--help"], 400),
+    "dedup": (["dedup", "--help"], 800),
+    "reports": (["reports", "--help"], 200),
+    "keyphrases": (["keyphrases", "--help"], 800),
+    "regions": (["regions", "--help"], 1000),
+    "clean": (["clean", "--help"], 1500),
+    "keywords": (["keywords"], 2000),
+}
+
+
+def time_command(args, repeat):
+    """Best wall-clock seconds of `python cli.py args` over repeat runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(SCRIPT_DIR, "cli.py"), *args],
+                       cwd=SCRIPT_DIR, stdin=subprocess.DEVNULL, capture_output=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def profile(args, top=15):
+    """Print the imports with the largest cumulative time."""
+    proc = subprocess.run([sys.executable, "-X", "importtime",
+                           os.path.join(SCRIPT_DIR, "cli.py"), *args],
+                          cwd=SCRIPT_DIR, stdin=subprocess.DEVNULL,
+                          capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split("|")
+        rows.append((int(cumulative_us), int(self_us.split(":")[1]), name.strip()))
+    print(f"{'Cumulative ms':>14}{'Self ms':>10}  Module")
+    for cumulative, self_time, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>14.1f}{self_time / 1000:>10.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cli.py cold-start times")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Commands to time")
+    parser.add_argument("--profile", metavar="COMMAND", choices=sorted(BUDGETS),
+                        help="Show the slowest imports of one command")
+    args = parser.parse_args()
+
+    if args.profile:
+        profile(BUDGETS[args.profile][0])
+        return 0
+
+    over = []
+    print(f"{'Command':<14}{'Best ms':>9}{'Budget ms':>11}  Status")
+    print("-" * 44)
+    for name, (cli_args, budget_ms) in BUDGETS.items():
+        if args.only and name not in args.only:
+            continue
+        seconds = time_command(cli_args, args.repeat)
+        ms = seconds * 1000
+        status = "ok" if ms <= budget_ms else "OVER"
+        if status == "OVER":
+            over.append(name)
+        print(f"{name:<14}{ms:>9.0f}{budget_ms:>11}  {status}")
+
+    if over:
+        print(f"\n{len(over)} over budget: {', '.join(over)} "
+              f"(python bench_startup.py --profile {over[0]})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# bench_text_cleaning.py — benchmark the description cleaning pipeline
+# Usage:  python bench_text_cleaning.py [--repeat N] [--scale N]
+# Runs on the five indeed_jobs_*.json datasets; --scale repeats the corpus to
+# approximate larger scrapes.
+
+import argparse
+import glob
+import os
+import re
+import time
+
+import pandas as pd
+from nltk.corpus import stopwords
+from nltk.stem.wordnet import WordNetLemmatizer
+from nltk.tokenize import sent_tokenize
+
+import text_cleaning
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASETS = sorted(glob.glob(os.path.join(DATA_DIR, "indeed_jobs_*.json")))
+
+
+def notebook_pipeline(descriptions: pd.Series) -> pd.DataFrame:
+    """The cell-by-cell logic of data_cleaning.ipynb (with its regex bug fixed)."""
+    def clean_text(raw):
+        raw = raw.replace("\r", "").replace("\n", " ")
+        raw = re.sub(r"[\[\]\(\)\{\}]", " ", raw)
+        raw = re.sub(r"\bnull\b", "", raw)
+        raw = re.sub(re.compile("<.*?>"), " ", raw)
+        raw = re.sub(r"\s+", " ", raw).strip()
+        raw = re.sub(" , ", ", ", raw)
+        return raw.replace(".,", ".")
+
+    def rm_stopwords(text):
+        stop_words = set(stopwords.words("english"))
+        return [word for word in text if word not in stop_words]
+
+    def lemming(text):
+        lemmatizer = WordNetLemmatizer()
+        return [lemmatizer.lemmatize(word) for word in text]
+
+    jd = descriptions.to_frame("description")
+    jd["description"] = jd["description"].apply(clean_text)
+    jd["lower_d"] = jd["description"].str.lower()
+    jd["word_tokenized"] = jd["lower_d"].apply(text_cleaning.TOKENIZER.tokenize)
+    jd["sentence_tokenized"] = jd["description"].apply(sent_tokenize)
+    jd["cleaned_stopword"] = jd["word_tokenized"].apply(rm_stopwords)
+    jd["cleaned_lemmed"] = jd["cleaned_stopword"].apply(lemming)
+    return jd
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        # Start every run with cold per-process caches
+        text_cleaning.lemma.cache_clear()
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark description cleaning")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale", type=int, default=1)
+    args = parser.parse_args()
+
+    text_cleaning.ensure_nltk_data()
+    df = text_cleaning.load_descriptions(DATASETS)
+    df = pd.concat([df] * args.scale, ignore_index=True)
+    print(f"{len(df)} descriptions from {len(DATASETS)} files "
+          f"({df['description'].str.len().sum() / 1e6:.1f} MB of text)\n")
+
+    legacy_time, legacy = best_of(lambda: notebook_pipeline(df["description"]), args.repeat)
+    print(f"{'notebook cells':<28}{legacy_time:>8.2f}s")
+
+    cpu = os.cpu_count() or 1
+    for workers in sorted({1, 2, cpu}):
+        elapsed, result = best_of(
+            lambda: text_cleaning.clean_descriptions(df, workers=workers), args.repeat)
+        assert result["cleaned_lemmed"].tolist() == legacy["cleaned_lemmed"].tolist()
+        print(f"{f'pipeline, {workers} worker(s)':<28}{elapsed:>8.2f}s"
+              f"{legacy_time / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# blocking.py — block/captcha page detection and a circuit breaker for the pool
+# wait_for_page() returns as soon as a page shows either the element the
+# caller needs or a challenge page, so a block costs a second rather than
+# WEBDRIVER_TIMEOUT. Every block is reported to BREAKER; after BLOCK_THRESHOLD
+# blocks in a row it opens and all workers pause before starting a driver.
+# The cooldown doubles each time the breaker re-opens (BLOCK_COOLDOWN up to
+# BLOCK_MAX_COOLDOWN); after it, one probe request decides whether to close.
+
+import threading
+import time
+
+import config
+import metrics
+
+# Lower-case fragments of the <title> of challenge pages
+BLOCK_TITLES = ["just a moment", "attention required", "access denied",
+                "security check", "hcaptcha", "captcha"]
+# Elements only present on challenge/captcha pages
+BLOCK_SELECTORS = ["#challenge-running", "#challenge-form", "#cf-challenge-running",
+                   "iframe[src*='captcha']", "iframe[title*='challenge']",
+                   "div.g-recaptcha", "div.h-captcha"]
+# Lower-case phrases looked for in the first part of the page text
+BLOCK_PHRASES = ["verify you are a human", "additional verification required",
+                 "unusual traffic", "are you a robot"]
+
+# One call: "ready" when the wanted element exists, "blocked: <marker>" on a
+# challenge page, null while neither has shown up yet
+PAGE_STATE_JS = """
+var ready = arguments[0], m = arguments[1];
+if (document.querySelector(ready)) return "ready";
+var title = (document.title || "").toLowerCase();
+for (var i = 0; i < m.titles.length; i++)
+    if (title.indexOf(m.titles[i]) >= 0) return "blocked: title '" + m.titles[i] + "'";
+for (var j = 0; j < m.selectors.length; j++)
+    if (document.querySelector(m.selectors[j])) return "blocked: " + m.selectors[j];
+var text = document.body ? document.body.innerText.slice(0, 3000).toLowerCase() : "";
+for (var k = 0; k < m.phrases.length; k++)
+    if (text.indexOf(m.phrases[k]) >= 0) return "blocked: '" + m.phrases[k] + "'";
+return null;
+"""
+
+MARKERS = {"titles": BLOCK_TITLES, "selectors": BLOCK_SELECTORS, "phrases": BLOCK_PHRASES}
+
+
+class BlockedError(RuntimeError):
+    """The site answered with a block or captcha page."""
+
+
+def wait_for_page(driver, ready_selector, timeout=None):
+    """
+    Wait until ready_selector is on the page or the page is a challenge
+
+    Args:
+        driver: WebDriver after driver.get()
+        ready_selector: CSS selector of the element the caller needs
+        timeout: Seconds (default config.WEBDRIVER_TIMEOUT)
+
+    Raises:
+        BlockedError: On a block/captcha page (also reported to BREAKER)
+        TimeoutException: If neither shows up in time
+    """
+    state = config.WebDriverWait(driver, timeout or config.WEBDRIVER_TIMEOUT).until(
+        lambda d: d.execute_script(PAGE_STATE_JS, ready_selector, MARKERS))
+    if state != "ready":
+        metrics.count("scrape_blocked_pages_total")
+        BREAKER.record_block(state)
+        raise BlockedError(state)
+
+
+class CircuitBreaker:
+    def __init__(self, threshold=config.BLOCK_THRESHOLD,
+                 cooldown=config.BLOCK_COOLDOWN,
+                 max_cooldown=config.BLOCK_MAX_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cond = threading.Condition()
+        self.state = "closed"
+        self.blocks = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    def wait(self):
+        """Block the calling worker while the breaker is open."""
+        with self.cond:
+            while True:
+                if self.state == "closed":
+                    return
+                now = time.time()
+                if self.state == "open" and now >= self.open_until:
+                    self.state = "half-open"
+                    self.probing = False
+                if self.state == "half-open" and not self.probing:
+                    # Let exactly one request test the water
+                    self.probing = True
+                    return
+                self.cond.wait(self.open_until - now if self.state == "open" else 1.0)
+
+    def record_block(self, reason=""):
+        with self.cond:
+            if self.state == "open":
+                # Requests already in flight when it opened
+                return
+            self.blocks += 1
+            if self.state == "half-open" or self.blocks >= self.threshold:
+                self._trip(reason)
+
+    def record_success(self):
+        with self.cond:
+            self.blocks = 0
+            if self.state != "closed":
+                self.state = "closed"
+                self.trips = 0
+                self.probing = False
+                self._log("closed", "probe request succeeded")
+                self.cond.notify_all()
+
+    def release(self):
+        """Give up a probe that ended without telling blocked from not blocked."""
+        with self.cond:
+            if self.state == "half-open":
+                self.probing = False
+                self.cond.notify_all()
+
+    def _trip(self, reason):
+        self.trips += 1
+        cooldown = min(self.cooldown * 2 ** (self.trips - 1), self.max_cooldown)
+        self.state = "open"
+        self.open_until = time.time() + cooldown
+        self.blocks = 0
+        self.probing = False
+        metrics.count("scrape_circuit_open_total")
+        self._log("open", f"{reason}; pausing {cooldown:.0f}s")
+        self.cond.notify_all()
+
+    def _log(self, state, reason):
+        metrics.REGISTRY.log({"ts": round(time.time(), 3), "metric": "scrape_circuit_state",
+                              "value": state, "reason": reason, "trips": self.trips})
+        with config.print_lock:
+            print(f"[circuit] {state}: {reason}")
+
+
+# Process-wide breaker shared by every scraping thread
+BREAKER = CircuitBreaker()
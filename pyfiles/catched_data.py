@@ -29,45 +29,68 @@
 #         "\nEnter an option by number to see job posts: "
 #     ))
 
-import json
-import pandas as pd
-
-
-def load_jobs(filename):
-    """Load job data from JSON file."""
-    try:
-        return pd.read_json(filename)
-    except Exception as e:
-        print(f"Error loading file {filename}: {e}")
-        return None
-
-
-def show_jobs(df):
-    """Display 5 job records at a time and allow navigation or full JD view."""
-    total = len(df)
-    index = 0
-
-    while index < total:
+from job_index import JobIndex
+from job_record import role_label
+
+PAGE_SIZE = 5
+
+
+def print_job(job, full=False):
+    """Print one posting; full=True shows the whole description."""
+    print(f"Company: {job['company'] or 'N/A'}")
+    print(f"Location: {job['location'] or 'N/A'}")
+    if job['salary']:
+        print(f"Salary: {job['salary']}")
+    if job['salary_annual'] is not None:
+        print(f"Annualized: ${job['salary_annual']:,.0f}")
+
+    if full:
+        print(f"URL: {job['url'] or 'N/A'}")
+        print("\nDescription:\n" + (job['description'] or 'N/A'))
+        return
+
+    # Preview of description
+    desc = (job['description'] or '').strip().replace('\n', ' ')
+    if len(desc) > 200:
+        desc = desc[:200] + "..."
+    print(f"Description: {desc}")
+    print(f"URL: {job['url'] or 'N/A'}")
+
+
+def ask_filters():
+    """Prompt for optional keyword, company and minimum salary filters."""
+    keyword = input("Keyword filter (Enter to skip): ").strip() or None
+    company = input("Company filter (Enter to skip): ").strip() or None
+    min_salary = None
+    salary_input = input("Minimum annual salary (Enter to skip): ").strip()
+    if salary_input:
+        try:
+            min_salary = float(salary_input.replace(",", "").replace("$", ""))
+        except ValueError:
+            print("Invalid salary, ignoring.")
+    return {"keyword": keyword, "company": company, "min_salary": min_salary}
+
+
+def show_jobs(index, role, filters=None):
+    """Display 5 job records at a time and allow navigation or full JD view.
+    Only the rows on screen are loaded from the index."""
+    filters = filters or {}
+    total = index.count(role, **filters)
+    if total == 0:
+        print("\nNo matching jobs.")
+        return
+    print(f"\n{total} matching jobs")
+    offset = 0
+
+    while offset < total:
         # Display 5 jobs
-        for i in range(index, min(index + 5, total)):
-            job = df.iloc[i]
-
-            print(f"\n[{i+1}] {job.get('title', 'N/A')}")
-            print(f"Company: {job.get('company', 'N/A')}")
-            print(f"Location: {job.get('location', 'N/A')}")
-
-            if 'salary' in job and pd.notna(job['salary']):
-                print(f"Salary: {job['salary']}")
-
-            # Preview of description
-            desc = str(job.get('description', '')).strip().replace('\n', ' ')
-            if len(desc) > 200:
-                desc = desc[:200] + "..."
-            print(f"Description: {desc}")
-            print(f"URL: {job.get('url', 'N/A')}")
+        page = index.page(role, offset, PAGE_SIZE, **filters)
+        for i, job in enumerate(page, offset + 1):
+            print(f"\n[{i}] {job['title'] or 'N/A'}")
+            print_job(job)
             print("-" * 80)
 
-        index += 5
+        offset += PAGE_SIZE
 
         # Navigation options
         while True:
@@ -87,28 +110,26 @@ def show_jobs(df):
             elif choice.isdigit():
                 job_num = int(choice)
                 if 1 <= job_num <= total:
-                    job = df.iloc[job_num - 1]
+                    row = index.page(role, job_num - 1, 1, **filters)[0]
+                    job = index.get(row['id'])
                     print("\n" + "="*80)
-                    print(f"FULL JOB DESCRIPTION: {job.get('title', 'N/A')}")
-                    print(f"Company: {job.get('company', 'N/A')}")
-                    print(f"Location: {job.get('location', 'N/A')}")
-                    if 'salary' in job and pd.notna(job['salary']):
-                        print(f"Salary: {job['salary']}")
-                    print(f"URL: {job.get('url', 'N/A')}")
-                    print("\nDescription:\n" + job.get('description', 'N/A'))
+                    print(f"FULL JOB DESCRIPTION: {job['title'] or 'N/A'}")
+                    print_job(job, full=True)
                     print("="*80)
                 else:
                     print("Invalid job number.")
             else:
                 print("Invalid input. Please try again.")
 
-        if index >= total:
+        if offset >= total:
             print("\nNo more records.")
             input("Press Enter to return to main menu...")
             return
 
 
 def main():
+    index = JobIndex()
+
     while True:
         print("\nAre you interested in any of the following occupations?")
         print("1. Software Engineer")
@@ -137,12 +158,21 @@ def main():
             print("Goodbye!")
             break
         elif option in file_map:
-            df = load_jobs(file_map[option])
-            if df is not None:
-                show_jobs(df)
+            filename = file_map[option]
+            role = role_label(filename)
+            try:
+                # Only re-imported when the file changed since last time
+                if index.sync_file(filename, role):
+                    print(f"✓ Indexed {filename}")
+            except Exception as e:
+                print(f"Error loading file {filename}: {e}")
+                continue
+            show_jobs(index, role, ask_filters())
         else:
             print("Please enter a valid option (1–6).")
 
+    index.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,74 @@
+# cli.py — single entry point for the scraper and data tools
+# Usage:  python cli.py <command> [args ...]
+#         python cli.py scrape                 interactive Indeed scrape
+#         python cli.py search "spark airflow" --role DS
+#         python cli.py semantic match resume.pdf --top 10
+#         python cli.py --help                 list every command
+# Each command runs its module as __main__ and imports nothing else, so a
+# command only pays for the libraries it uses (see bench_startup.py).
+
+import os
+import runpy
+import sys
+
+# command -> (module, leading arguments, help)
+COMMANDS = {
+    "scrape": ("scraper_main", [], "Interactive Indeed scrape (prompts for the search)"),
+    "keywords": ("keywords_main", [], "Compare a resume with O*NET keywords for a role"),
+    "search": ("job_index", ["search"], "Full-text search over indexed postings"),
+    "index": ("job_index", ["import"], "Import saved job files into the search index"),
+    "prune": ("job_index", ["prune"], "Drop indexed postings their job file no longer has"),
+    "semantic": ("semantic_search", [], "Embedding search: postings closest to a resume or free text"),
+    "dedup": ("dedup", [], "Report near-duplicate postings in saved job files"),
+    "classify": ("title_classifier", [], "Tag saved postings with O*NET codes from their titles"),
+    "keyphrases": ("keyphrases", [], "Extract keyphrases from job descriptions (cached KeyBERT)"),
+    "clean": ("text_cleaning", [], "Run the description cleaning pipeline on saved job files"),
+    "regions": ("run_all", [], "Scrape Levels.fyi regional pay into a CSV and charts"),
+    "reports": ("render_reports", [], "Render the compensation reports"),
+    "distributed": ("distributed", [], "Coordinator/worker scraping over a shared queue"),
+    "reap": ("driver_supervisor", [], "Kill Chrome processes left by crashed runs"),
+    "fixtures": ("fixture_server", [], "Serve saved postings as an offline Indeed"),
+}
+
+# Commands that prompt for their input and take no options
+INTERACTIVE = {"scrape", "keywords"}
+
+
+def usage():
+    width = max(len(name) for name in COMMANDS)
+    lines = ["usage: python cli.py <command> [args ...]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {help_text}" for name, (_, _, help_text) in COMMANDS.items()]
+    lines += ["", "Run `python cli.py <command> --help` for a command's options; "
+                  f"{' and '.join(sorted(INTERACTIVE))} take none and prompt instead."]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"Unknown command: {name}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    module, leading, help_text = COMMANDS[name]
+    if name in INTERACTIVE and rest:
+        # The module would ignore the arguments and go straight to its prompts
+        asked = rest[0] in ("-h", "--help")
+        print(f"usage: python cli.py {name}\n\n{help_text}; takes no options.",
+              file=sys.stdout if asked else sys.stderr)
+        return 0 if asked else 2
+    # The modules read their options from sys.argv. The working directory
+    # is left alone, so data files and path arguments resolve against it
+    # exactly as when the module is run directly; only imports are made to
+    # find the modules next to this file
+    sys.argv = [f"{os.path.basename(sys.argv[0])} {name}"] + leading + rest
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,40 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import time
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 from threading import Lock
-import csv
-import pandas as pd
-from datetime import datetime
 import json
+import os
+import tempfile
+import importlib
+
+# Heavy modules are imported on first use (config.pd, config.By, ...), so
+# `import config` stays cheap for commands that never drive a browser
+_LAZY_IMPORTS = {
+    "webdriver": ("selenium.webdriver", None),
+    "By": ("selenium.webdriver.common.by", "By"),
+    "WebDriverWait": ("selenium.webdriver.support.ui", "WebDriverWait"),
+    "EC": ("selenium.webdriver.support.expected_conditions", None),
+    "NoSuchElementException": ("selenium.common.exceptions", "NoSuchElementException"),
+    "TimeoutException": ("selenium.common.exceptions", "TimeoutException"),
+    "WebDriverException": ("selenium.common.exceptions", "WebDriverException"),
+    "ThreadPoolExecutor": ("concurrent.futures", "ThreadPoolExecutor"),
+    "as_completed": ("concurrent.futures", "as_completed"),
+    "csv": ("csv", None),
+    "pd": ("pandas", None),
+    "datetime": ("datetime", "datetime"),
+}
+
+
+def __getattr__(name):
+    """Resolve a name from _LAZY_IMPORTS on first access (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = importlib.import_module(module_name)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
 
 # Create safe print
 print_lock = Lock()
@@ -32,5 +56,98 @@ WEBDRIVER_TIMEOUT = 15
 DEFAULT_THREADS = 3
 MAX_THREADS = 15
 
+# Autoscaling of Phase 2: the thread count typed at the prompt is the
+# starting concurrency, which is then tuned between the bounds below
+AUTOSCALE = True
+AUTOSCALE_MIN_THREADS = 1
+AUTOSCALE_INTERVAL = 10            # seconds between adjustments
+AUTOSCALE_MIN_FREE_MEMORY = 0.15   # halve concurrency below this free-RAM share
+AUTOSCALE_MAX_CPU_PERCENT = 90
+AUTOSCALE_MAX_ERROR_RATE = 0.2     # failed or description-less jobs
+AUTOSCALE_LATENCY_TOLERANCE = 1.5  # step down when p50 exceeds best p50 by this
+
 # Indeed pagination (jobs per page)
 JOBS_PER_PAGE = 10
+
+# Block/captcha handling (blocking.py): blocks in a row before all workers
+# pause, first and longest pause in seconds, and how many extra rounds
+# failed jobs get once the pause is over
+BLOCK_THRESHOLD = 2
+BLOCK_COOLDOWN = 60
+BLOCK_MAX_COOLDOWN = 900
+BLOCK_MAX_RETRIES = 2
+
+# Result pages loaded at the same time during the listing phase
+LISTING_THREADS = 3
+
+# Site root used to build search URLs (the benchmarks point this at
+# fixture_server.py)
+INDEED_BASE_URL = "https://www.indeed.com"
+
+# Near-duplicate detection: saved job files whose postings should not be
+# fetched again (e.g. ["indeed_jobs_DS.json"])
+DEDUP_SEED_FILES = []
+
+# CSS selector table for job detail pages (editable without code changes)
+DETAIL_SELECTORS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     "detail_selectors.json")
+
+# Lean scraping profile: the scraper only reads text, so images, fonts,
+# stylesheets, media and trackers are not downloaded
+LEAN_CHROME_PROFILE = True
+CHROME_WINDOW_SIZE = "1280,900"
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*bat.bing.com*",
+]
+# Parent of the slot-<n> disk caches reused by successive drivers
+CHROME_CACHE_DIR = os.path.join(tempfile.gettempdir(), "dfp_chrome_cache")
+
+# Driver supervisor (driver_supervisor.py): per-driver RSS ceiling, memory
+# budget for all live drivers together, and how long a new driver may wait
+# for memory before it is refused
+DRIVER_MAX_RSS_MB = 1500
+DRIVER_MEMORY_BUDGET_MB = 8000
+DRIVER_MIN_FREE_MEMORY = 0.10      # refuse new drivers below this free-RAM share
+DRIVER_ADMIT_TIMEOUT = 120         # seconds
+DRIVER_CHECK_INTERVAL = 5          # seconds between watchdog passes
+DRIVER_STARTUP_GRACE = 60          # untracked drivers younger than this are not reaped
+
+# Scrape metrics: per-span JSON log, Prometheus textfile and optional
+# /metrics port (None disables the endpoint)
+METRICS_LOG = "scrape_metrics.jsonl"
+METRICS_PROM_FILE = "scrape_metrics.prom"
+METRICS_PORT = None
+
+# Embed every saved batch into the semantic search store (semantic_search.py).
+# Off by default: the first save of a run loads (and on first use downloads)
+# the sentence-transformers model. Enable with DFP_SEMANTIC_INDEX_ON_SAVE=1
+SEMANTIC_INDEX_ON_SAVE = False
+
+
+def _apply_env_overrides():
+    """
+    Let a DFP_<NAME> environment variable override any setting above,
+    e.g. DFP_JOB_LOAD_MAX=0 or DFP_INDEED_BASE_URL=http://127.0.0.1:8000.
+    Values are converted to the type of the default.
+    """
+    for name, default in list(globals().items()):
+        value = os.environ.get(f"DFP_{name}")
+        if not name.isupper() or value is None:
+            continue
+        if isinstance(default, bool):
+            value = value.lower() in ("1", "true", "yes", "on")
+        elif isinstance(default, (int, float)):
+            value = type(default)(value)
+        elif isinstance(default, list):
+            value = json.loads(value)
+        elif default is None and value.isdigit():
+            value = int(value)
+        globals()[name] = value
+
+
+_apply_env_overrides()
@@ -0,0 +1,212 @@
+# dedup.py — near-duplicate job posting detection with MinHash LSH
+# Usage:  python dedup.py indeed_jobs_DS.json [more.json ...]
+# Clusters reposts, sponsored copies and multi-location copies of the same
+# posting; the scraper uses DedupIndex online to skip known cards.
+
+import argparse
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Signature shape: BANDS * ROWS permutations. A pair with Jaccard
+# similarity s shares a bucket with probability 1 - (1 - s^ROWS)^BANDS:
+# with 32 bands of 4 rows that is >99.99% at 0.8 and ~99.98% at 0.7, so
+# LSH loses essentially no pairs above the threshold. About a quarter of
+# pairs at 0.3 also become candidates and are filtered by similarity().
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+SIMILARITY_THRESHOLD = 0.8
+
+WORD_RE = re.compile(r"\w+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+# Multiply-shift hash family: h -> ((a * h + b) mod 2^64) >> 32 with odd
+# 64-bit a. Fixed seed so signatures are comparable across runs
+_rng = np.random.RandomState(1)
+PERM_A = _rng.randint(0, 1 << 62, size=NUM_PERM, dtype=np.int64).astype(np.uint64) * np.uint64(4) + np.uint64(1)
+PERM_B = _rng.randint(0, 1 << 62, size=NUM_PERM, dtype=np.int64).astype(np.uint64) * np.uint64(4)
+
+
+def shingles(text: str) -> np.ndarray:
+    """32-bit hashes of the word k-grams in a description."""
+    words = WORD_RE.findall((text or "").lower())
+    if len(words) < SHINGLE_SIZE:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE])
+                 for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in set(grams)),
+                       dtype=np.uint64)
+
+
+def minhash(text: str) -> Optional[np.ndarray]:
+    """
+    MinHash signature of a description, one row per permutation
+
+    Returns:
+        uint64 array of length NUM_PERM, or None for empty text
+    """
+    hashes = shingles(text)
+    if hashes.size == 0:
+        return None
+    # uint64 arithmetic wraps, which is the mod 2^64 of the hash family
+    return ((PERM_A[:, None] * hashes[None, :] + PERM_B[:, None]) >> np.uint64(32)).min(axis=1)
+
+
+def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(sig_a == sig_b))
+
+
+def fingerprint(title: str, company: str, location: str) -> str:
+    """Normalized title/company/location key for a listing card."""
+    parts = [NON_ALNUM_RE.sub(" ", (p or "").lower()).strip()
+             for p in (title, company, location.split("\n")[0] if location else "")]
+    # Cards that failed to extract carry no identity
+    return "|".join(parts) if any(parts) else ""
+
+
+class MinHashLSH:
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.signatures: Dict[int, np.ndarray] = {}
+        self.buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(BANDS)]
+
+    def _bands(self, signature: np.ndarray):
+        for band in range(BANDS):
+            yield band, signature[band * ROWS:(band + 1) * ROWS].tobytes()
+
+    def query(self, signature: np.ndarray) -> List[int]:
+        """Keys whose estimated similarity to signature meets the threshold."""
+        candidates = set()
+        for band, key in self._bands(signature):
+            candidates.update(self.buckets[band].get(key, ()))
+        return [c for c in candidates
+                if similarity(signature, self.signatures[c]) >= self.threshold]
+
+    def insert(self, key: int, signature: np.ndarray):
+        self.signatures[key] = signature
+        for band, bucket_key in self._bands(signature):
+            self.buckets[band].setdefault(bucket_key, []).append(key)
+
+
+class DedupIndex:
+    """
+    Online duplicate tracker shared by the batch stage and the scraper.
+    Every posting gets a cluster id; near-duplicate descriptions share one,
+    and each card fingerprint seen in a cluster is remembered so later
+    cards can be skipped before their detail page is fetched.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.lsh = MinHashLSH(threshold)
+        self.parent: List[int] = []
+        self.fingerprints: Dict[str, int] = {}
+
+    def _find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def _union(self, a: int, b: int):
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    def is_known(self, title: str, company: str, location: str) -> bool:
+        """True if this card's fingerprint already belongs to a cluster."""
+        fp = fingerprint(title, company, location)
+        return bool(fp) and fp in self.fingerprints
+
+    def add(self, title: str, company: str, location: str, description: str) -> int:
+        """
+        Register a posting and return its cluster id
+
+        Args:
+            title, company, location: Listing card fields
+            description: Full job description (may be empty or "None")
+
+        Returns:
+            Cluster id (the index of the cluster's first posting)
+        """
+        key = len(self.parent)
+        self.parent.append(key)
+
+        fp = fingerprint(title, company, location)
+        if fp in self.fingerprints:
+            self._union(key, self.fingerprints[fp])
+        elif fp:
+            self.fingerprints[fp] = key
+
+        signature = minhash(description) if description and description != "None" else None
+        if signature is not None:
+            for other in self.lsh.query(signature):
+                self._union(key, other)
+            self.lsh.insert(key, signature)
+        return self._find(key)
+
+    def cluster_ids(self) -> List[int]:
+        """Current cluster id of every posting, in insertion order."""
+        return [self._find(i) for i in range(len(self.parent))]
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "DedupIndex":
+        """Build an index from a jobs DataFrame (title/company/location/description)."""
+        index = cls()
+        for title, company, location, description in zip(
+                df["title"], df["company"], df["location"], df["description"]):
+            index.add(title, company, location, description)
+        return index
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str]) -> "DedupIndex":
+        """Seed an index from previously saved indeed_jobs JSON files."""
+        frames = []
+        for path in paths:
+            try:
+                frames.append(pd.read_json(path))
+            except Exception as e:
+                print(f"Error loading file {path}: {e}")
+        if not frames:
+            return cls()
+        return cls.from_frame(pd.concat(frames, ignore_index=True))
+
+
+def add_cluster_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """Pipeline stage: attach a dup_cluster column to a jobs DataFrame."""
+    df["dup_cluster"] = DedupIndex.from_frame(df).cluster_ids()
+    return df
+
+
+def drop_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the first posting of every near-duplicate cluster."""
+    df = add_cluster_ids(df.reset_index(drop=True))
+    return df[~df["dup_cluster"].duplicated()].drop(columns="dup_cluster")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate job postings")
+    parser.add_argument("files", nargs="+", help="indeed_jobs_*.json files")
+    args = parser.parse_args()
+
+    df = pd.concat([pd.read_json(p) for p in args.files], ignore_index=True)
+    df = add_cluster_ids(df)
+    sizes = df.groupby("dup_cluster").size()
+    dupes = sizes[sizes > 1]
+    print(f"Postings: {len(df)}  Clusters: {len(sizes)}  "
+          f"Duplicates: {len(df) - len(sizes)}")
+    for cluster in dupes.sort_values(ascending=False).index[:10]:
+        rows = df[df["dup_cluster"] == cluster]
+        print(f"\n[{len(rows)}] {rows.iloc[0]['title']} at {rows.iloc[0]['company']}")
+        for loc in rows["location"]:
+            print(f"   - {loc.splitlines()[0] if loc else 'N/A'}")
+
+
+if __name__ == "__main__":
+    main()
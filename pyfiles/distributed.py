@@ -0,0 +1,198 @@
+# distributed.py — coordinator/worker mode for scraping across processes
+# Usage:  python distributed.py coordinator "Data Scientist" Arlington VA --pages 5
+#         python distributed.py worker [--processes 4] [--threads 3] [--until-empty]
+#         python distributed.py status | requeue-dead
+#         python distributed.py export DS [--out indeed_jobs_DS.json]
+# The coordinator enqueues search pages into work_queue.db; workers lease
+# them, enqueue every job card they find, lease those in turn and write the
+# finished records into jobs_index.db. Start workers on several hosts by
+# pointing --queue and --db at a volume they all mount (it must support
+# POSIX file locks, which SQLite relies on).
+
+import argparse
+import multiprocessing
+import os
+import socket
+import threading
+import time
+
+import config
+import listing
+import utils
+from job_index import INDEX_DB, JobIndex
+from job_record import JobRecord, job_key, role_label
+from work_queue import MAX_ATTEMPTS, QUEUE_DB, VISIBILITY_TIMEOUT, WorkQueue
+
+POLL_INTERVAL = 5
+
+
+def run_page_task(task, queue):
+    """
+    Load a search results page and enqueue a job task per card. Block pages
+    raise blocking.BlockedError (and pause every thread in this process
+    through the circuit breaker), so the queue retries the page later.
+    """
+    cards = listing.fetch_page(task.payload["url"], task.payload.get("page", 0)).cards
+
+    role = task.payload["role"]
+    added = 0
+    for title, company, location, url in cards:
+        added += queue.enqueue(
+            "job",
+            {"role": role, "title": title, "company": company,
+             "location": location, "url": url},
+            key=f"{role}:{job_key(url, title, company, location)}")
+    utils.safe_print(f"✓ {task.payload['url']}: {len(cards)} cards, {added} new jobs queued")
+
+
+def run_job_task(task, index):
+    """Fetch one job's detail page and store the record."""
+    job = task.payload
+    # Block pages, timeouts and browser errors raise; the queue retries them
+    details = utils.get_job_details(job["url"])
+    if details.description == "None":
+        # The description selector matched but held no text
+        raise RuntimeError("no job description on detail page")
+    record = JobRecord.create(job["title"], job["company"], job["location"],
+                              details.salary, job["url"], details.description,
+                              details.job_type, details.benefits, details.date_posted)
+    index.add_records([record], job["role"])
+    utils.safe_print(f"✓ {record.title} at {record.company}")
+
+
+def worker_loop(args, worker_id):
+    queue = WorkQueue(args.queue, args.visibility_timeout, args.max_attempts)
+    index = JobIndex(args.db)
+    try:
+        while True:
+            task = queue.lease(worker_id)
+            if task is None:
+                if args.until_empty and queue.pending() == 0:
+                    return
+                time.sleep(POLL_INTERVAL)
+                continue
+            try:
+                # Detail pages can outlast the visibility timeout under a
+                # circuit-breaker pause; keep the lease while working
+                with queue.keep_leased(task, worker_id):
+                    if task.kind == "page":
+                        run_page_task(task, queue)
+                    elif task.kind == "job":
+                        run_job_task(task, index)
+                    else:
+                        raise ValueError(f"unknown task kind {task.kind!r}")
+                queue.complete(task, worker_id)
+            except Exception as e:
+                state = queue.fail(task, worker_id, f"{type(e).__name__}: {e}")
+                utils.safe_print(
+                    f"Error in {task.kind} task {task.id} (attempt {task.attempts}): {e}"
+                    f"{' -> dead letter' if state == 'dead' else ''}")
+    finally:
+        index.close()
+        queue.close()
+
+
+def worker_process(args, process_num):
+    """One worker process running args.threads lease loops."""
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+    threads = [threading.Thread(target=worker_loop, args=(args, f"{prefix}:{i}"))
+               for i in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"Worker process {process_num} ({prefix}) finished")
+
+
+def coordinator(args):
+    role = role_label(args.role or args.job_title)
+    queue = WorkQueue(args.queue)
+    added = 0
+    for page in range(args.start_page - 1, args.start_page - 1 + args.pages):
+        url = utils.get_url(args.job_title, args.city, args.state, page)
+        # A new coordinator run re-scrapes pages finished by earlier runs;
+        # their jobs are still deduplicated by key
+        added += queue.enqueue("page", {"url": url, "role": role, "page": page},
+                               key=url, requeue=True)
+    print(f"✓ Queued {added} search pages for {role} ({args.pages} requested)")
+    queue.close()
+
+
+def status(args):
+    queue = WorkQueue(args.queue)
+    for kind, states in sorted(queue.counts().items()):
+        print(f"{kind:<6} " + "  ".join(f"{s}: {n}" for s, n in sorted(states.items())))
+    dead = queue.dead_letters()
+    if dead:
+        print(f"\nDead letters ({len(dead)}):")
+        for row in dead[:20]:
+            print(f"  [{row[0]}] {row[1]} {row[2]} after {row[3]} attempts: {row[4]}")
+    queue.close()
+
+
+def export(args):
+    role = role_label(args.role)
+    index = JobIndex(args.db)
+    rows = index.conn.execute(
+        "SELECT title, company, location, salary, url, description,"
+        " job_type, benefits, date_posted FROM jobs"
+        " WHERE role = ? ORDER BY id", (role,)).fetchall()
+    index.close()
+    # create() turns NULLs of rows indexed before the detail fields into ""
+    utils.save_to_json([JobRecord.create(*row) for row in rows],
+                       args.out or f"indeed_jobs_{role}.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed Indeed scraping")
+    parser.add_argument("--queue", default=QUEUE_DB, help="Work queue database")
+    parser.add_argument("--db", default=INDEX_DB, help="Shared job store")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    coord = sub.add_parser("coordinator", help="Enqueue search result pages")
+    coord.add_argument("job_title")
+    coord.add_argument("city")
+    coord.add_argument("state")
+    coord.add_argument("--pages", type=int, default=1)
+    coord.add_argument("--start-page", type=int, default=1)
+    coord.add_argument("--role", help="Role label in the store (default: job title)")
+
+    work = sub.add_parser("worker", help="Lease and run tasks")
+    work.add_argument("--processes", type=int, default=1)
+    work.add_argument("--threads", type=int, default=config.DEFAULT_THREADS,
+                      help="Concurrent Chrome drivers per process")
+    work.add_argument("--visibility-timeout", type=float, default=VISIBILITY_TIMEOUT)
+    work.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS)
+    work.add_argument("--until-empty", action="store_true",
+                      help="Exit once no task is ready or leased")
+
+    sub.add_parser("status", help="Show queue counts and dead letters")
+    sub.add_parser("requeue-dead", help="Retry every dead-lettered task")
+
+    exp = sub.add_parser("export", help="Write a role's stored records to JSON")
+    exp.add_argument("role")
+    exp.add_argument("--out")
+    args = parser.parse_args()
+
+    if args.command == "coordinator":
+        coordinator(args)
+    elif args.command == "worker":
+        args.threads = min(args.threads, config.MAX_THREADS)
+        procs = [multiprocessing.Process(target=worker_process, args=(args, n))
+                 for n in range(args.processes)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+    elif args.command == "status":
+        status(args)
+    elif args.command == "requeue-dead":
+        queue = WorkQueue(args.queue)
+        print(f"✓ Requeued {queue.requeue_dead()} dead-lettered tasks")
+        queue.close()
+    else:
+        export(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+# driver_supervisor.py — memory governor and zombie reaper for Chrome drivers
+# Usage:  python driver_supervisor.py [--all]   (reap leftovers of crashed runs)
+# utils.create_driver registers every driver here. A watchdog thread samples
+# the RSS of each driver's process tree (chromedriver plus every Chrome
+# process under it) and
+#   - recycles a driver whose tree grows past DRIVER_MAX_RSS_MB (kills it; the
+#     page in flight fails and the next job starts a fresh driver),
+#   - kills the tree of a driver whose owning thread died without quitting it,
+#   - reaps chromedriver/Chrome processes no tracked driver accounts for
+#     (only ones older than DRIVER_STARTUP_GRACE and started before any
+#     driver launch still in progress, so a Chrome another thread is
+#     starting is never mistaken for a leftover).
+# New drivers are refused while free memory is short or the tracked trees
+# would exceed DRIVER_MEMORY_BUDGET_MB, so a long unattended crawl stays
+# inside a fixed memory budget.
+
+import argparse
+import atexit
+import itertools
+import os
+import statistics
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+import psutil
+
+import config
+import metrics
+
+DRIVER_NAMES = ("chromedriver", "chrome", "chromium", "google-chrome", "chrome_crashpad")
+
+
+class MemoryPressureError(RuntimeError):
+    """Raised when a new driver cannot be admitted within DRIVER_ADMIT_TIMEOUT."""
+
+
+class TrackedDriver:
+    def __init__(self, driver, root_pid):
+        self.driver = driver
+        self.root_pid = root_pid
+        # Every pid seen under the driver; Chrome children outlive a killed
+        # chromedriver, so they are remembered rather than re-discovered
+        self.pids = {root_pid}
+        self.thread = threading.current_thread()
+        self.started = time.time()
+        self.rss = 0
+        self.peak_rss = 0
+
+
+def _is_driver_process(proc):
+    try:
+        name = proc.name().lower()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+    return any(name.startswith(n) for n in DRIVER_NAMES)
+
+
+def kill_tree(pids, timeout=3):
+    """Terminate the given processes (and their children), then kill stragglers."""
+    procs = {}
+    for pid in pids:
+        try:
+            proc = psutil.Process(pid)
+            procs[pid] = proc
+            for child in proc.children(recursive=True):
+                procs[child.pid] = child
+        except psutil.NoSuchProcess:
+            continue
+    for proc in procs.values():
+        try:
+            proc.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    _, alive = psutil.wait_procs(list(procs.values()), timeout=timeout)
+    for proc in alive:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+    return len(procs)
+
+
+class DriverSupervisor:
+    def __init__(self, max_rss_mb=config.DRIVER_MAX_RSS_MB,
+                 budget_mb=config.DRIVER_MEMORY_BUDGET_MB,
+                 min_free_memory=config.DRIVER_MIN_FREE_MEMORY,
+                 interval=config.DRIVER_CHECK_INTERVAL):
+        self.max_rss = max_rss_mb * 2**20 if max_rss_mb else None
+        self.budget = budget_mb * 2**20 if budget_mb else None
+        self.min_free_memory = min_free_memory
+        self.interval = interval
+        self.lock = threading.Condition()
+        self.tracked = {}
+        self.released = weakref.WeakSet()
+        # Peak tree RSS of finished drivers, to size the next admission
+        self.peaks = []
+        # Launch token -> start time of drivers being created right now
+        self.launches = {}
+        self._tokens = itertools.count()
+        self._watchdog = None
+        self._stop = threading.Event()
+
+    # --- Driver lifecycle ---------------------------------------------------
+
+    def admit(self, timeout=config.DRIVER_ADMIT_TIMEOUT):
+        """
+        Block until a new driver fits in memory
+
+        Raises:
+            MemoryPressureError: If memory is still short after timeout seconds
+        """
+        deadline = time.time() + timeout
+        waited = False
+        while True:
+            reason = self._pressure()
+            if reason is None:
+                return
+            if not waited:
+                metrics.count("scrape_driver_admission_waits_total")
+                self.reap_orphans()
+                waited = True
+                continue
+            if time.time() >= deadline:
+                metrics.count("scrape_driver_refused_total")
+                raise MemoryPressureError(f"new Chrome driver refused: {reason}")
+            with self.lock:
+                self.lock.wait(min(self.interval, max(deadline - time.time(), 0.1)))
+
+    @contextmanager
+    def launching(self):
+        """
+        Wrap webdriver.Chrome() and register(); processes started meanwhile
+        are not reaped before register() has claimed them.
+        """
+        with self.lock:
+            token = next(self._tokens)
+            self.launches[token] = time.time()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.launches.pop(token, None)
+
+    def register(self, driver):
+        """Start tracking driver's process tree; returns driver."""
+        service = getattr(driver, "service", None)
+        pid = getattr(getattr(service, "process", None), "pid", None)
+        if pid is None:
+            return driver
+        tracked = TrackedDriver(driver, pid)
+        self._sample(tracked)
+        with self.lock:
+            self.tracked[id(driver)] = tracked
+        self._start_watchdog()
+        return driver
+
+    def quit(self, driver):
+        """driver.quit(), then kill whatever part of its tree survived."""
+        with self.lock:
+            if driver in self.released:
+                return
+            self.released.add(driver)
+            tracked = self.tracked.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            # Expected after a recycle or a crashed Chrome; the kill below cleans up
+            metrics.count("scrape_driver_quit_errors_total", error=type(e).__name__)
+        if tracked is not None:
+            self._sample(tracked)
+            leftovers = [pid for pid in tracked.pids if psutil.pid_exists(pid)]
+            if leftovers:
+                kill_tree(leftovers)
+                metrics.count("scrape_driver_zombies_reaped_total", len(leftovers))
+            self._finished(tracked)
+
+    def _finished(self, tracked):
+        with self.lock:
+            if tracked.peak_rss:
+                self.peaks.append(tracked.peak_rss)
+                del self.peaks[:-50]
+            self.lock.notify_all()
+
+    # --- Memory accounting --------------------------------------------------
+
+    def _sample(self, tracked):
+        """Refresh tracked.pids/rss from the live process tree."""
+        try:
+            root = psutil.Process(tracked.root_pid)
+            tracked.pids.update(p.pid for p in root.children(recursive=True))
+        except psutil.NoSuchProcess:
+            pass
+        rss = 0
+        for pid in list(tracked.pids):
+            try:
+                rss += psutil.Process(pid).memory_info().rss
+            except psutil.NoSuchProcess:
+                tracked.pids.discard(pid)
+            except psutil.AccessDenied:
+                pass
+        tracked.rss = rss
+        tracked.peak_rss = max(tracked.peak_rss, rss)
+        return rss
+
+    def tracked_rss(self):
+        with self.lock:
+            return sum(t.rss for t in self.tracked.values())
+
+    def _pressure(self):
+        """Why a new driver should wait now, or None."""
+        memory = psutil.virtual_memory()
+        free = memory.available / memory.total
+        if free < self.min_free_memory:
+            return f"free memory {free:.0%} < {self.min_free_memory:.0%}"
+        if self.budget:
+            with self.lock:
+                expected = statistics.median(self.peaks) if self.peaks else 0
+                running = len(self.tracked)
+            used = self.tracked_rss()
+            if running and used + expected > self.budget:
+                return (f"{running} drivers use {used / 2**20:.0f} MB, budget "
+                        f"{self.budget / 2**20:.0f} MB")
+        return None
+
+    # --- Watchdog -----------------------------------------------------------
+
+    def _start_watchdog(self):
+        with self.lock:
+            if self._watchdog is None and self.interval:
+                self._watchdog = threading.Thread(target=self._watch, daemon=True,
+                                                  name="driver-supervisor")
+                self._watchdog.start()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self):
+        """One watchdog pass: recycle bloated drivers, kill abandoned ones."""
+        with self.lock:
+            tracked = list(self.tracked.values())
+        for t in tracked:
+            rss = self._sample(t)
+            if not t.thread.is_alive():
+                self._kill(t, "owner thread exited without quitting it")
+                metrics.count("scrape_driver_zombies_reaped_total", len(t.pids) or 1)
+            elif self.max_rss and rss > self.max_rss:
+                self._kill(t, f"RSS {rss / 2**20:.0f} MB > {self.max_rss / 2**20:.0f} MB")
+                metrics.count("scrape_driver_recycled_total")
+        metrics.REGISTRY.log({"ts": round(time.time(), 3), "metric": "scrape_driver_rss_mb",
+                              "value": round(self.tracked_rss() / 2**20, 1),
+                              "drivers": len(tracked)})
+
+    def _kill(self, tracked, reason):
+        with self.lock:
+            self.tracked.pop(id(tracked.driver), None)
+        kill_tree(list(tracked.pids))
+        self._finished(tracked)
+        with config.print_lock:
+            print(f"[supervisor] killed Chrome driver pid {tracked.root_pid}: {reason}")
+
+    def reap_orphans(self, include_foreign=False, startup_grace=config.DRIVER_STARTUP_GRACE):
+        """
+        Kill chromedriver/Chrome processes that no tracked driver owns
+
+        Reaps untracked driver processes started by this process, and orphans
+        (re-parented to init) of earlier runs whose command line carries
+        CHROME_CACHE_DIR. include_foreign also reaps any orphaned chromedriver.
+        Processes younger than startup_grace seconds, or started after a
+        launch still in progress began, are left alone: they may belong to a
+        driver another thread has not registered yet.
+
+        Returns:
+            int: Number of processes killed
+        """
+        with self.lock:
+            owned = set().union(*(t.pids for t in self.tracked.values())) if self.tracked else set()
+            cutoff = min([time.time() - startup_grace] + list(self.launches.values()))
+
+        def settled(proc):
+            try:
+                return proc.create_time() < cutoff
+            except psutil.NoSuchProcess:
+                return False
+
+        victims = []
+        try:
+            children = psutil.Process(os.getpid()).children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+        victims += [p for p in children
+                    if p.pid not in owned and _is_driver_process(p) and settled(p)]
+
+        for proc in psutil.process_iter(["pid", "ppid", "name", "cmdline"]):
+            info = proc.info
+            if (info["pid"] in owned or info["ppid"] != 1 or not _is_driver_process(proc)
+                    or not settled(proc)):
+                continue
+            cmdline = " ".join(info["cmdline"] or [])
+            if config.CHROME_CACHE_DIR in cmdline or (
+                    include_foreign and (info["name"] or "").lower().startswith("chromedriver")):
+                victims.append(proc)
+
+        if not victims:
+            return 0
+        killed = kill_tree([p.pid for p in victims])
+        metrics.count("scrape_driver_zombies_reaped_total", killed)
+        return killed
+
+    def shutdown(self):
+        """Quit every tracked driver and reap anything left over."""
+        self._stop.set()
+        with self.lock:
+            tracked = list(self.tracked.values())
+        for t in tracked:
+            self.quit(t.driver)
+        self.reap_orphans(startup_grace=0)
+
+
+# Process-wide supervisor used by utils.create_driver
+SUPERVISOR = DriverSupervisor()
+atexit.register(SUPERVISOR.shutdown)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reap Chrome processes left by crashed scraper runs")
+    parser.add_argument("--all", action="store_true",
+                        help="Also reap orphaned chromedriver processes of other programs")
+    args = parser.parse_args()
+    killed = SUPERVISOR.reap_orphans(include_foreign=args.all, startup_grace=0)
+    print(f"✓ Reaped {killed} orphaned Chrome processes")
+
+
+if __name__ == "__main__":
+    main()
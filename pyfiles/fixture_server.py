@@ -0,0 +1,262 @@
+# fixture_server.py — offline stand-in for indeed.com built from saved scrapes
+# Usage:  python fixture_server.py [--port 8000] [--latency-ms 150 --jitter-ms 100]
+#                                  [--block-rate 0.05] [--block-after N]
+# Replays the postings in indeed_jobs_*.json as Indeed-shaped pages:
+#   /jobs?q=..&l=..&start=N  listing page with job_seen_beacon cards and the
+#                            pagination-next link
+#   /rc/clk?jk=..            redirect to the detail page, like Indeed's links
+#   /viewjob?jk=..           detail page with jobDescriptionText and one of
+#                            the salary markups in detail_selectors.json,
+#                            plus job type, benefits and posting date
+#   /__stats                 request/block counters as JSON
+# Point the scraper at it with DFP_INDEED_BASE_URL=http://127.0.0.1:8000.
+
+import argparse
+import glob
+import hashlib
+import html
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+PAGE_SIZE = 10
+
+CARD_TEMPLATE = """<li class="css-1ac2h1w eu4oa1w0"><div class="cardOutline tapItem result job_{jk} css-1qd8s8n eu4oa1w0"><div class="slider_container css-8xisqv eu4oa1w0"><div class="slider_list css-1dvs5eq eu4oa1w0"><div class="slider_item css-17bghu4 eu4oa1w0"><div class="job_seen_beacon"><table class="mainContentTable css-131ju4w eu4oa1w0" role="presentation"><tbody><tr><td class="resultContent css-1o6lhys eu4oa1w0"><div class="css-pt3vth e37uo190"><h2 class="jobTitle css-1psdjh5 eu4oa1w0"><a id="job_{jk}" data-jk="{jk}" class="jcs-JobTitle css-1baag51 eu4oa1w0" href="/rc/clk?jk={jk}&amp;vjs=3"><span title="{title}" id="jobTitle-{jk}">{title}</span></a></h2></div><div class="company_location css-i375s1 e37uo190"><div class="css-1afmp4o e37uo190"><span data-testid="company-name" class="css-1h7lukg eu4oa1w0">{company}</span><div data-testid="text-location" class="css-1restlb eu4oa1w0">{location}</div></div></div>{salary}</td></tr></tbody></table></div></div></div></div></div></li>"""
+
+LISTING_TEMPLATE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{query} Jobs | Indeed</title></head>
+<body><div id="jobsearch-Main"><div id="mosaic-provider-jobcards" class="mosaic mosaic-provider-jobcards">
+<ul class="css-zu9cdh eu4oa1w0">
+{cards}
+</ul></div>
+<nav role="navigation" aria-label="pagination"><ul class="css-1g90gv6 eu4oa1w0">{next_link}</ul></nav>
+</div></body></html>"""
+
+DETAIL_TEMPLATE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title} - {company} - Indeed.com</title></head>
+<body><div class="jobsearch-JobComponent css-u4y1in eu4oa1w0">
+<h1 class="jobsearch-JobInfoHeader-title css-1b4cr5z e1tiznh50"><span>{title}</span></h1>
+<div data-company-name="true" class="css-1ioi40n e19afand0">{company}</div>
+<div data-testid="inlineHeader-companyLocation" class="css-17cdm7w eu4oa1w0"><div>{location}</div></div>
+{salary}
+{details}
+<div id="jobDescriptionText" class="jobsearch-jobDescriptionText jobsearch-JobComponent-description css-16y4thd eu4oa1w0">{description}</div>
+</div></body></html>"""
+
+# The three salary markups seen on detail pages, in detail_selectors.json order
+SALARY_VARIANTS = [
+    '<div class="jobsearch-JobMetadataHeader-item"><span class="css-1oc7tea eu4oa1w0">{salary}</span></div>',
+    '<div id="salaryInfoAndJobType" class="css-1xkrvql eu4oa1w0"><span class="css-1oc7tea eu4oa1w0">{salary}</span><span class="css-1u1g3ig eu4oa1w0"> -  Full-time</span></div>',
+    '<div id="salaryInfoAndJobType" class="css-1xkrvql eu4oa1w0"><div>{salary}</div><div>Full-time</div></div>',
+]
+
+JOB_TYPES = ["Full-time", "Full-time", "Contract", "Part-time"]
+BENEFITS = ["401(k)", "Dental insurance", "Health insurance", "Paid time off",
+            "Vision insurance", "Remote work"]
+
+BLOCK_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><title>Just a moment...</title></head>
+<body><div id="challenge-running"><h1>Additional Verification Required</h1>
+<p>Please verify you are a human to continue.</p></div></body></html>"""
+
+
+def load_postings(pattern=os.path.join(DATA_DIR, "indeed_jobs_*.json")):
+    """Saved postings with a stable jk per posting."""
+    postings = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            for job in json.load(f):
+                match = re.search(r"jk=([0-9a-f]+)", job.get("url") or "")
+                seed = f"{job.get('title')}|{job.get('company')}|{job.get('location')}|{len(postings)}"
+                jk = match.group(1) if match else hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
+                postings.append({**job, "jk": jk})
+    return postings
+
+
+def _lines(text, tag="div"):
+    return "".join(f"<{tag}>{html.escape(line.strip())}</{tag}>"
+                   for line in (text or "").split("\n") if line.strip())
+
+
+class FixtureSite:
+    """Page rendering, latency and blocking behaviour shared by all handlers."""
+
+    def __init__(self, postings, page_size=PAGE_SIZE, latency_ms=0, jitter_ms=0,
+                 block_rate=0.0, block_after=None, seed=0):
+        self.postings = postings
+        self.by_jk = {p["jk"]: p for p in postings}
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.block_rate = block_rate
+        self.block_after = block_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "listing": 0, "detail": 0, "blocked": 0, "not_found": 0}
+
+    def _count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+            return self.stats["requests"]
+
+    def delay(self):
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms)
+        if self.latency_ms or jitter:
+            time.sleep((self.latency_ms + jitter) / 1000)
+
+    def should_block(self, request_num):
+        if self.block_after is not None and request_num > self.block_after:
+            return True
+        with self.lock:
+            return self.random.random() < self.block_rate
+
+    def listing(self, query):
+        start = int(query.get("start", ["0"])[0] or 0)
+        page = self.postings[start:start + self.page_size]
+        cards = []
+        for p in page:
+            salary = ""
+            if p.get("salary"):
+                salary = ('<div class="metadata salary-snippet-container css-1f4kgma eu4oa1w0">'
+                          f'<div data-testid="attribute_snippet_testid">{html.escape(p["salary"])}</div></div>')
+            location = p.get("location") or ""
+            first, _, rest = location.partition("\n")
+            cards.append(CARD_TEMPLATE.format(
+                jk=p["jk"], title=html.escape(p.get("title") or ""),
+                company=html.escape(p.get("company") or ""),
+                location=f"<span>{html.escape(first.strip())}</span>{_lines(rest)}",
+                salary=salary))
+
+        next_link = ""
+        if start + self.page_size < len(self.postings):
+            params = {k: v[0] for k, v in query.items()}
+            params["start"] = start + self.page_size
+            next_link = ('<li class="css-227srf eu4oa1w0"><a data-testid="pagination-page-next" '
+                         f'aria-label="Next Page" href="/jobs?{html.escape(urlencode(params))}">Next</a></li>')
+        return LISTING_TEMPLATE.format(query=html.escape(query.get("q", [""])[0]),
+                                       cards="\n".join(cards), next_link=next_link)
+
+    def detail(self, jk):
+        p = self.by_jk.get(jk)
+        if p is None:
+            return None
+        digest = int(hashlib.md5(jk.encode()).hexdigest(), 16)
+        salary = ""
+        variant = digest % len(SALARY_VARIANTS)
+        if p.get("salary"):
+            salary = SALARY_VARIANTS[variant].format(salary=html.escape(p["salary"]))
+        # The second and third salary markups already carry "Full-time"
+        details = []
+        if not p.get("salary") or variant == 0:
+            job_type = JOB_TYPES[digest % len(JOB_TYPES)]
+            details.append(f'<div aria-label="Job type"><ul><li>{job_type}</li></ul></div>')
+        benefits = [b for i, b in enumerate(BENEFITS) if digest >> (8 + i) & 1]
+        if benefits:
+            details.append('<div id="benefits"><ul>'
+                           + "".join(f"<li>{b}</li>" for b in benefits) + "</ul></div>")
+        details.append(f'<span data-testid="myJobsStateDate">Posted {digest % 30 + 1} days ago</span>')
+        description = p.get("description") or ""
+        return DETAIL_TEMPLATE.format(
+            title=html.escape(p.get("title") or ""), company=html.escape(p.get("company") or ""),
+            location=html.escape((p.get("location") or "").split("\n")[0]), salary=salary,
+            details='<div id="jobDetailsSection">' + "".join(details) + "</div>",
+            description="" if description == "None" else _lines(description, "p"))
+
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def send_page(self, status, body, content_type="text/html; charset=utf-8"):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/__stats":
+                with site.lock:
+                    stats = dict(site.stats)
+                return self.send_page(200, json.dumps(stats), "application/json")
+
+            request_num = site._count("requests")
+            site.delay()
+            if site.should_block(request_num):
+                site._count("blocked")
+                return self.send_page(403, BLOCK_PAGE)
+
+            jk = query.get("jk", [""])[0]
+            if url.path == "/jobs":
+                site._count("listing")
+                return self.send_page(200, site.listing(query))
+            if url.path == "/rc/clk":
+                self.send_response(302)
+                self.send_header("Location", f"/viewjob?jk={jk}")
+                self.send_header("Content-Length", "0")
+                return self.end_headers()
+            if url.path == "/viewjob":
+                page = site.detail(jk)
+                if page is not None:
+                    site._count("detail")
+                    return self.send_page(200, page)
+            site._count("not_found")
+            self.send_page(404, "<html><body><h1>Not found</h1></body></html>")
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_server(host="127.0.0.1", port=0, **site_options):
+    """
+    Serve the fixture site from a daemon thread
+
+    Args:
+        host, port: Bind address (port 0 picks a free port)
+        site_options: FixtureSite options (latency_ms, block_rate, ...)
+
+    Returns:
+        Tuple: (server, site, base_url)
+    """
+    site = FixtureSite(load_postings(), **site_options)
+    server = ThreadingHTTPServer((host, port), make_handler(site))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, site, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve saved postings as an Indeed-like site")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--block-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with a block page")
+    parser.add_argument("--block-after", type=int, default=None,
+                        help="Block every request after this many")
+    args = parser.parse_args()
+
+    site = FixtureSite(load_postings(), args.page_size, args.latency_ms, args.jitter_ms,
+                       args.block_rate, args.block_after)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(site))
+    print(f"Serving {len(site.postings)} postings at http://{args.host}:{args.port}/jobs?q=data")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
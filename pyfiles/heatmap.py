@@ -1,5 +1,58 @@
+import hashlib
+import os
+
 import pandas as pd
-import plotly.express as px
+
+from location import extract_state_codes
+
+# Columns the choropleth reads (hover data + color candidates)
+PLOT_COLUMNS = [
+    "region_id", "region_name", "detailed_location", "rank",
+    "p10", "p25", "p50", "p75", "p90", "normalizedMedian", "url",
+]
+
+# Typed loading: repeated text columns as categories, numbers as floats
+COLUMN_DTYPES = {
+    "region_id": "string",
+    "region_name": "category",
+    "detailed_location": "category",
+    "state_code": "category",
+    "url": "string",
+    "rank": "float64",
+    "p10": "float64",
+    "p25": "float64",
+    "p50": "float64",
+    "p75": "float64",
+    "p90": "float64",
+    "normalizedMedian": "float64",
+}
+
+STATE_AGGREGATIONS = {
+    "region_id": "first",
+    "region_name": "first",
+    "detailed_location": "first",
+    "rank": "min",
+    "p10": "mean",
+    "p25": "mean",
+    "p50": "mean",
+    "p75": "mean",
+    "p90": "mean",
+    "normalizedMedian": "mean",
+    "url": "first"
+}
+
+# csv path -> {"mtime", "digest", "df", "state_df"}
+_AGGREGATE_CACHE = {}
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-1 of a file's contents, read in chunks."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
 class CompensationHeatmap:
     def __init__(self, csv_path: str):
@@ -8,32 +61,54 @@ class CompensationHeatmap:
         self.state_df = None
 
     def load_data(self):
-        """Load and preprocess CSV"""
-        self.df = pd.read_csv(self.csv_path)
-
-        # Extract state codes from detailed_location (e.g., "New York, NY" -> "NY")
-        self.df["state_code"] = self.df["detailed_location"].str.extract(r",\s*([A-Z]{2})")
-
-        # Aggregate by state
-        self.state_df = self.df.groupby("state_code", as_index=False).agg({
-            "region_id": "first",
-            "region_name": "first",
-            "detailed_location": "first",
-            "rank": "min",
-            "p10": "mean",
-            "p25": "mean",
-            "p50": "mean",
-            "p75": "mean",
-            "p90": "mean",
-            "normalizedMedian": "mean",
-            "url": "first"
-        })
-
-    def plot(self, color_col="normalizedMedian", color_scale="Viridis"):
-        """Generate and show choropleth map"""
+        """
+        Load and preprocess CSV. The state aggregate is memoized per file,
+        keyed by mtime and content hash, so repeated instances reuse it.
+        """
+        path = os.path.abspath(self.csv_path)
+        mtime = os.stat(path).st_mtime_ns
+        entry = _AGGREGATE_CACHE.get(path)
+
+        if entry is None or entry["mtime"] != mtime:
+            digest = file_digest(path)
+            if entry is None or entry["digest"] != digest:
+                df = self._read_csv(path)
+                entry = {"digest": digest, "df": df,
+                         "state_df": self._aggregate(df)}
+            entry["mtime"] = mtime
+            _AGGREGATE_CACHE[path] = entry
+
+        self.df = entry["df"]
+        self.state_df = entry["state_df"]
+
+    @staticmethod
+    def _read_csv(path: str) -> pd.DataFrame:
+        """Read only the plotted columns (plus a stored state_code)."""
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = [c for c in PLOT_COLUMNS + ["state_code"] if c in header]
+        dtypes = {c: t for c, t in COLUMN_DTYPES.items() if c in usecols}
+        df = pd.read_csv(path, usecols=usecols, dtype=dtypes)
+
+        # Older CSVs have no precomputed state_code column
+        if "state_code" not in df.columns:
+            df["state_code"] = extract_state_codes(df["detailed_location"])
+        return df
+
+    @staticmethod
+    def _aggregate(df: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate by state"""
+        aggregations = {c: f for c, f in STATE_AGGREGATIONS.items() if c in df.columns}
+        return df.groupby("state_code", as_index=False, observed=True).agg(aggregations)
+
+    def build_figure(self, color_col="normalizedMedian", color_scale="Viridis",
+                     title="Software Engineer Compensation Heatmap by State"):
+        """Build the choropleth figure without displaying it"""
         if self.state_df is None:
             raise ValueError("Data not loaded. Call load_data() first.")
 
+        # Imported here so data-only callers do not pay for plotly
+        import plotly.express as px
+
         fig = px.choropleth(
             self.state_df,
             locations="state_code",           
@@ -57,11 +132,30 @@ class CompensationHeatmap:
         )
 
         fig.update_layout(
-            title="Software Engineer Compensation Heatmap by State",
+            title=title,
             geo_scope="usa"
         )
+        return fig
+
+    def plot(self, color_col="normalizedMedian", color_scale="Viridis", show=True):
+        """Generate and (optionally) show choropleth map"""
+        fig = self.build_figure(color_col, color_scale)
+        if show:
+            fig.show()
+        return fig
 
-        fig.show()
+    @staticmethod
+    def save(fig, path: str, include_plotlyjs=True):
+        """
+        Write a figure headlessly; the format follows the file extension.
+        PNG/SVG export needs the kaleido package, HTML does not. HTML embeds
+        plotly.js by default so reports open offline; pass "cdn" for small
+        files that load it from the network.
+        """
+        if path.endswith(".html"):
+            fig.write_html(path, include_plotlyjs=include_plotlyjs)
+        else:
+            fig.write_image(path)
 
 
 # Example usage
@@ -0,0 +1,387 @@
+# job_index.py — SQLite FTS5 index over scraped job postings
+# Usage:  python job_index.py import indeed_jobs_DS.json [...]
+#         python job_index.py search "spark airflow" [--role DS] [--location VA]
+#                                    [--min-salary 120000]
+#         python job_index.py prune indeed_jobs_DS.json [...]
+# utils.save_data adds every saved batch, so the index grows incrementally.
+# Imports never delete: postings dropped from a file are only removed by
+# prune, and only if that file is what indexed them.
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+from typing import List, Optional
+
+from job_record import JobRecord, job_key, role_label
+from location import parse_location
+from salary import parse_salary
+
+INDEX_DB = "jobs_index.db"
+
+# Rows inserted per executemany call while importing a role file
+IMPORT_BATCH = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    role TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    city TEXT,
+    state TEXT,
+    salary TEXT,
+    salary_annual REAL,
+    url TEXT,
+    description TEXT,
+    job_type TEXT,
+    benefits TEXT,
+    date_posted TEXT,
+    source TEXT,
+    UNIQUE (role, job_key)
+);
+CREATE INDEX IF NOT EXISTS jobs_role ON jobs (role);
+CREATE INDEX IF NOT EXISTS jobs_role_salary ON jobs (role, salary_annual);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description,
+    content='jobs', content_rowid='id'
+);
+
+-- Keep the full-text index in step with the jobs table
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+    INSERT INTO jobs_fts (rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    role TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+# Columns added after the first release: name -> type. Older index files
+# get them on open.
+ADDED_COLUMNS = {
+    "source": "TEXT",
+    "job_type": "TEXT",
+    "benefits": "TEXT",
+    "date_posted": "TEXT",
+}
+
+# Relative weights of title, company and description hits in BM25 ranking
+BM25_WEIGHTS = (5.0, 2.0, 1.0)
+
+UPSERT_SQL = (
+    "INSERT INTO jobs (role, job_key, title, company, location, city, state,"
+    " salary, salary_annual, url, description, job_type, benefits, date_posted, source)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT (role, job_key) DO UPDATE SET"
+    " title = excluded.title, company = excluded.company,"
+    " location = excluded.location, city = excluded.city, state = excluded.state,"
+    " salary = excluded.salary, salary_annual = excluded.salary_annual,"
+    " url = excluded.url, description = excluded.description,"
+    " job_type = excluded.job_type, benefits = excluded.benefits,"
+    " date_posted = excluded.date_posted,"
+    # A file import claims rows first stored by the scraper (source NULL)
+    " source = coalesce(jobs.source, excluded.source)"
+    # Unchanged rows are left alone so their FTS entries are not rewritten
+    " WHERE jobs.description IS NOT excluded.description"
+    " OR jobs.title IS NOT excluded.title OR jobs.salary IS NOT excluded.salary"
+    " OR jobs.company IS NOT excluded.company OR jobs.url IS NOT excluded.url"
+    " OR jobs.location IS NOT excluded.location"
+    " OR jobs.job_type IS NOT excluded.job_type OR jobs.benefits IS NOT excluded.benefits"
+    " OR jobs.date_posted IS NOT excluded.date_posted"
+    " OR (jobs.source IS NULL AND excluded.source IS NOT NULL)"
+)
+
+# Columns shown in list views (description is cut to a preview)
+LIST_COLUMNS = ("id, title, company, location, salary, salary_annual, url,"
+                " substr(description, 1, 400) AS description")
+
+
+def fts_query(text: str) -> str:
+    """Quote each word so user input cannot break FTS5 query syntax."""
+    return " ".join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+
+class JobIndex:
+    def __init__(self, db_path: str = INDEX_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets readers page through results while an import is running
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        for name, kind in ADDED_COLUMNS.items():
+            if existing and name not in existing:
+                self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {kind}")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def _row(self, role: str, job, source: Optional[str] = None) -> tuple:
+        if not isinstance(job, dict):
+            job = dict(zip(JobRecord._fields, job))
+        title = job.get("title") or ""
+        company = job.get("company") or ""
+        location = job.get("location") or ""
+        salary = job.get("salary") or ""
+        url = job.get("url") or ""
+        loc = parse_location(location)
+        return (role, job_key(url, title, company, location), title, company,
+                location, loc.city, loc.state, salary, parse_salary(salary).annual,
+                url, job.get("description") or "", job.get("job_type") or "",
+                job.get("benefits") or "", job.get("date_posted") or "", source)
+
+    def add_records(self, records, role: str, source: Optional[str] = None) -> int:
+        """
+        Incrementally add or update postings. Existing postings (same role
+        and job key) are only rewritten when their content changed.
+
+        Args:
+            records: Job dicts or scraper record tuples
+            role: Role label or job title (normalized with role_label)
+            source: Role file the records come from; None for live inserts
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        role = role_label(role)
+        changed = 0
+        records = list(records)
+        with self.conn:
+            for i in range(0, len(records), IMPORT_BATCH):
+                changed += self.conn.executemany(
+                    UPSERT_SQL, [self._row(role, r, source)
+                                 for r in records[i:i + IMPORT_BATCH]]).rowcount
+        return changed
+
+    def sync_file(self, path: str, role: str) -> bool:
+        """
+        Upsert a role JSON file's postings if it changed since the last
+        sync. Nothing is deleted, so postings the scraper added since the
+        file was written stay; see prune.
+
+        Args:
+            path: indeed_jobs_*.json file
+            role: Role label or job title the rows are stored under
+
+        Returns:
+            True if the file was (re)synced
+        """
+        # One spelling per file, shared with jobs.source and prune
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        known = self.conn.execute(
+            "SELECT mtime_ns, size FROM sources WHERE path = ?", (path,)).fetchone()
+        if known and (known["mtime_ns"], known["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return False
+
+        with open(path, encoding="utf-8") as f:
+            jobs = json.load(f)
+
+        self.add_records(jobs, role, source=path)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                (path, role_label(role), stat.st_mtime_ns, stat.st_size))
+        return True
+
+    def prune(self, path: str, role: str) -> int:
+        """
+        Remove postings this file indexed earlier but no longer contains.
+        Rows inserted by the scraper or by other files are never touched.
+
+        Args:
+            path: indeed_jobs_*.json file
+            role: Role label or job title the rows are stored under
+
+        Returns:
+            Number of rows deleted
+        """
+        role = role_label(role)
+        with open(path, encoding="utf-8") as f:
+            keys = {self._row(role, job)[1] for job in json.load(f)}
+        with self.conn:
+            stale = [(row_id,) for row_id, key in self.conn.execute(
+                "SELECT id, job_key FROM jobs WHERE role = ? AND source = ?",
+                (role, os.path.abspath(path))) if key not in keys]
+            self.conn.executemany("DELETE FROM jobs WHERE id = ?", stale)
+        return len(stale)
+
+    @staticmethod
+    def _where(role: str, keyword: Optional[str], company: Optional[str],
+               min_salary: Optional[float]):
+        clauses = ["jobs.role = ?"]
+        params: List = [role_label(role)]
+        if keyword:
+            clauses.append("jobs.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(fts_query(keyword))
+        if company:
+            clauses.append("jobs.company LIKE ?")
+            params.append(f"%{company}%")
+        if min_salary is not None:
+            clauses.append("jobs.salary_annual >= ?")
+            params.append(min_salary)
+        return " AND ".join(clauses), params
+
+    def count(self, role: str, keyword: str = None, company: str = None,
+              min_salary: float = None) -> int:
+        """Number of postings matching the filters."""
+        where, params = self._where(role, keyword, company, min_salary)
+        return self.conn.execute(
+            f"SELECT COUNT(*) FROM jobs WHERE {where}", params).fetchone()[0]
+
+    def page(self, role: str, offset: int, limit: int, keyword: str = None,
+             company: str = None, min_salary: float = None) -> List[sqlite3.Row]:
+        """
+        Load one page of postings (description cut to a preview)
+
+        Args:
+            role: Role label
+            offset: Rows to skip
+            limit: Page size
+            keyword, company, min_salary: Optional filters
+
+        Returns:
+            List of rows in file order
+        """
+        where, params = self._where(role, keyword, company, min_salary)
+        return self.conn.execute(
+            f"SELECT {LIST_COLUMNS} FROM jobs WHERE {where} ORDER BY jobs.id LIMIT ? OFFSET ?",
+            params + [limit, offset]).fetchall()
+
+    def get(self, job_id: int) -> Optional[sqlite3.Row]:
+        """Full record, including the whole description."""
+        return self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def search(self, query: str, role: str = None, location: str = None,
+               min_salary: float = None, max_salary: float = None,
+               limit: int = 20) -> List[sqlite3.Row]:
+        """
+        Ranked full-text search (BM25, title hits weigh most)
+
+        Args:
+            query: Words to search for (all must match)
+            role: Optional role label filter
+            location: Optional filter; a two-letter code matches the state,
+                anything else matches the city or raw location text
+            min_salary, max_salary: Optional annualized salary bounds
+            limit: Maximum number of results
+
+        Returns:
+            Rows with id, title, company, location, salary, url, score and
+            a highlighted snippet, best match first
+        """
+        clauses = ["jobs_fts MATCH ?"]
+        params: List = [fts_query(query)]
+        if role:
+            clauses.append("jobs.role = ?")
+            params.append(role_label(role))
+        if location:
+            if len(location.strip()) == 2:
+                clauses.append("jobs.state = ?")
+                params.append(location.strip().upper())
+            else:
+                clauses.append("(jobs.city LIKE ? OR jobs.location LIKE ?)")
+                params += [f"%{location.strip()}%"] * 2
+        if min_salary is not None:
+            clauses.append("jobs.salary_annual >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            clauses.append("jobs.salary_annual <= ?")
+            params.append(max_salary)
+
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        return self.conn.execute(
+            "SELECT jobs.id, jobs.role, jobs.title, jobs.company, jobs.location,"
+            " jobs.salary, jobs.salary_annual, jobs.url,"
+            f" bm25(jobs_fts, {weights}) AS score,"
+            " snippet(jobs_fts, 2, '[', ']', ' … ', 12) AS snippet"
+            " FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid"
+            f" WHERE {' AND '.join(clauses)}"
+            " ORDER BY score LIMIT ?",
+            params + [limit]).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def index_records(records, role: str, db_path: str = INDEX_DB) -> int:
+    """Add freshly scraped records to the on-disk index."""
+    index = JobIndex(db_path)
+    try:
+        return index.add_records(records, role)
+    finally:
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text index over scraped jobs")
+    parser.add_argument("--db", default=INDEX_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="Sync role JSON files into the index")
+    imp.add_argument("files", nargs="+")
+    imp.add_argument("--role", default=None, help="Role label (default: from file name)")
+
+    prune = sub.add_parser("prune", help="Remove postings a file indexed but no longer has")
+    prune.add_argument("files", nargs="+")
+    prune.add_argument("--role", default=None, help="Role label (default: from file name)")
+
+    find = sub.add_parser("search", help="Ranked search")
+    find.add_argument("query")
+    find.add_argument("--role")
+    find.add_argument("--location")
+    find.add_argument("--min-salary", type=float)
+    find.add_argument("--max-salary", type=float)
+    find.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    index = JobIndex(args.db)
+    try:
+        if args.command == "import":
+            for path in args.files:
+                role = role_label(args.role or path)
+                synced = index.sync_file(path, role)
+                print(f"{'✓ Synced' if synced else '- Unchanged'} {path} ({role})")
+        elif args.command == "prune":
+            for path in args.files:
+                role = role_label(args.role or path)
+                print(f"✓ {path} ({role}): {index.prune(path, role)} postings removed")
+        else:
+            start = time.perf_counter()
+            rows = index.search(args.query, args.role, args.location,
+                                args.min_salary, args.max_salary, args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+            for i, row in enumerate(rows, 1):
+                salary = f" | {row['salary']}" if row["salary"] else ""
+                print(f"\n[{i}] {row['title']} at {row['company']} ({row['role']})")
+                print(f"    {row['location'].splitlines()[0] if row['location'] else 'N/A'}{salary}")
+                print(f"    {row['snippet']}")
+            print(f"\n{len(rows)} results in {elapsed:.1f} ms")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import hashlib
+import os
+import sys
+from typing import Iterable, List, NamedTuple
+from urllib.parse import parse_qs, urlparse
+
+# Column headers used by the CSV/Excel exports and the quality report
+EXPORT_HEADERS = ["Title", "Company", "Location", "Salary", "URL", "Description",
+                  "Job Type", "Benefits", "Date Posted"]
+
+
+# Role labels used by the saved role files (indeed_jobs_<LABEL>.json)
+ROLE_LABELS = {
+    "software engineer": "SE",
+    "data engineer": "DE",
+    "data scientist": "DS",
+    "data analyst": "DA",
+    "machine learning engineer": "MLE",
+}
+
+
+def role_label(name: str) -> str:
+    """
+    One role label for a job title, a label or a saved file name, so the
+    scraper's live inserts and file imports land under the same role.
+
+    "Data Scientist", "data_scientist", "DS" and "indeed_jobs_DS.json" all
+    give "DS"; other titles become lower-case words joined by "_".
+    """
+    name = os.path.splitext(os.path.basename(name.strip()))[0]
+    for prefix in ("indeed_jobs_", "indeed_job_"):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+    words = " ".join(name.replace("_", " ").split())
+    if words.upper() in ROLE_LABELS.values():
+        return words.upper()
+    return ROLE_LABELS.get(words.lower(), words.lower().replace(" ", "_"))
+
+
+def job_key(url: str, title: str = "", company: str = "", location: str = "") -> str:
+    """
+    Canonical job id: Indeed's jk parameter when the URL has one,
+    otherwise a hash of the URL (or of the card fields if there is no URL).
+    """
+    if url:
+        jk = parse_qs(urlparse(url).query).get("jk")
+        if jk:
+            return jk[0]
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return hashlib.sha1(f"{title}|{company}|{location}".encode("utf-8")).hexdigest()
+
+
+class JobRecord(NamedTuple):
+    """
+    One scraped job. Still a tuple, so positional code, csv.writer and
+    DataFrame constructors accept it as-is, but without a per-instance dict.
+    """
+    title: str
+    company: str
+    location: str
+    salary: str
+    url: str
+    description: str
+    # Read from the detail page; empty in records saved before they existed
+    job_type: str = ""
+    benefits: str = ""
+    date_posted: str = ""
+
+    @classmethod
+    def create(cls, title, company, location, salary, url, description,
+               job_type="", benefits="", date_posted="") -> "JobRecord":
+        """Build a record, interning the fields that repeat across postings."""
+        return cls(title or "", sys.intern(company or ""), sys.intern(location or ""),
+                   sys.intern(salary or ""), url or "", description or "None",
+                   sys.intern(job_type or ""), benefits or "", sys.intern(date_posted or ""))
+
+    @property
+    def job_id(self) -> str:
+        return job_key(self.url, self.title, self.company, self.location)
+
+
+def as_records(records: Iterable) -> List[JobRecord]:
+    """Accept JobRecords or legacy 6-tuples; existing JobRecords are not copied."""
+    return [r if isinstance(r, JobRecord) else JobRecord(*r) for r in records]
+
+
+def to_arrow(records: Iterable):
+    """
+    Column-oriented Arrow batch of the records (requires pyarrow).
+    Company, location, salary, job type and date are dictionary-encoded, so
+    each distinct string is stored once; pandas/Parquet conversions reuse
+    these buffers.
+    """
+    import pyarrow as pa
+
+    records = as_records(records)
+    columns = list(zip(*records)) if records else [()] * len(JobRecord._fields)
+    arrays = []
+    for name, values in zip(JobRecord._fields, columns):
+        array = pa.array(values, type=pa.string())
+        if name in ("company", "location", "salary", "job_type", "date_posted"):
+            array = array.dictionary_encode()
+        arrays.append(array)
+    return pa.RecordBatch.from_arrays(arrays, names=list(JobRecord._fields))
+
+
+def to_frame(records: Iterable, headers: List[str] = EXPORT_HEADERS) -> "pd.DataFrame":
+    """
+    DataFrame for exports and reports, built through Arrow when pyarrow is
+    installed (string columns stay Arrow-backed) and from the tuples otherwise.
+    """
+    import pandas as pd
+
+    try:
+        batch = to_arrow(records)
+    except ImportError:
+        return pd.DataFrame.from_records(as_records(records), columns=headers)
+    df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+    df.columns = headers
+    return df
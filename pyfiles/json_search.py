@@ -0,0 +1,80 @@
+from itertools import islice
+from typing import Any, Callable, Optional
+
+# How many values of a dict are sampled when checking its shape
+SAMPLE_SIZE = 10
+
+_CONTAINERS = (dict, list)
+
+
+def find_first(obj: Any, predicate: Callable[[dict], bool],
+               signature: Optional[Callable[[dict], bool]] = None,
+               prune: Optional[Callable[[dict], bool]] = None) -> Optional[dict]:
+    """
+    Single-pass, depth-first search for the first dict matching predicate.
+
+    Scalars are never pushed onto the stack, dicts failing the cheap
+    signature check skip the expensive predicate, and the walk stops at
+    the first match.
+
+    Args:
+        obj: Decoded JSON payload (dict, list or scalar)
+        predicate: Full check for a candidate dict
+        signature: Cheap shape check; dicts failing it skip the predicate
+        prune: Dicts it accepts are not descended into
+
+    Returns:
+        The first matching dict, or None
+    """
+    if not isinstance(obj, _CONTAINERS):
+        return None
+    stack = [obj]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        cur = pop()
+        if type(cur) is dict:
+            if cur and (signature is None or signature(cur)) and predicate(cur):
+                return cur
+            if prune is not None and prune(cur):
+                continue
+            children = cur.values()
+        else:
+            children = cur
+        for v in children:
+            if isinstance(v, _CONTAINERS):
+                push(v)
+    return None
+
+
+def find_key(obj: Any, key: str) -> Any:
+    """
+    Return the first non-None value stored under key anywhere in obj,
+    visiting nested containers in document order.
+
+    Args:
+        obj: Decoded JSON payload
+        key: Dict key to look for
+
+    Returns:
+        The value found, or None
+    """
+    if not isinstance(obj, _CONTAINERS):
+        return None
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if type(cur) is dict:
+            found = cur.get(key)
+            if found is not None:
+                return found
+            children = cur.values()
+        else:
+            children = cur
+        stack.extend(reversed([v for v in children if isinstance(v, _CONTAINERS)]))
+    return None
+
+
+def sample_values(d: dict, n: int = SAMPLE_SIZE) -> list:
+    """Return the first n values of a dict without copying the rest."""
+    return list(islice(d.values(), n))
@@ -0,0 +1,174 @@
+# keyphrases.py — cached KeyBERT keyphrase extraction over job descriptions
+# Usage:  python keyphrases.py indeed_jobs_DS.json [more.json ...] [--batch-size N]
+# Embeddings and keyphrases are stored per description hash in
+# keyphrase_cache.db, so later runs only embed postings they have not seen.
+
+import argparse
+import hashlib
+import json
+import sqlite3
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+CACHE_DB = "keyphrase_cache.db"
+# Small sentence-transformers model that runs comfortably on CPU
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_BATCH_SIZE = 32
+KEYPHRASE_NGRAM_RANGE = (1, 3)
+TOP_N = 5
+
+
+def description_hash(text: str) -> str:
+    """Stable cache key for one description."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class KeyphraseExtractor:
+    def __init__(self, db_path: str = CACHE_DB, model_name: str = DEFAULT_MODEL,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db_path = db_path
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self._model = None
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS keyphrases ("
+            " hash TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " embedding BLOB NOT NULL,"
+            " keyphrases TEXT NOT NULL,"
+            " PRIMARY KEY (hash, model))"
+        )
+        self.conn.commit()
+
+    @property
+    def model(self):
+        """KeyBERT on a CPU-pinned sentence-transformers model, loaded on first use."""
+        if self._model is None:
+            from keybert import KeyBERT
+            from sentence_transformers import SentenceTransformer
+
+            encoder = SentenceTransformer(self.model_name, device="cpu")
+            self._model = KeyBERT(model=encoder)
+        return self._model
+
+    def _select(self, columns: str, hashes: Iterable[str]):
+        """Yield cached rows for the given hashes, chunked to stay below
+        SQLite's bound-parameter limit."""
+        hashes = list(hashes)
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            yield from self.conn.execute(
+                f"SELECT {columns} FROM keyphrases"
+                f" WHERE model = ? AND hash IN ({','.join('?' * len(chunk))})",
+                [self.model_name, *chunk])
+
+    def cached_hashes(self, hashes: Iterable[str]) -> set:
+        """Return the subset of hashes already processed with this model."""
+        return {row[0] for row in self._select("hash", hashes)}
+
+    def _process_batch(self, batch: List[Tuple[str, str]]):
+        """Embed one batch, extract keyphrases and write them to the cache."""
+        docs = [text for _, text in batch]
+        doc_embeddings, word_embeddings = self.model.extract_embeddings(
+            docs, keyphrase_ngram_range=KEYPHRASE_NGRAM_RANGE)
+        keywords = self.model.extract_keywords(
+            docs,
+            keyphrase_ngram_range=KEYPHRASE_NGRAM_RANGE,
+            top_n=TOP_N,
+            doc_embeddings=doc_embeddings,
+            word_embeddings=word_embeddings,
+        )
+        # A single document returns a flat list instead of a list of lists
+        if len(docs) == 1:
+            keywords = [keywords]
+
+        rows = [
+            (h, self.model_name,
+             np.asarray(embedding, dtype=np.float32).tobytes(),
+             json.dumps(phrases))
+            for (h, _), embedding, phrases in zip(batch, doc_embeddings, keywords)
+        ]
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO keyphrases VALUES (?, ?, ?, ?)", rows)
+        self.conn.commit()
+
+    def process(self, descriptions: Iterable[str]) -> int:
+        """
+        Extract keyphrases for every description not yet in the cache.
+        Results are committed batch by batch, so an interrupted run keeps
+        everything it finished.
+
+        Args:
+            descriptions: Raw description strings
+
+        Returns:
+            Number of descriptions newly embedded
+        """
+        pending = {}
+        for text in descriptions:
+            if isinstance(text, str) and text.strip() and text != "None":
+                pending.setdefault(description_hash(text), text)
+
+        done = self.cached_hashes(pending)
+        todo = [(h, text) for h, text in pending.items() if h not in done]
+
+        for i in range(0, len(todo), self.batch_size):
+            self._process_batch(todo[i:i + self.batch_size])
+            print(f"  Embedded {min(i + self.batch_size, len(todo))}/{len(todo)} new descriptions", end="\r")
+        if todo:
+            print()
+        return len(todo)
+
+    def lookup(self, descriptions: Iterable[str]) -> Dict[str, list]:
+        """Return cached keyphrases keyed by description hash."""
+        hashes = {description_hash(t) for t in descriptions if isinstance(t, str)}
+        return {h: json.loads(phrases)
+                for h, phrases in self._select("hash, keyphrases", hashes)}
+
+    def embeddings(self, descriptions: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Return cached document embeddings keyed by description hash."""
+        hashes = {description_hash(t) for t in descriptions if isinstance(t, str)}
+        return {h: np.frombuffer(blob, dtype=np.float32)
+                for h, blob in self._select("hash, embedding", hashes)}
+
+    def add_keyphrases(self, df: pd.DataFrame, column: str = "description") -> pd.DataFrame:
+        """
+        Pipeline stage: process new descriptions and attach a keyphrases
+        column (list of (phrase, score) pairs) to the DataFrame.
+        """
+        self.process(df[column])
+        cached = self.lookup(df[column])
+        df["keyphrases"] = [
+            cached.get(description_hash(t), []) if isinstance(t, str) else []
+            for t in df[column]
+        ]
+        return df
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract keyphrases from job descriptions")
+    parser.add_argument("files", nargs="+", help="indeed_jobs_*.json files")
+    parser.add_argument("--db", default=CACHE_DB)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    extractor = KeyphraseExtractor(args.db, args.model, args.batch_size)
+    try:
+        for path in args.files:
+            df = pd.read_json(path)
+            new = extractor.process(df["description"])
+            print(f"✓ {path}: {len(df)} postings, {new} newly embedded")
+    finally:
+        extractor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# listing.py — concurrent fetching of search result pages
+# Result pages are addressed by utils.get_url's &start= offset, so there is no
+# need to walk the pagination-next links one page at a time. fetch_pages()
+# loads up to LISTING_THREADS pages at once (each in its own short-lived
+# driver), merges their cards in page order without duplicates and stops at
+# the last page of results.
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, NamedTuple, Tuple
+
+import blocking
+import config
+import metrics
+import utils
+from job_record import job_key
+
+NEXT_PAGE_SELECTOR = "a[data-testid='pagination-page-next']"
+
+
+class ListingPage(NamedTuple):
+    page: int
+    url: str
+    cards: List[Tuple[str, str, str, str]]
+    has_next: bool
+
+
+def fetch_page(url, page, delay=0.0):
+    """
+    Load one results page and read its cards and pagination state
+
+    Args:
+        url: Search URL with the page's &start= offset
+        page: Zero-based page number (for logs and metrics)
+        delay: Seconds to wait before starting the browser
+
+    Returns:
+        ListingPage; a page that never shows a job card is returned empty
+
+    Raises:
+        blocking.BlockedError: If a block/captcha page was served
+    """
+    if delay:
+        with metrics.span("page_switch_sleep"):
+            config.time.sleep(delay)
+    blocking.BREAKER.wait()
+    driver = None
+    try:
+        driver = utils.create_driver()
+        with metrics.span("page_get", page=page + 1):
+            driver.get(url)
+        with metrics.span("page_sleep"):
+            config.time.sleep(config.random.randint(
+                config.PAGE_LOAD_MIN, config.PAGE_LOAD_MAX))
+        try:
+            with metrics.span("page_wait", page=page + 1):
+                blocking.wait_for_page(driver, ".job_seen_beacon")
+        except config.TimeoutException:
+            # Past the last page Indeed renders a "no results" page
+            blocking.BREAKER.record_success()
+            return ListingPage(page, url, [], False)
+        blocking.BREAKER.record_success()
+        cards = utils.get_job_cards(driver)
+        has_next = bool(driver.find_elements(config.By.CSS_SELECTOR, NEXT_PAGE_SELECTOR))
+        return ListingPage(page, url, cards, has_next)
+    except blocking.BlockedError:
+        raise
+    except BaseException:
+        blocking.BREAKER.release()
+        raise
+    finally:
+        if driver is not None:
+            utils.quit_driver(driver)
+
+
+def fetch_pages(job_title, city, state, start_page=0, num_pages=1,
+                workers=config.LISTING_THREADS):
+    """
+    Fetch a range of result pages concurrently
+
+    Pages are submitted in order with at most `workers` in flight. Once a
+    page turns out to be the last one (no next link, no cards, or only cards
+    already seen on earlier pages, which is what Indeed serves for offsets
+    past the end), no further pages are started and later results are
+    dropped. A page that hits a block page is queued again (behind the
+    circuit breaker's pause) up to BLOCK_MAX_RETRIES times.
+
+    Args:
+        job_title, city, state: Search terms for utils.get_url
+        start_page: First zero-based page number
+        num_pages: Maximum number of pages to fetch
+        workers: Pages loaded at the same time
+
+    Returns:
+        Tuple: (cards in page order without repeated jobs, pages used)
+    """
+    pages = list(range(start_page, start_page + num_pages))
+    workers = max(1, min(workers, len(pages)))
+    results = {}
+    last_page = None
+    attempts = {}
+    retry = []
+
+    def delay_for(slot):
+        # Stagger the first wave the way the serial loop spaced its pages
+        return slot * config.random.uniform(config.PAGE_SWITCH_MIN, config.PAGE_SWITCH_MAX)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        next_index = 0
+        while next_index < len(pages) or pending or retry:
+            while len(pending) < workers and (retry or next_index < len(pages)):
+                if retry:
+                    page = retry.pop(0)
+                    delay = 0.0
+                else:
+                    page = pages[next_index]
+                    delay = delay_for(next_index) if next_index < workers else 0.0
+                    next_index += 1
+                if last_page is not None and page > last_page:
+                    continue
+                url = utils.get_url(job_title, city, state, page)
+                pending[executor.submit(fetch_page, url, page, delay)] = page
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                page = pending.pop(future)
+                try:
+                    result = future.result()
+                except blocking.BlockedError as e:
+                    attempts[page] = attempts.get(page, 0) + 1
+                    if attempts[page] <= config.BLOCK_MAX_RETRIES:
+                        utils.safe_print(f"⚠ Page {page + 1} blocked ({e}), will retry")
+                        retry.append(page)
+                        continue
+                    metrics.count("scrape_listing_pages_failed_total")
+                    utils.safe_print(f"⚠ Page {page + 1} still blocked, giving up")
+                    continue
+                except Exception as e:
+                    metrics.count("scrape_listing_pages_failed_total")
+                    utils.safe_print(f"⚠ Page {page + 1} failed: {e}")
+                    continue
+                results[page] = result
+                if not result.has_next or not result.cards:
+                    last_page = page if last_page is None else min(last_page, page)
+                utils.safe_print(f"✓ Page {page + 1}: {len(result.cards)} cards"
+                                 + ("" if result.has_next else " (last page)"))
+
+    seen = set()
+    cards = []
+    pages_used = 0
+    for page in sorted(results):
+        if last_page is not None and page > last_page:
+            break
+        keys = [job_key(url, title, company, location)
+                for title, company, location, url in results[page].cards]
+        new = [(card, key) for card, key in zip(results[page].cards, keys) if key not in seen]
+        if keys and not new:
+            # Offset past the end: Indeed repeats the final page
+            break
+        pages_used += 1
+        for card, key in new:
+            seen.add(key)
+            cards.append(card)
+    metrics.count("scrape_listing_pages_total", pages_used)
+    return cards, pages_used
@@ -0,0 +1,189 @@
+import json
+import os
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "us_gazetteer.json")
+
+# "Remote in Chicago, IL" / "Hybrid work in New York, NY 10017"
+REMOTE_RE = re.compile(r"\bremote\b", re.IGNORECASE)
+HYBRID_RE = re.compile(r"\bhybrid\b", re.IGNORECASE)
+MODE_PREFIX_RE = re.compile(r"^\s*(?:hybrid(?:\s+remote|\s+work)?|remote)\s+in\s+", re.IGNORECASE)
+# "(Bluemont area)"
+AREA_RE = re.compile(r"\(([^)]*?)(?:\s+area)?\)")
+# "Arlington, VA 22201"; multi-part locations ("Los Angeles, Riverside,
+# Orange County, CA") carry the state in their last ", XX" token
+STATE_TOKEN_RE = re.compile(r",\s*(?P<state>[A-Z]{2})\b(?:\s+(?P<zip>\d{5}))?")
+STATE_SUFFIX_RE = re.compile(r"\s+state$", re.IGNORECASE)
+
+LOCATION_COLUMNS = ["city", "state", "zip", "area", "metro", "remote", "hybrid"]
+
+
+class Location(NamedTuple):
+    city: Optional[str]
+    state: Optional[str]
+    zip: Optional[str]
+    area: Optional[str]
+    metro: Optional[str]
+    remote: bool
+    hybrid: bool
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer():
+    """
+    Load the bundled offline gazetteer
+
+    Returns:
+        Tuple: (state code set, lowercase state name -> code,
+                "city, ST" (lowercase) -> metro name)
+    """
+    with open(GAZETTEER_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+
+    codes = set(data["states"])
+    names = {name.lower(): code for code, name in data["states"].items()}
+    metros = {}
+    for metro, cities in data["metros"].items():
+        for city in cities:
+            metros[city.lower()] = metro
+    return codes, names, metros
+
+
+@lru_cache(maxsize=65536)
+def parse_location(text: str) -> Location:
+    """
+    Parse one Indeed location string
+
+    Args:
+        text: Raw location, e.g. "Arlington, VA 22201 \\n(Bluemont area)"
+
+    Returns:
+        Location with city, state, ZIP, neighbourhood, metro and
+        remote/hybrid flags; unknown parts are None
+    """
+    codes, names, metros = load_gazetteer()
+    text = (text or "").strip()
+
+    area_match = AREA_RE.search(text)
+    area = area_match.group(1).strip() if area_match else None
+
+    main = AREA_RE.sub("", text).split("\n")[0].strip()
+    # "Hybrid remote in ..." is hybrid, not fully remote: a work-mode
+    # prefix decides, the bare words only when there is none
+    mode = MODE_PREFIX_RE.match(main)
+    mode_text = mode.group(0) if mode else text
+    hybrid = bool(HYBRID_RE.search(mode_text))
+    remote = bool(REMOTE_RE.search(mode_text)) and not hybrid
+    main = main[mode.end():].strip() if mode else main
+
+    city = state = zip_code = None
+    match = None
+    for token in STATE_TOKEN_RE.finditer(main):
+        if token.group("state") in codes:
+            match = token
+    if match:
+        # The first part names the city; the rest are counties/neighbours
+        city = main[:match.start()].split(",")[0].strip() or None
+        state = match.group("state")
+        zip_code = match.group("zip")
+    else:
+        # Bare state names: "North Carolina", "New York State", "Remote in Maine"
+        state = names.get(STATE_SUFFIX_RE.sub("", main).lower())
+
+    metro = metros.get(f"{city}, {state}".lower()) if city else None
+    return Location(city, state, zip_code, area, metro, remote, hybrid)
+
+
+def normalize_locations(locations: "pd.Series") -> "pd.DataFrame":
+    """
+    Parse a whole location column. Each distinct string is parsed once and
+    the results are broadcast back to the rows by position.
+
+    Args:
+        locations: Series of raw location strings
+
+    Returns:
+        DataFrame with city, state, zip, area, metro, remote and hybrid
+        columns, aligned to the input index
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(locations)
+    # Missing values get code -1; send them to an extra empty-string row
+    codes[codes == -1] = len(uniques)
+    rows = [parse_location(str(s)) for s in uniques] + [parse_location("")]
+    table = pd.DataFrame(rows, columns=LOCATION_COLUMNS)
+    parsed = table.iloc[codes].reset_index(drop=True)
+    parsed.index = locations.index
+    return parsed
+
+
+def add_location_columns(df: "pd.DataFrame", column: str = "location",
+                         prefix: str = "loc") -> "pd.DataFrame":
+    """
+    Pipeline stage: append parsed location columns to a jobs DataFrame
+
+    Args:
+        df: Jobs DataFrame with a raw location column
+        column: Name of the raw location column
+        prefix: Prefix for the new columns (loc_state, loc_metro, ...)
+
+    Returns:
+        The same DataFrame with the parsed columns added
+    """
+    if column not in df.columns or df.empty:
+        return df
+    parsed = normalize_locations(df[column])
+    for name in LOCATION_COLUMNS:
+        df[f"{prefix}_{name}"] = parsed[name]
+    return df
+
+
+def extract_state_codes(locations: "pd.Series") -> "pd.Series":
+    """
+    State codes for a location column (e.g., "New York, NY" -> "NY"),
+    parsed once per distinct location.
+    """
+    return normalize_locations(locations)["state"].astype("category")
+
+
+def join_regions(jobs: "pd.DataFrame", regions: "pd.DataFrame",
+                 column: str = "location") -> "pd.DataFrame":
+    """
+    Attach Levels.fyi compensation to job postings in one merge.
+
+    Postings in a known metro match that metro's region row; the rest fall
+    back to the state average. Both kinds of row are stacked into a single
+    lookup table, so the join itself is one vectorized merge.
+
+    Args:
+        jobs: Jobs DataFrame with a raw location column
+        regions: Regions DataFrame from run_all.py (region_name,
+            detailed_location, p10..p90, normalizedMedian)
+        column: Name of the raw location column in jobs
+
+    Returns:
+        jobs with loc_* columns, region_key and the region percentiles
+    """
+    import pandas as pd
+
+    value_cols = [c for c in ["p10", "p25", "p50", "p75", "p90", "normalizedMedian"]
+                  if c in regions.columns]
+
+    if "state_code" not in regions.columns:
+        regions = regions.assign(state_code=extract_state_codes(regions["detailed_location"]))
+
+    by_metro = regions[["region_name"] + value_cols].rename(columns={"region_name": "region_key"})
+    by_state = (regions.groupby("state_code", observed=True)[value_cols].mean()
+                .reset_index().rename(columns={"state_code": "region_key"}))
+    lookup = (pd.concat([by_metro, by_state], ignore_index=True)
+              .astype({"region_key": "string"})
+              .drop_duplicates("region_key"))
+
+    jobs = add_location_columns(jobs.copy(), column)
+    metro_known = jobs["loc_metro"].isin(by_metro["region_key"])
+    jobs["region_key"] = jobs["loc_metro"].where(metro_known, jobs["loc_state"]).astype("string")
+
+    return jobs.merge(lookup, on="region_key", how="left")
@@ -0,0 +1,211 @@
+# metrics.py — timing spans, counters and histograms for the scraper
+# Spans are logged as JSON lines and aggregated into histograms; the
+# aggregate is exported in Prometheus text format, either as a file for the
+# node_exporter textfile collector or from a small HTTP endpoint.
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds (the +Inf bucket is implicit)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+# Raw samples kept per histogram for the console percentiles
+MAX_SAMPLES = 10000
+
+PHASE_METRIC = "scrape_phase_seconds"
+PHASE_ERRORS = "scrape_phase_errors_total"
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: dict) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join('{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"'))
+                    for k, v in pairs)
+    return "{" + body + "}"
+
+
+class Histogram:
+    def __init__(self):
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.samples: List[float] = []
+
+    def observe(self, value: float):
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.buckets[i] += 1
+        self.count += 1
+        self.sum += value
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+
+    def quantile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class Registry:
+    """Thread-safe store for counters, histograms and the JSON span log."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.log_file = None
+
+    def configure(self, log_path: Optional[str] = None):
+        """Start appending one JSON line per span to log_path."""
+        with self.lock:
+            if self.log_file:
+                self.log_file.close()
+            self.log_file = open(log_path, "a", encoding="utf-8", buffering=1) if log_path else None
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = _label_key(labels)
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def _observe(self, name: str, value: float, labels: dict):
+        key = _label_key(labels)
+        with self.lock:
+            self.histograms.setdefault(name, {}).setdefault(key, Histogram()).observe(value)
+
+    def observe(self, name: str, value: float, **labels):
+        """Add a value to a histogram and to the JSON log."""
+        self._observe(name, value, labels)
+        self.log({"ts": round(time.time(), 3), "metric": name,
+                  "value": round(value, 4), **labels})
+
+    def log(self, event: dict):
+        with self.lock:
+            if self.log_file:
+                self.log_file.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    @contextmanager
+    def span(self, phase: str, **labels):
+        """
+        Time a block as one phase of the scrape
+
+        The duration goes into the scrape_phase_seconds histogram and the
+        JSON log; an exception is counted in scrape_phase_errors_total by
+        type (TimeoutException, NoSuchElementException, ...) and re-raised.
+        """
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self._observe(PHASE_METRIC, seconds, {"phase": phase})
+            if error:
+                self.count(PHASE_ERRORS, phase=phase, error=error)
+            self.log({"ts": round(time.time(), 3), "span": phase,
+                      "seconds": round(seconds, 4), "ok": error is None,
+                      "error": error, "thread": threading.current_thread().name,
+                      **labels})
+
+    def counter_value(self, name: str, **labels) -> float:
+        with self.lock:
+            return self.counters.get(name, {}).get(_label_key(labels), 0)
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self.lock:
+            for name in sorted(self.counters):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self.counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {value:g}")
+            for name in sorted(self.histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(self.histograms[name].items()):
+                    for bound, n in zip(BUCKETS, hist.buckets):
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {n}")
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {hist.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {hist.sum:.6f}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Write the exposition atomically (safe for textfile collectors)."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+    def serve_prometheus(self, port: int) -> ThreadingHTTPServer:
+        """Serve /metrics from a daemon thread until the process exits."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("", port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def phase_summary(self) -> List[Tuple[str, int, float, float, float]]:
+        """(phase, count, total s, p50 s, p95 s) per phase, slowest total first."""
+        with self.lock:
+            rows = [(dict(key).get("phase", ""), h.count, h.sum, h.quantile(0.5), h.quantile(0.95))
+                    for key, h in self.histograms.get(PHASE_METRIC, {}).items()]
+        return sorted(rows, key=lambda r: -r[2])
+
+    def print_summary(self):
+        rows = self.phase_summary()
+        if not rows:
+            return
+        total = sum(r[2] for r in rows)
+        print(f"\n{'Phase':<18}{'Count':>7}{'Total s':>10}{'Share':>8}{'p50 s':>8}{'p95 s':>8}")
+        print("-" * 59)
+        for phase, n, seconds, p50, p95 in rows:
+            print(f"{phase:<18}{n:>7}{seconds:>10.1f}{seconds / total * 100:>7.1f}%"
+                  f"{p50:>8.2f}{p95:>8.2f}")
+        with self.lock:
+            errors = sorted(self.counters.get(PHASE_ERRORS, {}).items())
+            others = [(name, h) for name, series in sorted(self.histograms.items())
+                      if name != PHASE_METRIC for h in series.values()]
+        for key, n in errors:
+            labels = dict(key)
+            print(f"  {labels['phase']}: {n:g} x {labels['error']}")
+        for name, h in others:
+            print(f"{name}: n={h.count} p50={h.quantile(0.5):.2f}s p95={h.quantile(0.95):.2f}s")
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+# Process-wide registry used by utils and scraper_main
+REGISTRY = Registry()
+span = REGISTRY.span
+count = REGISTRY.count
+observe = REGISTRY.observe
@@ -9,6 +9,7 @@ class OnetAPI:
     def __init__(self, api_username: str, api_password: str):
         # Base URL for occupation data
         self.base_url = "https://services.onetcenter.org/v1.9/ws/online/occupations/"
+        self.search_url = "https://services.onetcenter.org/ws/online/search"
         self.session = requests.Session()
         self.session.auth = (api_username, api_password)
 
@@ -23,7 +24,7 @@ class OnetAPI:
 
     def search_job(self, job_title: str):
         # Search for occupation based off of user input keyword
-        url = "https://services.onetcenter.org/ws/online/search"
+        url = self.search_url
         params = {"keyword": job_title}
         headers = {"Accept": "application/json"}
         response = self.session.get(url, params=params, headers=headers)
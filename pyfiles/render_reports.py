@@ -0,0 +1,128 @@
+# render_reports.py — headless batch rendering of compensation reports
+# Usage:  python render_reports.py "Software Engineer=levels_heatmap_regions.csv" \
+#             "Data Scientist=ds_regions.csv" --formats png svg html --workers 4
+# Outputs (per role, under --out/<role-slug>/):
+#   - heatmap_state.<fmt>
+#   - chart_top20_median.<fmt>
+#   - chart_percentile_bars.<fmt>
+
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+
+# matplotlib charts cannot be written as HTML; plotly figures can
+CHART_FORMATS = {"png", "svg", "pdf"}
+DEFAULT_FORMATS = ["png", "svg", "html"]
+
+
+def role_slug(role: str) -> str:
+    """Convert a role name to a directory-safe slug."""
+    return re.sub(r"[^a-z0-9]+", "-", role.lower()).strip("-")
+
+
+def render_role(role: str, csv_path: str, out_dir: str,
+                formats: List[str]) -> Tuple[str, List[str], float]:
+    """
+    Render every report for one role. Runs inside a worker process.
+    Each figure is built once and written in all requested formats.
+
+    Args:
+        role: Role name used in titles
+        csv_path: Regions CSV produced by run_all.py
+        out_dir: Root output directory
+        formats: File extensions to write (png, svg, html)
+
+    Returns:
+        Tuple: (role, files written, seconds taken)
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from heatmap import CompensationHeatmap
+    from run_all import save_charts
+
+    start = time.time()
+    role_dir = os.path.join(out_dir, role_slug(role))
+    os.makedirs(role_dir, exist_ok=True)
+
+    # load_data is memoized per file, so a worker that renders several
+    # roles from the same CSV aggregates it only once
+    heatmap = CompensationHeatmap(csv_path)
+    heatmap.load_data()
+
+    written = []
+    fig = heatmap.build_figure(title=f"{role} Compensation Heatmap by State")
+    for fmt in formats:
+        path = os.path.join(role_dir, f"heatmap_state.{fmt}")
+        heatmap.save(fig, path)
+        written.append(path)
+
+    chart_formats = [fmt for fmt in formats if fmt in CHART_FORMATS]
+    if chart_formats:
+        written += save_charts(heatmap.df, role_dir, chart_formats, role)
+
+    return role, written, time.time() - start
+
+
+def render_all(datasets: Dict[str, str], out_dir: str = "reports",
+               formats: List[str] = None, workers: int = None) -> Dict[str, List[str]]:
+    """
+    Render reports for many roles in parallel with a process pool.
+
+    Args:
+        datasets: Mapping of role name -> regions CSV path
+        out_dir: Root output directory
+        formats: File extensions to write (default png, svg, html)
+        workers: Process count (default: one per CPU, capped at role count)
+
+    Returns:
+        Mapping of role name -> files written
+    """
+    formats = formats or DEFAULT_FORMATS
+    workers = min(workers or os.cpu_count() or 1, len(datasets)) or 1
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(render_role, role, path, out_dir, formats): role
+            for role, path in datasets.items()
+        }
+        for future in as_completed(futures):
+            role = futures[future]
+            try:
+                role, written, elapsed = future.result()
+                results[role] = written
+                print(f"✓ {role}: {len(written)} files in {elapsed:.2f}s")
+            except Exception as e:
+                print(f"❌ {role}: rendering failed: {e}")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render compensation reports headlessly")
+    parser.add_argument("datasets", nargs="+", help="ROLE=CSV_PATH pairs")
+    parser.add_argument("--out", default="reports", help="Output directory")
+    parser.add_argument("--formats", nargs="+", default=DEFAULT_FORMATS)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    datasets = {}
+    for item in args.datasets:
+        role, sep, path = item.partition("=")
+        if not sep:
+            parser.error(f"Expected ROLE=CSV_PATH, got {item!r}")
+        datasets[role.strip()] = path.strip()
+
+    start = time.time()
+    results = render_all(datasets, args.out, args.formats, args.workers)
+    total = sum(len(files) for files in results.values())
+    print(f"\n✓ Rendered {total} files for {len(results)} roles "
+          f"in {time.time() - start:.2f}s → {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
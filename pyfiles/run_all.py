@@ -6,14 +6,20 @@
 #   - chart_percentile_bars.png
 #   - debug_dump/ (only for troubleshooting)
 
+import argparse
 import json
 import re
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from location import extract_state_codes
+from json_search import SAMPLE_SIZE, find_first, sample_values
+
 # ----------------- CONFIG -----------------
 HEATMAP_URL = "https://www.levels.fyi/heatmap/"
 OUTPUT_CSV = "levels_heatmap_regions.csv"
@@ -23,6 +29,10 @@ DEBUG_DIR.mkdir(exist_ok=True)
 # -------------- UTILITIES -----------------
 
 
+PCT_KEYS = {"p10", "p25", "p50", "p75", "p90"}
+NAME_KEYS = {"primary_name", "secondary_name"}
+
+
 def looks_like_regions_dict(obj: Any) -> bool:
     """
     Heuristic: a big dict whose values are dicts containing
@@ -30,17 +40,42 @@ def looks_like_regions_dict(obj: Any) -> bool:
     """
     if not isinstance(obj, dict) or not obj:
         return False
-    sample_values = list(obj.values())[:10]
+    values = sample_values(obj)
     good = 0
-    for v in sample_values:
+    for v in values:
         if not isinstance(v, dict):
             continue
-        keys = set(v.keys())
-        pct_keys = {"p10", "p25", "p50", "p75", "p90"}
-        name_keys = {"primary_name", "secondary_name"}
-        if pct_keys.issubset(keys) and (name_keys & keys):
+        keys = v.keys()
+        if PCT_KEYS <= keys and not NAME_KEYS.isdisjoint(keys):
             good += 1
-    return good >= max(1, len(sample_values) // 3)
+    return good >= max(1, len(values) // 3)
+
+
+def regions_signature(obj: dict) -> bool:
+    """
+    Cheap shape check run before looks_like_regions_dict: some value in
+    the same sample window must itself be a dict carrying a p50 key, so
+    the signature never rejects a dict the full check would accept.
+    Stops at the first such value.
+    """
+    for v in islice(obj.values(), SAMPLE_SIZE):
+        if type(v) is dict and "p50" in v:
+            return True
+    return False
+
+
+def is_region_entry(obj: Any) -> bool:
+    """A single region row; its children are scalars, so never descend."""
+    return isinstance(obj, dict) and "p50" in obj
+
+
+def find_regions_dict(payload: Any) -> Optional[Dict]:
+    """
+    Single-pass search of a captured payload for the DMA regions dict.
+    Stops at the first match and skips subtrees that cannot contain it.
+    """
+    return find_first(payload, looks_like_regions_dict,
+                      signature=regions_signature, prune=is_region_entry)
 
 
 def parse_regions_from_dict(d: Dict) -> pd.DataFrame:
@@ -122,19 +157,9 @@ def try_live_scrape() -> Optional[pd.DataFrame]:
 
     # Search all captured payloads for the regions dict
     for p in payloads:
-        # 1) direct dict with region entries
-        if looks_like_regions_dict(p):
-            return parse_regions_from_dict(p)
-        # 2) search within nested structures
-        stack = [p]
-        while stack:
-            cur = stack.pop()
-            if isinstance(cur, dict):
-                if looks_like_regions_dict(cur):
-                    return parse_regions_from_dict(cur)
-                stack.extend(cur.values())
-            elif isinstance(cur, list):
-                stack.extend(cur)
+        regions = find_regions_dict(p)
+        if regions is not None:
+            return parse_regions_from_dict(regions)
 
     return None
 
@@ -150,76 +175,75 @@ def try_from_debug_dump() -> Optional[pd.DataFrame]:
             obj = json.loads(jf.read_text(encoding="utf-8"))
         except Exception:
             continue
-        if looks_like_regions_dict(obj):
-            return parse_regions_from_dict(obj)
-        # nested scan
-        stack = [obj]
-        while stack:
-            cur = stack.pop()
-            if isinstance(cur, dict):
-                if looks_like_regions_dict(cur):
-                    return parse_regions_from_dict(cur)
-                stack.extend(cur.values())
-            elif isinstance(cur, list):
-                stack.extend(cur)
+        regions = find_regions_dict(obj)
+        if regions is not None:
+            return parse_regions_from_dict(regions)
     return None
 
 
-def save_charts(df: pd.DataFrame) -> None:
+PERCENTILES = ["p10", "p25", "p50", "p75", "p90"]
+
+
+def save_charts(df: pd.DataFrame, out_dir: str = ".", formats=("png",),
+                role: str = "Software Engineer") -> List[str]:
     """
-    Create two PNG charts with matplotlib:
+    Create two charts with matplotlib, each built once and saved in
+    every requested format (png, svg, ...):
       1) Top-20 regions by median (p50)
       2) Percentile bars for top-10 by median
+    Returns the list of files written.
     """
     import matplotlib.pyplot as plt
 
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    def save(fig, stem):
+        fig.tight_layout()
+        for fmt in formats:
+            path = out / f"{stem}.{fmt}"
+            fig.savefig(path, dpi=200)
+            written.append(str(path))
+        plt.close(fig)
+
+    ranked = df.sort_values("p50", ascending=False)
+
     # ---- 1) Top-20 by median ----
-    top20 = df.sort_values("p50", ascending=False).head(20)
-    plt.figure(figsize=(11, 8))
-    plt.barh(top20["region_name"], top20["p50"])
-    plt.gca().invert_yaxis()
-    plt.xlabel("Median (p50) Total Comp")
-    plt.title("Top 20 Markets by Median Software Engineer Compensation")
-    plt.tight_layout()
-    plt.savefig("chart_top20_median.png", dpi=200)
-    plt.close()
+    top20 = ranked.head(20)
+    fig, ax = plt.subplots(figsize=(11, 8))
+    ax.barh(top20["region_name"], top20["p50"])
+    ax.invert_yaxis()
+    ax.set_xlabel("Median (p50) Total Comp")
+    ax.set_title(f"Top 20 Markets by Median {role} Compensation")
+    save(fig, "chart_top20_median")
 
     # ---- 2) Percentile bars for top-10 ----
-    top10 = df.sort_values("p50", ascending=False).head(10).copy()
-    # Build wide-to-long for stacked bars
-    long = top10.melt(
-        id_vars=["region_name"],
-        value_vars=["p10", "p25", "p50", "p75", "p90"],
-        var_name="percentile",
-        value_name="comp"
-    )
-    # Order regions by median descending
+    # Already wide: one (region x percentile) matrix, ordered by median
+    top10 = ranked.head(10)
     order = top10["region_name"].tolist()
-    long["region_name"] = pd.Categorical(
-        long["region_name"], categories=order, ordered=True)
-    long = long.sort_values(["region_name", "percentile"])
-
-    # Plot grouped bars
-    plt.figure(figsize=(12, 8))
-    # group by region, plot each percentile cluster
-    percentiles = ["p10", "p25", "p50", "p75", "p90"]
-    x = range(len(order))
+    matrix = top10[PERCENTILES].to_numpy()
+
+    # Plot grouped bars, one cluster per region
+    fig, ax = plt.subplots(figsize=(12, 8))
+    x = np.arange(len(order))
     width = 0.15
-    for i, p in enumerate(percentiles):
-        series = long[long["percentile"] == p].sort_values("region_name")[
-            "comp"].values
-        xs = [xi + (i - 2)*width for xi in x]
-        plt.bar(xs, series, width=width, label=p)
-    plt.xticks(x, order, rotation=30, ha="right")
-    plt.ylabel("Compensation")
-    plt.title("Percentiles by Region (Top 10 by Median)")
-    plt.legend(title="Percentile")
-    plt.tight_layout()
-    plt.savefig("chart_percentile_bars.png", dpi=200)
-    plt.close()
+    for i, p in enumerate(PERCENTILES):
+        ax.bar(x + (i - 2)*width, matrix[:, i], width=width, label=p)
+    ax.set_xticks(x)
+    ax.set_xticklabels(order, rotation=30, ha="right")
+    ax.set_ylabel("Compensation")
+    ax.set_title("Percentiles by Region (Top 10 by Median)")
+    ax.legend(title="Percentile")
+    save(fig, "chart_percentile_bars")
+    return written
 
 
 def main():
+    argparse.ArgumentParser(
+        description="Scrape Levels.fyi regional pay into levels_heatmap_regions.csv and charts "
+                    "(falls back to debug_dump/ when the live scrape fails)").parse_args()
+
     # 1) Try live scrape
     df = try_live_scrape()
     if df is None or df.empty:
@@ -238,7 +262,8 @@ def main():
     for col in keep:
         if col not in df.columns:
             df[col] = None
-    df = df[keep]
+    # Store state codes with the data so heatmap.py can skip parsing
+    df = df[keep].assign(state_code=extract_state_codes(df["detailed_location"]))
     df.to_csv(OUTPUT_CSV, index=False)
     print(f"✅ Saved {len(df)} rows → {OUTPUT_CSV}")
 
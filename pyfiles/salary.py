@@ -0,0 +1,123 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Multipliers used to annualize a pay rate
+PERIOD_FACTORS = {
+    "hour": 2080,
+    "day": 260,
+    "week": 52,
+    "month": 12,
+    "year": 1,
+}
+
+# "$50,800", "$25.90", "$120K"
+AMOUNT_RE = re.compile(r"\$\s*(\d[\d,]*(?:\.\d+)?)\s*([kK])?")
+# "a year", "an hour", "per month"
+PERIOD_RE = re.compile(r"\b(?:an?|per)\s+(hour|day|week|month|year)\b", re.IGNORECASE)
+# "From $40 an hour" / "Up to $46 an hour"
+FROM_RE = re.compile(r"^\s*(?:from|starting at)\b", re.IGNORECASE)
+UP_TO_RE = re.compile(r"^\s*up\s+to\b", re.IGNORECASE)
+
+SALARY_COLUMNS = ["min", "max", "mid", "period", "annual"]
+
+
+class SalaryRange(NamedTuple):
+    min: Optional[float]
+    max: Optional[float]
+    mid: Optional[float]
+    period: Optional[str]
+    annual: Optional[float]
+
+
+EMPTY_SALARY = SalaryRange(None, None, None, None, None)
+
+
+def _amount(match) -> float:
+    value = float(match.group(1).replace(",", ""))
+    return value * 1000 if match.group(2) else value
+
+
+@lru_cache(maxsize=65536)
+def parse_salary(text: str) -> SalaryRange:
+    """
+    Parse one Indeed salary string
+
+    Args:
+        text: Raw salary text, e.g. "$50,800 - $119,200 a year"
+
+    Returns:
+        SalaryRange (min, max, mid, period, annual); all None when the
+        text holds no amount (e.g. "Full-time" or "")
+    """
+    if not text:
+        return EMPTY_SALARY
+
+    amounts = [_amount(m) for m in AMOUNT_RE.finditer(text)]
+    if not amounts:
+        return EMPTY_SALARY
+
+    if len(amounts) >= 2:
+        low, high = min(amounts[:2]), max(amounts[:2])
+    elif UP_TO_RE.match(text):
+        low, high = None, amounts[0]
+    elif FROM_RE.match(text):
+        low, high = amounts[0], None
+    else:
+        low = high = amounts[0]
+
+    known = [a for a in (low, high) if a is not None]
+    mid = sum(known) / len(known)
+
+    period_match = PERIOD_RE.search(text)
+    period = period_match.group(1).lower() if period_match else None
+    annual = mid * PERIOD_FACTORS[period] if period else None
+
+    return SalaryRange(low, high, mid, period, annual)
+
+
+def parse_salary_column(salaries: "pd.Series") -> "pd.DataFrame":
+    """
+    Parse a whole salary column. Each distinct string is parsed once and
+    the results are broadcast back to the rows by position.
+
+    Args:
+        salaries: Series of raw salary strings
+
+    Returns:
+        DataFrame with min, max, mid, period and annual columns,
+        aligned to the input index
+    """
+    import pandas as pd
+
+    codes, uniques = pd.factorize(salaries)
+    # Missing values get code -1; send them to an extra empty-string row
+    codes[codes == -1] = len(uniques)
+    rows = [parse_salary(str(s)) for s in uniques] + [parse_salary("")]
+    table = pd.DataFrame(rows, columns=SALARY_COLUMNS)
+    table = table.astype({"min": "float64", "max": "float64",
+                          "mid": "float64", "annual": "float64"})
+    parsed = table.iloc[codes].reset_index(drop=True)
+    parsed.index = salaries.index
+    return parsed
+
+
+def add_salary_columns(df: "pd.DataFrame", column: str = "salary",
+                       prefix: str = "salary") -> "pd.DataFrame":
+    """
+    Pipeline stage: append numeric salary columns to a jobs DataFrame
+
+    Args:
+        df: Jobs DataFrame with a raw salary column
+        column: Name of the raw salary column
+        prefix: Prefix for the new columns (salary_min, salary_annual, ...)
+
+    Returns:
+        The same DataFrame with the parsed columns added
+    """
+    if column not in df.columns or df.empty:
+        return df
+    parsed = parse_salary_column(df[column])
+    for name in SALARY_COLUMNS:
+        df[f"{prefix}_{name}"] = parsed[name]
+    return df
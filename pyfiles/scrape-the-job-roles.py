@@ -3,6 +3,8 @@ import re
 import json
 import matplotlib.pyplot as plt
 
+import json_search
+
 
 class LevelsFyiScraper:
     def __init__(self, role: str, location: str = "san-francisco-bay-area"):
@@ -47,20 +49,8 @@ class LevelsFyiScraper:
 
     @staticmethod
     def find_key(d, key):
-        """Recursive search for a key inside nested JSON."""
-        if isinstance(d, dict):
-            if key in d:
-                return d[key]
-            for v in d.values():
-                result = LevelsFyiScraper.find_key(v, key)
-                if result is not None:
-                    return result
-        elif isinstance(d, list):
-            for item in d:
-                result = LevelsFyiScraper.find_key(item, key)
-                if result is not None:
-                    return result
-        return None
+        """Search for a key inside nested JSON (shared single-pass finder)."""
+        return json_search.find_key(d, key)
 
     def extract_histogram(self):
         """Extract the jobFamilyHistogram data from JSON."""
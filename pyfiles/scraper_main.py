@@ -1,7 +1,11 @@
 import config
 import utils
-import keywords_main
+import job_record
+import metrics
+import autoscale
+import listing
 
+# Keyword step (python cli.py keywords) is run separately:
 # jt = keywords_main.main()
 
 job_title = input("Enter job title: ")
@@ -34,122 +38,117 @@ print(f"Using {max_workers} parallel threads")
 url = utils.get_url(job_title, city, state, start_page)
 print(f"\nSearch URL: {url}")
 
-# Setup WebDriver
-driver = utils.create_driver()
+# pandas-based stages are imported after the prompts so they show up at once
+import salary
+import dedup
+
+# Per-phase timing spans go to a JSON log; totals are exported at the end
+metrics.REGISTRY.configure(config.METRICS_LOG)
+if config.METRICS_PORT:
+    metrics.REGISTRY.serve_prometheus(config.METRICS_PORT)
+    print(f"Metrics at http://localhost:{config.METRICS_PORT}/metrics")
+
+# Phase 2 executor; AdaptiveExecutor tunes the concurrency while it runs
+if config.AUTOSCALE:
+    executor = autoscale.AdaptiveExecutor(max_workers=config.MAX_THREADS, initial=max_workers)
+else:
+    executor = config.ThreadPoolExecutor(max_workers=max_workers)
 
 # Store all job records
 records = []
-next_page_url = None
-print_lock = config.Lock()
+# Near-duplicate tracker: cards already seen in a cluster are not re-fetched
+dedup_index = dedup.DedupIndex.from_files(config.DEDUP_SEED_FILES)
+skipped_duplicates = 0
 try:
-    for page_num in range(num_pages):
-        current_page = start_page + page_num
-        print(f"\n{'='*80}")
-        print(f"SCRAPING PAGE {current_page + 1}")
-        print(f"{'='*80}")
-
-        # Navigate to URL
-        if page_num == 0:
-            driver.get(url)
-        else:
-            if next_page_url:
-                driver.get(next_page_url)
-            else:
-                url = utils.get_url(job_title, city, state, current_page)
-                driver.get(url)
-
-        # Wait for page to load
-        config.time.sleep(config.random.randint(
-            config.PAGE_LOAD_MIN, config.PAGE_LOAD_MAX))
-        config.WebDriverWait(driver, config.WEBDRIVER_TIMEOUT).until(
-            config.EC.presence_of_element_located(
-                (config.By.CLASS_NAME, "job_seen_beacon"))
-        )
-
-        # Find all job postings
-        posts = driver.find_elements(config.By.CLASS_NAME, "job_seen_beacon")
-        print(f"Found {len(posts)} jobs on page {current_page + 1}")
-
-        # Phase 1: Collect basic info quickly
-        print("\nPhase 1: Collecting basic job information...")
-        job_basics = []
-        for i, post in enumerate(posts):
-            print(f"  Collecting job {i + 1}/{len(posts)}...", end="\r")
-            basic_info = utils.get_job_basic_info(post)
-            if basic_info:
-                job_basics.append(basic_info)
-
-        print(f"\n✓ Collected {len(job_basics)} job listings")
-
-        # Save next page URL before closing
-        next_page_url = None
-        if page_num < num_pages - 1:
-            try:
-                next_button = driver.find_element(
-                    config.By.CSS_SELECTOR, "a[data-testid='pagination-page-next']")
-                next_page_url = next_button.get_attribute("href")
-                print(f"✓ Next page URL saved")
-            except config.NoSuchElementException:
-                print("⚠ No next page button found")
-
-        # Close browser to avoid detection
-        driver.quit()
-        print("✓ Closed listing page browser")
-
-        # Phase 2: Fetch descriptions in parallel
-        print(
-            f"\nPhase 2: Fetching job descriptions ({max_workers} parallel threads)...")
-        start_time = config.time.time()
-
-        with config.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_job = {
-                executor.submit(utils.process_job_with_description, job_data, i, len(job_basics)): job_data
-                for i, job_data in enumerate(job_basics)
-            }
-
-            for future in config.as_completed(future_to_job):
-                try:
-                    record = future.result()
-                    records.append(record)
-                except Exception as e:
-                    utils.safe_print(f"Error processing job: {e}")
-
-        elapsed_time = config.time.time() - start_time
-        print(
-            f"\n✓ Completed {len(job_basics)} jobs in {elapsed_time:.2f} seconds")
-        print(f"  Average: {elapsed_time/len(job_basics):.2f} seconds per job")
-        print(f"\n✓ Total jobs collected so far: {len(records)}")
-
-        # Create new driver for next page
-        if page_num < num_pages - 1 and next_page_url:
-            print("\nPreparing for next page...")
-            driver = utils.create_driver()
-            config.time.sleep(config.random.randint(
-                config.PAGE_SWITCH_MIN, config.PAGE_SWITCH_MAX))
-        elif page_num < num_pages - 1:
-            print("⚠ No next page available, stopping pagination")
-            break
+    # Phase 1: Load the result pages concurrently from their &start= offsets
+    print(f"\n{'='*80}")
+    print(f"SCRAPING PAGES {start_page + 1}-{start_page + num_pages}")
+    print(f"{'='*80}")
+    print(f"\nPhase 1: Collecting basic job information "
+          f"({min(config.LISTING_THREADS, num_pages)} pages at a time)...")
+    job_basics, pages_used = listing.fetch_pages(
+        job_title, city, state, start_page, num_pages)
+    if pages_used < num_pages:
+        print(f"⚠ Results end after {pages_used} pages")
+
+    print(f"\n✓ Collected {len(job_basics)} job listings")
+
+    # Skip reposts, sponsored copies and cards from known clusters
+    page_fingerprints = set()
+    fresh_jobs = []
+    for job_data in job_basics:
+        fp = dedup.fingerprint(*job_data[:3])
+        if dedup_index.is_known(*job_data[:3]) or (fp and fp in page_fingerprints):
+            skipped_duplicates += 1
+            continue
+        page_fingerprints.add(fp)
+        fresh_jobs.append(job_data)
+    if len(fresh_jobs) < len(job_basics):
+        print(f"✓ Skipped {len(job_basics) - len(fresh_jobs)} duplicate listings")
+    job_basics = fresh_jobs
+
+    # Phase 2: Fetch descriptions in parallel
+    threads_now = executor.limit if config.AUTOSCALE else max_workers
+    print(
+        f"\nPhase 2: Fetching job descriptions ({threads_now} parallel threads)...")
+    start_time = config.time.time()
+
+    new_records, failed_jobs = utils.fetch_descriptions(executor, job_basics)
+    for record in new_records:
+        records.append(record)
+        dedup_index.add(record.title, record.company, record.location, record.description)
+
+    if failed_jobs:
+        metrics.count("scrape_jobs_failed_total", len(failed_jobs))
+        print(f"\n⚠ {len(failed_jobs)} jobs failed (retryable errors get "
+              f"{config.BLOCK_MAX_RETRIES} retry rounds), not saved:")
+        for title, company, _, job_url in failed_jobs:
+            print(f"  {title} at {company}: {job_url}")
+
+    elapsed_time = config.time.time() - start_time
+    print(
+        f"\n✓ Completed {len(new_records)} jobs in {elapsed_time:.2f} seconds")
+    print(f"  Average: {elapsed_time/max(len(job_basics), 1):.2f} seconds per job")
 
 finally:
-    try:
-        driver.quit()
-    except:
-        pass
+    executor.shutdown()
 
 print(f"\n{'='*80}")
 print(f"SCRAPING COMPLETE")
 print(f"{'='*80}")
 print(f"Total jobs collected: {len(records)}")
+print(f"Duplicate listings skipped: {skipped_duplicates}")
+
+# Where the time went, plus failure and salary-miss counts
+metrics.count("scrape_jobs_total", len(records))
+metrics.count("scrape_duplicates_skipped_total", skipped_duplicates)
+metrics.REGISTRY.print_summary()
+detail_pages = metrics.REGISTRY.counter_value("scrape_detail_pages_total")
+if detail_pages:
+    missing = metrics.REGISTRY.counter_value("scrape_salary_missing_total")
+    print(f"Salary missing on {missing:g}/{detail_pages:g} detail pages "
+          f"({missing / detail_pages * 100:.1f}%)")
+print(f"Failed jobs: {metrics.REGISTRY.counter_value('scrape_jobs_failed_total'):g}")
+blocked = metrics.REGISTRY.counter_value("scrape_blocked_pages_total")
+if blocked:
+    print(f"Block pages: {blocked:g}, scraping paused "
+          f"{metrics.REGISTRY.counter_value('scrape_circuit_open_total'):g} times")
+if config.AUTOSCALE:
+    start_ts = executor.history[0][0]
+    print("Concurrency over time: " + ", ".join(
+        f"{limit} @ {ts - start_ts:.0f}s" for ts, limit, _ in executor.history))
+metrics.REGISTRY.write_prometheus(config.METRICS_PROM_FILE)
+print(f"Metrics written to {config.METRICS_PROM_FILE} and {config.METRICS_LOG}")
 print(f"\nFirst 3 jobs preview:")
 
 for i, record in enumerate(records[:3], 1):
     print(f"\n--- Job {i} ---")
-    print(f"Title: {record[0]}")
-    print(f"Company: {record[1]}")
-    print(f"Location: {record[2]}")
-    print(f"Salary: {record[3]}")
-    print(f"Description: {record[5][:150]}..." if len(
-        record[5]) > 150 else f"Description: {record[5]}")
+    print(f"Title: {record.title}")
+    print(f"Company: {record.company}")
+    print(f"Location: {record.location}")
+    print(f"Salary: {record.salary}")
+    print(f"Description: {record.description[:150]}..." if len(
+        record.description) > 150 else f"Description: {record.description}")
 
 if len(records) > 3:
     print(f"\n... and {len(records) - 3} more jobs")
@@ -159,8 +158,7 @@ print("Next step: Run save_data.ipynb to export your data")
 print(f"{'='*80}")
 
 if records:
-    df = config.pd.DataFrame(records, columns=[
-        "Title", "Company", "Location", "Salary", "URL", "Description"])
+    df = job_record.to_frame(records)
 
     print("\n" + "="*80)
     print("DATA QUALITY REPORT")
@@ -171,6 +169,19 @@ if records:
     print(
         f"Missing descriptions: {df['Description'].eq('None').sum()} ({df['Description'].eq('None').sum()/len(df)*100:.1f}%)")
 
+    # Numeric salary stage: min/max/mid, period and annualized value
+    df = salary.add_salary_columns(df, column="Salary")
+    parsed = df['salary_min'].notna().sum()
+    annualized = df['salary_annual'].notna().sum()
+    print(
+        f"Parsed salaries: {parsed} ({parsed/len(df)*100:.1f}%), "
+        f"{annualized} with a pay period (annualized)")
+    if annualized:
+        print(
+            f"Median annualized salary: ${df['salary_annual'].median():,.0f}")
+        print(f"\nSalary periods:")
+        print(df['salary_period'].value_counts())
+
     print(f"\nTop 5 companies:")
     print(df['Company'].value_counts().head())
 
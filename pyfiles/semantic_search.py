@@ -0,0 +1,345 @@
+# semantic_search.py — embedding search over scraped postings
+# Usage:  python semantic_search.py import indeed_jobs_DS.json [...] [--role DS]
+#         python semantic_search.py match resume.pdf [--top 10] [--role DS]
+#         python semantic_search.py query "machine learning platform" [--top 10]
+# Postings are embedded with a small CPU sentence-transformers model. Vectors
+# are appended to a float16 file in semantic_index/ and memory-mapped for
+# reads; postings.db maps row numbers to postings. Queries go through an HNSW
+# index (hnswlib) when it is installed and through one exact matrix product
+# over the memmap otherwise. With SEMANTIC_INDEX_ON_SAVE (off by default;
+# DFP_SEMANTIC_INDEX_ON_SAVE=1) utils.save_data adds every saved batch, so
+# the store grows with the scraper; otherwise run `import`. Postings already
+# embedded are skipped either way.
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from job_record import JobRecord, job_key, role_label
+
+INDEX_DIR = "semantic_index"
+# Small sentence-transformers model that runs comfortably on CPU
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_BATCH_SIZE = 32
+# Words per chunk; MiniLM truncates at 256 word pieces, so longer texts are
+# embedded chunk by chunk and averaged
+CHUNK_WORDS = 180
+# HNSW graph parameters (hnswlib defaults are M=16, ef_construction=200)
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+# Rows scored per block in the brute-force fallback
+SCAN_BLOCK = 65536
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    id INTEGER PRIMARY KEY,
+    role TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    url TEXT,
+    UNIQUE (role, job_key)
+);
+CREATE INDEX IF NOT EXISTS postings_role ON postings (role);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+WORD_RE = re.compile(r"\S+")
+
+
+class Match(NamedTuple):
+    score: float
+    role: str
+    title: str
+    company: str
+    location: str
+    url: str
+
+
+def chunk_text(text: str, words: int = CHUNK_WORDS) -> List[str]:
+    """Split text into runs of at most `words` words."""
+    tokens = WORD_RE.findall(text or "")
+    return [" ".join(tokens[i:i + words]) for i in range(0, len(tokens), words)] or [""]
+
+
+def posting_text(job: dict) -> str:
+    """Text embedded for one posting: title and company lead the description."""
+    parts = [job.get("title") or "", job.get("company") or "", job.get("description") or ""]
+    return ". ".join(p for p in parts if p and p != "None")
+
+
+class SemanticIndex:
+    def __init__(self, index_dir: str = INDEX_DIR, model_name: str = DEFAULT_MODEL,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Open (or create) the store in index_dir
+
+        Raises:
+            ValueError: If the store was built with a different model
+        """
+        os.makedirs(index_dir, exist_ok=True)
+        self.index_dir = index_dir
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.vectors_path = os.path.join(index_dir, "vectors.f16")
+        self.hnsw_path = os.path.join(index_dir, "hnsw.bin")
+        self._model = None
+        self._hnsw = None
+
+        self.conn = sqlite3.connect(os.path.join(index_dir, "postings.db"))
+        self.conn.executescript(SCHEMA)
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if meta.get("model", model_name) != model_name:
+            raise ValueError(f"{index_dir} holds {meta['model']} vectors, not {model_name}; "
+                             f"use another --dir or the same --model")
+        self.dim = int(meta["dim"]) if "dim" in meta else None
+        self.count = self.conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+        self.vectors = None
+        if self.dim:
+            stored = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+            if stored < self.count * self.dim * 2:
+                raise ValueError(f"{self.vectors_path} holds fewer vectors than postings.db "
+                                 f"lists; delete {index_dir} and import again")
+            # Vectors written before a crash but never committed are dropped
+            if stored > self.count * self.dim * 2:
+                os.truncate(self.vectors_path, self.count * self.dim * 2)
+            self._map()
+
+    @property
+    def model(self):
+        """CPU-pinned sentence-transformers model, loaded on first use."""
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model
+
+    def _map(self):
+        """(Re)open the vector file as a read-only memmap of count rows."""
+        self.vectors = (np.memmap(self.vectors_path, dtype=np.float16, mode="r",
+                                  shape=(self.count, self.dim))
+                        if self.count else np.zeros((0, self.dim), dtype=np.float16))
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Unit-length embeddings, one row per text. Long texts are split into
+        chunks whose embeddings are averaged.
+        """
+        chunks, owner = [], []
+        for i, text in enumerate(texts):
+            for chunk in chunk_text(text):
+                chunks.append(chunk)
+                owner.append(i)
+        encoded = self.model.encode(chunks, batch_size=self.batch_size,
+                                    normalize_embeddings=True, convert_to_numpy=True)
+        vectors = np.zeros((len(texts), encoded.shape[1]), dtype=np.float32)
+        np.add.at(vectors, np.array(owner), encoded)
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+    def _ann(self):
+        """hnswlib index covering every stored row, or None without hnswlib."""
+        try:
+            import hnswlib
+        except ImportError:
+            return None
+        if self._hnsw is None:
+            self._hnsw = hnswlib.Index(space="ip", dim=self.dim)
+            capacity = max(1024, self.count * 2)
+            if os.path.exists(self.hnsw_path):
+                self._hnsw.load_index(self.hnsw_path, max_elements=capacity)
+            else:
+                self._hnsw.init_index(max_elements=capacity, M=HNSW_M,
+                                      ef_construction=HNSW_EF_CONSTRUCTION)
+            self._hnsw.set_ef(HNSW_EF_SEARCH)
+        # Rows stored since the graph was last saved (or without hnswlib)
+        known = self._hnsw.get_current_count()
+        if known < self.count:
+            if self.count > self._hnsw.get_max_elements():
+                self._hnsw.resize_index(self.count * 2)
+            self._hnsw.add_items(np.asarray(self.vectors[known:], dtype=np.float32),
+                                 np.arange(known, self.count))
+            self._hnsw.save_index(self.hnsw_path)
+        return self._hnsw
+
+    def add_records(self, records, role: str) -> int:
+        """
+        Embed and store postings not yet in the index (same role and job key)
+
+        Args:
+            records: Job dicts or scraper record tuples
+            role: Role label or job title (normalized with role_label)
+
+        Returns:
+            Number of postings added
+        """
+        role = role_label(role)
+        new = {}
+        for job in records:
+            if not isinstance(job, dict):
+                job = dict(zip(JobRecord._fields, job))
+            key = job_key(job.get("url") or "", job.get("title") or "",
+                          job.get("company") or "", job.get("location") or "")
+            new.setdefault(key, job)
+        known = {key for (key,) in self.conn.execute(
+            "SELECT job_key FROM postings WHERE role = ?", (role,))}
+        todo = [(key, job) for key, job in new.items() if key not in known]
+        if not todo:
+            return 0
+
+        vectors = self.embed([posting_text(job) for _, job in todo])
+        first = self.dim is None
+        # Vectors first: rows (and, for the first batch, the dimension in
+        # meta) only count once their postings are committed
+        self.vectors = None
+        # The first batch also drops bytes an uncommitted first batch left
+        with open(self.vectors_path, "wb" if first else "ab") as f:
+            f.write(vectors.astype(np.float16).tobytes())
+        with self.conn:
+            if first:
+                self.conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                                      [("model", self.model_name),
+                                       ("dim", str(vectors.shape[1]))])
+            self.conn.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(self.count + i, role, key, job.get("title"), job.get("company"),
+                  job.get("location"), job.get("url")) for i, (key, job) in enumerate(todo)])
+        self.dim = vectors.shape[1]
+        self.count += len(todo)
+        self._map()
+        self._ann()
+        return len(todo)
+
+    def add_file(self, path: str, role: str) -> int:
+        with open(path, encoding="utf-8") as f:
+            return self.add_records(json.load(f), role)
+
+    def _scan(self, query: np.ndarray, k: int, rows: Optional[np.ndarray] = None):
+        """Exact top k by inner product over all rows (or the given rows)."""
+        if rows is None:
+            scores = np.concatenate([
+                np.asarray(self.vectors[i:i + SCAN_BLOCK], dtype=np.float32) @ query
+                for i in range(0, self.count, SCAN_BLOCK)])
+            rows = np.arange(self.count)
+        else:
+            scores = np.asarray(self.vectors[rows], dtype=np.float32) @ query
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return rows[top], scores[top]
+
+    def search_vector(self, query: np.ndarray, k: int = 10, role: Optional[str] = None) -> List[Match]:
+        """
+        Nearest stored postings to a unit-length query vector
+
+        A role filter scans that role's rows exactly; otherwise the HNSW
+        index answers when hnswlib is installed.
+        """
+        if not self.count:
+            return []
+        query = np.asarray(query, dtype=np.float32).ravel()
+        if role:
+            rows = np.array([row for (row,) in self.conn.execute(
+                "SELECT id FROM postings WHERE role = ?", (role_label(role),))], dtype=np.int64)
+            if not len(rows):
+                return []
+            ids, scores = self._scan(query, k, rows)
+        else:
+            ann = self._ann()
+            if ann is None:
+                ids, scores = self._scan(query, k)
+            else:
+                ann.set_ef(max(HNSW_EF_SEARCH, k))
+                labels, distances = ann.knn_query(query, k=min(k, self.count))
+                ids, scores = labels[0], 1 - distances[0]
+
+        placeholders = ",".join("?" * len(ids))
+        rows = {row[0]: row[1:] for row in self.conn.execute(
+            f"SELECT id, role, title, company, location, url FROM postings"
+            f" WHERE id IN ({placeholders})", [int(i) for i in ids])}
+        return [Match(round(float(s), 4), *rows[int(i)]) for i, s in zip(ids, scores)]
+
+    def search(self, text: str, k: int = 10, role: Optional[str] = None) -> List[Match]:
+        """Top k postings for free text or a resume's text."""
+        return self.search_vector(self.embed([text])[0], k, role)
+
+    def close(self):
+        self.conn.close()
+
+
+def index_records(records, role: str, index_dir: str = INDEX_DIR) -> int:
+    """Add freshly scraped records to the on-disk embedding store."""
+    index = SemanticIndex(index_dir)
+    try:
+        return index.add_records(records, role)
+    finally:
+        index.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Embedding search over scraped jobs")
+    parser.add_argument("--dir", default=INDEX_DIR)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="Embed role JSON files into the store")
+    imp.add_argument("files", nargs="+")
+    imp.add_argument("--role", default=None, help="Role label (default: from file name)")
+
+    for name, target, help_text in (("match", "resume", "Postings closest to a resume (PDF or text)"),
+                                    ("query", "text", "Postings closest to free text")):
+        find = sub.add_parser(name, help=help_text)
+        find.add_argument(target)
+        find.add_argument("--role")
+        find.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    index = SemanticIndex(args.dir, args.model)
+    try:
+        if args.command == "import":
+            for path in args.files:
+                role = role_label(args.role or path)
+                start = time.perf_counter()
+                added = index.add_file(path, role)
+                print(f"✓ {path} ({role}): {added} new postings embedded "
+                      f"in {time.perf_counter() - start:.1f}s")
+            print(f"{index.count} postings in {args.dir}")
+            return
+
+        if args.command == "match":
+            if args.resume.lower().endswith(".pdf"):
+                from resume_parser import ResumeParser
+                text = ResumeParser.extract_text(args.resume)
+            else:
+                with open(args.resume, encoding="utf-8") as f:
+                    text = f.read()
+        else:
+            text = args.text
+        query = index.embed([text])[0]
+        start = time.perf_counter()
+        matches = index.search_vector(query, args.top, args.role)
+        elapsed = (time.perf_counter() - start) * 1000
+        for i, m in enumerate(matches, 1):
+            location = m.location.splitlines()[0] if m.location else "N/A"
+            print(f"[{i}] {m.score:.3f}  {m.title} at {m.company} ({m.role}) | {location}")
+            if m.url:
+                print(f"     {m.url}")
+        print(f"\n{len(matches)} of {index.count} postings in {elapsed:.1f} ms "
+              f"({'exact scan' if args.role or index._hnsw is None else 'HNSW'})")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import random
+
+import pandas as pd
+
+from dedup import (BANDS, ROWS, NUM_PERM, DedupIndex, MinHashLSH, drop_duplicates,
+                   fingerprint, minhash, similarity)
+
+WORDS = [f"w{i}" for i in range(2000)]
+
+
+def text_pair(rng, jaccard, size=400):
+    """Two texts of distinct words whose 5-gram sets have roughly the given Jaccard."""
+    words = rng.sample(WORDS, size)
+    # Replacing k words in the middle changes k + 4 of the n shingles on
+    # each side, and Jaccard = (n - d) / (n + d)
+    shingles = size - 4
+    changed = round(shingles * (1 - jaccard) / (1 + jaccard)) - 4
+    other = list(words)
+    start = size // 2
+    other[start:start + changed] = [f"x{i}" for i in range(changed)]
+    return " ".join(words), " ".join(other)
+
+
+def test_signature_shape_and_estimate():
+    rng = random.Random(0)
+    a, b = text_pair(rng, 0.8)
+    sig_a, sig_b = minhash(a), minhash(b)
+    assert BANDS * ROWS == NUM_PERM == len(sig_a)
+    assert abs(similarity(sig_a, sig_b) - 0.8) < 0.12
+    assert similarity(sig_a, sig_a) == 1.0
+    assert minhash("") is None
+
+
+def test_banding_recall_at_threshold():
+    rng = random.Random(1)
+    found = 0
+    for trial in range(200):
+        a, b = text_pair(rng, 0.8)
+        lsh = MinHashLSH(threshold=0.0)
+        lsh.insert(0, minhash(a))
+        found += lsh.query(minhash(b)) == [0]
+    assert found == 200
+
+
+def test_unrelated_texts_not_matched():
+    rng = random.Random(2)
+    lsh = MinHashLSH()
+    lsh.insert(0, minhash(" ".join(rng.sample(WORDS, 300))))
+    assert lsh.query(minhash(" ".join(rng.sample(WORDS, 300)))) == []
+
+
+def test_fingerprint():
+    assert fingerprint("Data Scientist", "ACME, Inc.", "Austin, TX\n(area)") == \
+        fingerprint("data scientist", "acme inc", "Austin, TX")
+    assert fingerprint("", "", "") == ""
+
+
+def test_clusters_reposts_and_copies():
+    rng = random.Random(3)
+    body, repost = text_pair(rng, 0.9)
+    df = pd.DataFrame({
+        "title": ["Data Engineer", "Data Engineer", "Analyst", "Data Engineer"],
+        "company": ["A", "A", "B", "A"],
+        "location": ["Plano, TX", "Remote", "Austin, TX", "Plano, TX"],
+        "description": [body, repost, " ".join(rng.sample(WORDS, 300)), "None"],
+    })
+    index = DedupIndex.from_frame(df)
+    assert index.cluster_ids() == [0, 0, 2, 0]
+    assert index.is_known("Data Engineer", "A", "Plano, TX")
+    assert not index.is_known("Data Engineer", "A", "Dallas, TX")
+    assert len(drop_duplicates(df)) == 2
@@ -0,0 +1,54 @@
+import os
+import shutil
+import subprocess
+import time
+
+import psutil
+import pytest
+
+from driver_supervisor import DriverSupervisor
+
+
+@pytest.fixture
+def fake_driver(tmp_path):
+    """A child process named like chromedriver that nobody registered."""
+    sleep = shutil.which("sleep")
+    if sleep is None:
+        pytest.skip("needs sleep")
+    exe = tmp_path / "chromedriver"
+    os.symlink(sleep, exe)
+    proc = subprocess.Popen([str(exe), "30"])
+    time.sleep(0.2)
+    yield proc
+    proc.kill()
+    proc.wait()
+
+
+def alive(proc):
+    return proc.poll() is None
+
+
+def test_young_unregistered_driver_is_spared(fake_driver):
+    supervisor = DriverSupervisor()
+    assert psutil.Process(fake_driver.pid).name() == "chromedriver"
+    assert supervisor.reap_orphans(startup_grace=60) == 0
+    assert alive(fake_driver)
+
+
+def test_launch_in_progress_protects_its_processes(fake_driver):
+    supervisor = DriverSupervisor()
+    supervisor.launches[0] = time.time() - 5
+    assert supervisor.reap_orphans(startup_grace=0) == 0
+    assert alive(fake_driver)
+
+    supervisor.launches.clear()
+    assert supervisor.reap_orphans(startup_grace=0) == 1
+    fake_driver.wait(timeout=5)
+    assert not alive(fake_driver)
+
+
+def test_launching_tracks_and_clears():
+    supervisor = DriverSupervisor()
+    with supervisor.launching():
+        assert len(supervisor.launches) == 1
+    assert supervisor.launches == {}
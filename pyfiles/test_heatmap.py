@@ -0,0 +1,68 @@
+import os
+
+import pandas as pd
+
+from heatmap import CompensationHeatmap
+
+ROWS = [
+    {"region_id": "1", "region_name": "Bay Area", "detailed_location": "San Francisco, CA",
+     "rank": 1, "p50": 200000, "normalizedMedian": 1.2},
+    {"region_id": "2", "region_name": "LA", "detailed_location": "Los Angeles, CA",
+     "rank": 3, "p50": 160000, "normalizedMedian": 1.0},
+    {"region_id": "3", "region_name": "Seattle", "detailed_location": "Seattle, WA",
+     "rank": 2, "p50": 190000, "normalizedMedian": 1.1},
+]
+
+
+def write_csv(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+
+def test_state_aggregate(tmp_path):
+    heatmap = CompensationHeatmap(write_csv(tmp_path / "regions.csv", ROWS))
+    heatmap.load_data()
+    states = heatmap.state_df.set_index("state_code")
+    assert sorted(states.index) == ["CA", "WA"]
+    assert states.loc["CA", "p50"] == 180000
+    assert states.loc["CA", "rank"] == 1
+    assert heatmap.df["detailed_location"].dtype == "category"
+
+
+def test_aggregate_cached_until_content_changes(tmp_path):
+    path = write_csv(tmp_path / "regions.csv", ROWS)
+    first = CompensationHeatmap(path)
+    first.load_data()
+    second = CompensationHeatmap(path)
+    second.load_data()
+    assert second.state_df is first.state_df
+
+    # Same content, new mtime: still cached
+    os.utime(path, ns=(0, 0))
+    second.load_data()
+    assert second.state_df is first.state_df
+
+    write_csv(path, ROWS[:1])
+    second.load_data()
+    assert second.state_df is not first.state_df
+    assert list(second.state_df["state_code"]) == ["CA"]
+
+
+def test_multi_part_locations_keep_their_state(tmp_path):
+    rows = ROWS + [{"region_id": "4", "region_name": "Inland Empire",
+                    "detailed_location": "Los Angeles, Riverside, Orange County, CA",
+                    "rank": 4, "p50": 140000, "normalizedMedian": 0.9}]
+    heatmap = CompensationHeatmap(write_csv(tmp_path / "regions.csv", rows))
+    heatmap.load_data()
+    states = heatmap.state_df.set_index("state_code")
+    assert states.loc["CA", "p50"] == 500000 / 3
+
+
+def test_html_reports_embed_plotlyjs(tmp_path):
+    class Figure:
+        def write_html(self, path, **kwargs):
+            self.kwargs = kwargs
+
+    fig = Figure()
+    CompensationHeatmap.save(fig, str(tmp_path / "map.html"))
+    assert fig.kwargs["include_plotlyjs"] is True
@@ -0,0 +1,128 @@
+import argparse
+import json
+import sqlite3
+
+import pytest
+
+from job_index import JobIndex, index_records
+from job_record import JobRecord, role_label
+
+
+def posting(jk, title="Data Scientist", description="python sql"):
+    return {"title": title, "company": "ACME", "location": "Austin, TX 78701",
+            "salary": "$100,000 a year", "url": f"https://www.indeed.com/viewjob?jk={jk}",
+            "description": description}
+
+
+@pytest.fixture
+def role_file(tmp_path):
+    path = tmp_path / "indeed_jobs_DS.json"
+    path.write_text(json.dumps([posting("a"), posting("b")]), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = JobIndex(str(tmp_path / "jobs.db"))
+    yield index
+    index.close()
+
+
+def count(index, role="DS"):
+    return index.count(role)
+
+
+@pytest.mark.parametrize("name", ["Data Scientist", "data_scientist", " DS ", "ds",
+                                  "indeed_jobs_DS.json", "indeed_job_data scientist.json"])
+def test_role_label(name):
+    assert role_label(name) == "DS"
+
+
+def test_role_label_other_titles():
+    assert role_label("Product Manager") == "product_manager"
+
+
+def test_sync_keeps_live_inserts(index, role_file, tmp_path):
+    assert index.sync_file(str(role_file), "DS")
+    assert count(index) == 2
+
+    # The scraper saves under the raw job title
+    index_records([JobRecord.create(**posting("c"))],
+                  "data_scientist", index.db_path)
+    assert count(index) == 3
+
+    role_file.write_text(json.dumps([posting("a"), posting("b"), posting("d")]), encoding="utf-8")
+    assert index.sync_file(str(role_file), "DS")
+    assert count(index) == 4
+
+
+def test_prune_only_removes_rows_the_file_indexed(index, role_file):
+    index.sync_file(str(role_file), "DS")
+    index.add_records([posting("live")], "Data Scientist")
+    role_file.write_text(json.dumps([posting("a")]), encoding="utf-8")
+    index.sync_file(str(role_file), "DS")
+
+    assert index.prune(str(role_file), "DS") == 1
+    keys = {row[0] for row in index.conn.execute("SELECT job_key FROM jobs")}
+    assert keys == {"a", "live"}
+
+
+def test_unchanged_rows_not_rewritten(index, role_file):
+    index.sync_file(str(role_file), "DS")
+    assert index.add_records([posting("a")], "DS", source=str(role_file)) == 0
+    assert index.add_records([posting("a", description="rust")], "DS") == 1
+
+
+def test_search_accepts_any_role_spelling(index):
+    index.add_records([posting("a", description="spark airflow pipelines")], "data scientist")
+    assert [row["title"] for row in index.search("airflow", role="DS")] == ["Data Scientist"]
+    assert index.search("airflow", role="Data Scientist", location="TX")
+
+
+def test_old_index_files_are_migrated(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE jobs (id INTEGER PRIMARY KEY, role TEXT NOT NULL,"
+                 " job_key TEXT NOT NULL, title TEXT, company TEXT, location TEXT,"
+                 " city TEXT, state TEXT, salary TEXT, salary_annual REAL, url TEXT,"
+                 " description TEXT, UNIQUE (role, job_key))")
+    conn.commit()
+    conn.close()
+    index = JobIndex(path)
+    try:
+        assert index.add_records([posting("a")], "DS") == 1
+        assert index.get(1)["source"] is None
+    finally:
+        index.close()
+
+
+def test_detail_fields_survive_index_and_export(index, tmp_path):
+    import distributed
+
+    record = JobRecord.create(**posting("a"), job_type="Full-time",
+                              benefits="401(k)\nDental", date_posted="Posted 3 days ago")
+    index.add_records([record], "DS")
+    assert index.add_records([record._replace(job_type="Contract")], "DS") == 1
+
+    out = tmp_path / "export.json"
+    distributed.export(argparse.Namespace(role="Data Scientist", db=index.db_path, out=str(out)))
+    [job] = json.loads(out.read_text(encoding="utf-8"))
+    assert (job["job_type"], job["benefits"], job["date_posted"]) == \
+        ("Contract", "401(k)\nDental", "Posted 3 days ago")
+
+
+def test_sync_same_file_by_relative_and_absolute_path(index, role_file, monkeypatch):
+    monkeypatch.chdir(role_file.parent)
+    assert index.sync_file(role_file.name, "DS")
+    assert not index.sync_file(str(role_file), "DS")
+    assert index.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0] == 1
+
+
+def test_corrected_company_and_url_are_written(index):
+    index.add_records([posting("a")], "DS")
+    fixed = dict(posting("a"), company="ACME Corp")
+    assert index.add_records([fixed], "DS") == 1
+    moved = dict(fixed, url=fixed["url"] + "&from=serp")
+    assert index.add_records([moved], "DS") == 1
+    row = index.get(1)
+    assert (row["company"], row["url"]) == ("ACME Corp", moved["url"])
@@ -0,0 +1,43 @@
+import pytest
+
+from job_record import EXPORT_HEADERS, JobRecord, as_records, job_key, to_frame
+
+URL = "https://www.indeed.com/rc/clk?jk=98bf3f98c18a89d7&from=serp"
+
+
+def test_job_key_prefers_jk():
+    assert job_key(URL) == "98bf3f98c18a89d7"
+
+
+def test_job_key_falls_back_to_hashes():
+    url = "https://example.com/jobs/1"
+    assert job_key(url) == job_key(url, "other", "fields") != job_key("https://example.com/jobs/2")
+    assert job_key("", "Data Scientist", "ACME", "Austin, TX") == \
+        job_key("", "Data Scientist", "ACME", "Austin, TX")
+    assert job_key("", "Data Scientist", "ACME", "Austin, TX") != \
+        job_key("", "Data Scientist", "ACME", "Dallas, TX")
+
+
+def test_create_fills_defaults_and_interns():
+    a = JobRecord.create("T", "".join(["AC", "ME"]), "Austin, TX", None, URL, None)
+    b = JobRecord.create("T", "ACME", "Austin, TX", "", URL, "text")
+    assert a.salary == "" and a.description == "None"
+    assert a.company is b.company
+    assert a.job_id == "98bf3f98c18a89d7"
+
+
+def test_as_records_accepts_legacy_tuples():
+    record = JobRecord("T", "C", "L", "S", URL, "D")
+    legacy = ("T", "C", "L", "S", URL, "D")
+    converted = as_records([record, legacy])
+    assert converted[0] is record
+    assert converted[1] == record and converted[1].job_type == ""
+
+
+@pytest.mark.parametrize("records", [[], [JobRecord("T", "C", "L", "S", URL, "D", "Full-time")]])
+def test_to_frame_headers(records):
+    df = to_frame(records)
+    assert list(df.columns) == EXPORT_HEADERS
+    assert len(df) == len(records)
+    if records:
+        assert df.loc[0, "Job Type"] == "Full-time"
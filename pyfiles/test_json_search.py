@@ -0,0 +1,37 @@
+from json_search import find_first, find_key
+from run_all import find_regions_dict, looks_like_regions_dict
+
+
+def region(i):
+    return {"primary_name": f"Region {i}", "secondary_name": f"City {i}, CA",
+            "p10": 1, "p25": 2, "p50": 3, "p75": 4, "p90": 5}
+
+
+def test_finds_nested_regions_dict():
+    regions = {str(i): region(i) for i in range(5)}
+    payload = {"props": {"pageProps": {"header": [{"id": 1}], "dma": regions}}}
+    assert find_regions_dict(payload) is regions
+
+
+def test_metadata_entries_before_region_rows():
+    regions = {"updated": "2024-01-01", "currency": "USD", "count": 7}
+    regions.update({str(i): region(i) for i in range(7)})
+    assert looks_like_regions_dict(regions)
+    assert find_regions_dict({"data": regions}) is regions
+
+
+def test_miss_returns_none():
+    assert find_regions_dict({"a": [{"p50": 1}, {"b": [1, 2, 3]}]}) is None
+    assert find_regions_dict("not a payload") is None
+
+
+def test_find_first_prune_skips_subtree():
+    payload = {"skip": {"target": {"x": 1}}}
+    assert find_first(payload, lambda d: "x" in d) == {"x": 1}
+    assert find_first(payload, lambda d: "x" in d, prune=lambda d: "target" in d) is None
+
+
+def test_find_key_document_order():
+    payload = {"a": {"id": None, "b": {"id": 1}}, "c": {"id": 2}}
+    assert find_key(payload, "id") == 1
+    assert find_key([1, 2], "id") is None
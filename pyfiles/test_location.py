@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from location import extract_state_codes, join_regions, normalize_locations, parse_location
+
+
+@pytest.mark.parametrize("text, city, state, zip_code", [
+    ("Arlington, VA 22201 \n(Bluemont area)", "Arlington", "VA", "22201"),
+    ("Remote in Chicago, IL", "Chicago", "IL", None),
+    ("Hybrid work in New York, NY 10017", "New York", "NY", "10017"),
+    ("Los Angeles, Riverside, Orange County, CA", "Los Angeles", "CA", None),
+    ("Austin, TX, US", "Austin", "TX", None),
+    ("North Carolina", None, "NC", None),
+    ("New York State", None, "NY", None),
+    ("Remote", None, None, None),
+    ("", None, None, None),
+])
+def test_parse_location(text, city, state, zip_code):
+    loc = parse_location(text)
+    assert (loc.city, loc.state, loc.zip) == (city, state, zip_code)
+
+
+def test_flags_area_and_metro():
+    loc = parse_location("Hybrid work in Arlington, VA 22201 \n(Bluemont area)")
+    assert loc.hybrid and not loc.remote
+    assert loc.area == "Bluemont"
+    assert loc.metro == "Washington DC Area"
+
+
+def test_extract_state_codes_multi_part_and_categorical():
+    locations = pd.Series(["Los Angeles, Riverside, Orange County, CA",
+                           "Seattle, WA", None, "Seattle, WA"], dtype="category")
+    states = extract_state_codes(locations)
+    assert states.tolist()[:2] == ["CA", "WA"]
+    assert pd.isna(states.iloc[2])
+    assert states.iloc[3] == "WA"
+
+
+def test_normalize_keeps_index():
+    parsed = normalize_locations(pd.Series(["Seattle, WA", None], index=[5, 9]))
+    assert list(parsed.index) == [5, 9]
+    assert parsed.loc[5, "state"] == "WA"
+
+
+def test_join_regions_metro_then_state_fallback():
+    regions = pd.DataFrame({
+        "region_name": ["Greater Chicago Area", "Springfield Area"],
+        "detailed_location": ["Chicago, IL", "Springfield, Champaign, IL"],
+        "p50": [150000.0, 100000.0],
+    })
+    jobs = pd.DataFrame({"location": ["Chicago, IL", "Peoria, IL", "Remote"]})
+    joined = join_regions(jobs, regions)
+    assert joined["p50"].tolist()[:2] == [150000.0, 125000.0]
+    assert pd.isna(joined.loc[2, "p50"])
+
+
+@pytest.mark.parametrize("text, remote, hybrid", [
+    ("Hybrid remote in Boston, MA", False, True),
+    ("Hybrid work in Boston, MA", False, True),
+    ("Remote in Boston, MA", True, False),
+    ("Remote", True, False),
+    ("Boston, MA", False, False),
+])
+def test_work_mode_flags(text, remote, hybrid):
+    loc = parse_location(text)
+    assert (loc.remote, loc.hybrid) == (remote, hybrid)
+    if "," in text:
+        assert (loc.city, loc.state) == ("Boston", "MA")
@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from salary import EMPTY_SALARY, add_salary_columns, parse_salary, parse_salary_column
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$50,800 - $119,200 a year", (50800, 119200, 85000, "year", 85000)),
+    ("$25.90 an hour", (25.9, 25.9, 25.9, "hour", 25.9 * 2080)),
+    ("From $40 an hour", (40, None, 40, "hour", 40 * 2080)),
+    ("Up to $46 an hour", (None, 46, 46, "hour", 46 * 2080)),
+    ("$120K - $150K", (120000, 150000, 135000, None, None)),
+])
+def test_parse_salary(text, expected):
+    result = parse_salary(text)
+    assert result.period == expected[3]
+    for got, want in zip(result, expected):
+        if isinstance(want, str):
+            continue
+        assert got is None if want is None else got == pytest.approx(want)
+
+
+@pytest.mark.parametrize("text", ["", "Full-time", "Competitive pay"])
+def test_no_amount(text):
+    assert parse_salary(text) == EMPTY_SALARY
+
+
+def test_column_keeps_index_and_handles_missing():
+    salaries = pd.Series(["$100,000 a year", None, "$100,000 a year", "Full-time"],
+                         index=[10, 11, 12, 13])
+    parsed = parse_salary_column(salaries)
+    assert list(parsed.index) == [10, 11, 12, 13]
+    assert parsed.loc[10, "annual"] == 100000
+    assert parsed.loc[12, "annual"] == 100000
+    assert parsed[["annual"]].loc[[11, 13]].isna().all().all()
+
+
+def test_column_accepts_categorical():
+    salaries = pd.Series(["$30 an hour", None, "$30 an hour"], dtype="category")
+    parsed = parse_salary_column(salaries)
+    assert parsed["annual"].tolist()[0] == 30 * 2080
+    assert pd.isna(parsed.loc[1, "annual"])
+
+
+def test_add_salary_columns():
+    df = pd.DataFrame({"salary": ["$50 an hour", ""]})
+    out = add_salary_columns(df)
+    assert out.loc[0, "salary_annual"] == 50 * 2080
+    assert out.loc[0, "salary_period"] == "hour"
+    assert pd.isna(out.loc[1, "salary_annual"])
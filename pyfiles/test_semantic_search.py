@@ -0,0 +1,100 @@
+import zlib
+
+import numpy as np
+import pytest
+
+from semantic_search import SemanticIndex, chunk_text
+
+DIM = 16
+
+
+class FakeModel:
+    """Deterministic bag-of-words embedding, so tests never load a real model."""
+
+    def encode(self, texts, **kwargs):
+        vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+        for row, text in zip(vectors, texts):
+            for word in text.lower().split():
+                row[zlib.crc32(word.strip(".,").encode()) % DIM] += 1
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+
+def posting(jk, title, description):
+    return {"title": title, "company": "ACME", "location": "Austin, TX",
+            "url": f"https://www.indeed.com/viewjob?jk={jk}", "description": description}
+
+
+def open_index(path):
+    index = SemanticIndex(str(path))
+    index._model = FakeModel()
+    return index
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = open_index(tmp_path)
+    yield index
+    index.close()
+
+
+def test_chunk_text():
+    assert chunk_text("a b c d e", words=2) == ["a b", "c d", "e"]
+    assert chunk_text("") == [""]
+
+
+def test_add_is_incremental_and_survives_reopen(index, tmp_path):
+    jobs = [posting("a", "Data Scientist", "python pandas"),
+            posting("b", "Data Engineer", "spark airflow")]
+    assert index.add_records(jobs, "Data Scientist") == 2
+    assert index.add_records(jobs + [posting("c", "Analyst", "excel sql")], "DS") == 1
+    index.close()
+
+    reopened = open_index(tmp_path)
+    try:
+        assert reopened.count == 3 and reopened.vectors.shape == (3, DIM)
+        assert reopened.search("spark airflow", k=1)[0].title == "Data Engineer"
+    finally:
+        reopened.close()
+
+
+def test_role_filter(index):
+    index.add_records([posting("a", "Data Scientist", "python")], "DS")
+    index.add_records([posting("b", "Analyst", "python")], "Data Analyst")
+    assert [m.role for m in index.search("python", role="Data Scientist")] == ["DS"]
+    assert index.search("python", role="Nurse") == []
+
+
+def test_uncommitted_first_batch_leaves_no_dimension(index, tmp_path):
+    # Vectors of a first batch whose postings were never committed
+    with open(index.vectors_path, "wb") as f:
+        f.write(b"\0" * DIM * 2)
+    index.close()
+
+    reopened = open_index(tmp_path)
+    try:
+        assert reopened.dim is None
+        assert reopened.add_records([posting("a", "Data Scientist", "python")], "DS") == 1
+        assert reopened.vectors.shape == (1, DIM)
+    finally:
+        reopened.close()
+
+
+def test_hnsw_agrees_with_exact_scan(index):
+    pytest.importorskip("hnswlib")
+    words = [f"w{i}" for i in range(40)]
+    rng = np.random.default_rng(0)
+    index.add_records([posting(str(i), f"Job {i}", " ".join(rng.choice(words, 8)))
+                       for i in range(200)], "DS")
+    query = index.embed(["w1 w2 w3"])[0]
+    _, exact = index._scan(query, 5)
+    ann = [m.score for m in index.search_vector(query, 5)]
+    assert ann == pytest.approx(exact.tolist(), abs=1e-3)
+
+
+def test_missing_vector_file_is_reported(index, tmp_path):
+    index.add_records([posting("a", "Data Scientist", "python")], "DS")
+    index.close()
+    (tmp_path / "vectors.f16").unlink()
+    with pytest.raises(ValueError, match="fewer vectors"):
+        SemanticIndex(str(tmp_path))
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from title_classifier import (TAG_COLUMNS, TitleClassifier, TitleReference, normalize_title,
+                              title_variants)
+
+REFERENCES = [
+    TitleReference("15-2051.00", "Data Scientists", "Data Scientist", "Data Scientist"),
+    TitleReference("15-1243.00", "Database Architects", "Data Engineer", "Data Engineer"),
+    TitleReference("15-1252.00", "Software Developers", "Software Engineer", "Software Engineer"),
+    TitleReference("15-1252.00", "Software Developers", "Software Engineer", "Software Developer"),
+]
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return TitleClassifier(REFERENCES)
+
+
+@pytest.mark.parametrize("title, normalized", [
+    ("Sr. Data Engineer II (Azure) - Remote", "data engineer"),
+    ("SWE, Payments", "software engineer payments"),
+    ("Lead ML Eng", "machine learning engineer"),
+    ("", ""),
+    (None, ""),
+])
+def test_normalize_title(title, normalized):
+    assert normalize_title(title) == normalized
+
+
+def test_title_variants():
+    assert title_variants("Canadian English - Data Quality Analyst") == (
+        "canadian english", "data quality analyst")
+    assert title_variants("Senior Data Scientist") == ("data scientist",)
+    assert title_variants("") == ("",)
+    assert title_variants(None) == ("",)
+
+
+def test_matrix_is_sparse(classifier):
+    assert classifier.matrix.shape == (len(classifier.vocab), len(classifier.references))
+    assert classifier.matrix.nnz < classifier.matrix.shape[0] * classifier.matrix.shape[1] / 2
+
+
+def test_classify(classifier):
+    match = classifier.classify("Sr. Software Engineer II - Remote")
+    assert match.onet_code == "15-1252.00" and match.title_confidence == 1.0
+    assert classifier.classify("Registered Nurse").onet_code is None
+
+
+def test_tag_titles_handles_missing_and_duplicate_titles(classifier):
+    df = pd.DataFrame({"title": ["Data Scientist", None, "Senior Data Scientist",
+                                 "Data Scientist", "", "Registered Nurse"]})
+    tagged = classifier.tag_titles(df)
+    assert list(tagged.columns) == ["title"] + TAG_COLUMNS
+    assert tagged["onet_code"].tolist() == ["15-2051.00", None, "15-2051.00", "15-2051.00",
+                                            None, None]
+    assert tagged.loc[1, "title_confidence"] == 0.0
+    assert tagged.loc[0, "onet_role"] == "Data Scientist"
+
+
+def test_tag_titles_all_missing(classifier):
+    tagged = classifier.tag_titles(pd.DataFrame({"title": [None, None]}))
+    assert tagged["onet_code"].tolist() == [None, None]
+    assert classifier.tag_titles(pd.DataFrame({"title": []}))["onet_code"].empty
@@ -0,0 +1,60 @@
+import os
+
+import config
+import utils
+
+
+def test_cache_slots_are_reused(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CHROME_CACHE_DIR", str(tmp_path))
+    first, second = utils.claim_cache_slot(), utils.claim_cache_slot()
+    assert first != second
+    utils.release_cache_slot(first)
+    assert utils.claim_cache_slot() == first
+    utils.release_cache_slot(first)
+    utils.release_cache_slot(second)
+
+    # Many short-lived drivers, two at a time, share two directories
+    for _ in range(50):
+        slots = [utils.claim_cache_slot() for _ in range(2)]
+        for slot in slots:
+            utils.chrome_cache_dir(slot)
+            utils.release_cache_slot(slot)
+    assert sorted(os.listdir(tmp_path)) == ["slot-0", "slot-1"]
+
+
+def test_wait_selector_drops_attribute_suffixes():
+    table = {"description": {"selectors": ["#jobDescriptionText",
+                                           "meta[name=description]@content",
+                                           "meta[name=description]@value"]}}
+    assert utils.wait_selector(table) == "#jobDescriptionText, meta[name=description]"
+
+
+def test_wait_selector_for_shipped_table():
+    table = utils.load_detail_selectors()
+    assert "@" not in utils.wait_selector(table)
+
+
+def test_fetch_descriptions_retries_jobs_refused_by_admission(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import driver_supervisor
+    from job_record import JobRecord
+
+    monkeypatch.setattr(config, "BLOCK_MAX_RETRIES", 2)
+    calls = {}
+
+    def process(job_data, index, total):
+        title = job_data[0]
+        calls[title] = calls.get(title, 0) + 1
+        if title == "refused" and calls[title] == 1:
+            raise driver_supervisor.MemoryPressureError("memory short")
+        if title == "bug":
+            raise KeyError("description")
+        return JobRecord.create(title, "C", "L", "", job_data[3], "text")
+
+    jobs = [("refused", "C", "L", "u1"), ("ok", "C", "L", "u2"), ("bug", "C", "L", "u3")]
+    with ThreadPoolExecutor(2) as executor:
+        records, failed = utils.fetch_descriptions(executor, jobs, process)
+    assert sorted(r.title for r in records) == ["ok", "refused"]
+    assert calls == {"refused": 2, "ok": 1, "bug": 1}
+    assert failed == [("bug", "C", "L", "u3")]
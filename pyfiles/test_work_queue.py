@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+import work_queue
+from work_queue import WorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(str(tmp_path / "queue.db"), visibility_timeout=60, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_enqueue_deduplicates_by_key(queue):
+    assert queue.enqueue("page", {"url": "u1"}, key="u1")
+    assert not queue.enqueue("page", {"url": "u1"}, key="u1")
+    assert queue.counts() == {"page": {"ready": 1}}
+
+
+def test_lease_hides_task_until_it_expires(queue):
+    queue.enqueue("job", {"n": 1})
+    task = queue.lease("w1")
+    assert task.attempts == 1 and task.payload == {"n": 1}
+    assert queue.lease("w2") is None
+
+    queue.conn.execute("UPDATE tasks SET lease_expires = 0")
+    again = queue.lease("w2")
+    assert again.id == task.id and again.attempts == 2
+    # The first worker lost its lease
+    assert not queue.complete(task, "w1")
+    assert queue.complete(again, "w2")
+
+
+def test_fail_retries_with_backoff_then_dead_letters(queue, monkeypatch):
+    monkeypatch.setattr(work_queue, "RETRY_BACKOFF", 0)
+    queue.enqueue("job", {"n": 1})
+    assert queue.fail(queue.lease("w"), "w", "TimeoutException") == "ready"
+    assert queue.fail(queue.lease("w"), "w", "TimeoutException") == "dead"
+    assert queue.lease("w") is None
+    assert queue.dead_letters() == [(1, "job", '{"n": 1}', 2, "TimeoutException")]
+
+    assert queue.requeue_dead() == 1
+    assert queue.lease("w").attempts == 1
+
+
+def test_requeue_resets_finished_tasks_only(queue):
+    queue.enqueue("page", {"url": "u1"}, key="u1")
+    queue.enqueue("page", {"url": "u2"}, key="u2")
+    queue.complete(queue.lease("w"), "w")
+    leased = queue.lease("w")
+
+    # A second coordinator run: the finished page comes back, the leased one stays
+    assert queue.enqueue("page", {"url": "u1"}, key="u1", requeue=True)
+    assert not queue.enqueue("page", {"url": "u2"}, key="u2", requeue=True)
+    assert queue.counts() == {"page": {"ready": 1, "leased": 1}}
+    assert queue.complete(leased, "w")
+
+
+def test_keep_leased_extends_the_lease(queue):
+    queue.enqueue("job", {"n": 1})
+    task = queue.lease("w")
+    before = queue.conn.execute("SELECT lease_expires FROM tasks").fetchone()[0]
+    with queue.keep_leased(task, "w", interval=0.05):
+        time.sleep(0.3)
+    after = queue.conn.execute("SELECT lease_expires FROM tasks").fetchone()[0]
+    assert after > before
+    assert queue.complete(task, "w")
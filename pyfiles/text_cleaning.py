@@ -0,0 +1,168 @@
+# text_cleaning.py — job-description cleaning pipeline (from data_cleaning.ipynb)
+# Usage:  python text_cleaning.py indeed_jobs_DS.json [more.json ...] [--workers N]
+# Adds the notebook's columns to each description: lower_d, word_tokenized,
+# sentence_tokenized, cleaned_stopword, cleaned_lemmed.
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List
+
+import nltk
+import pandas as pd
+from nltk.corpus import stopwords
+from nltk.stem.wordnet import WordNetLemmatizer
+from nltk.tokenize import RegexpTokenizer, sent_tokenize
+
+# Patterns are compiled once per process
+BRACKETS_RE = re.compile(r"[\[\]\(\)\{\}]")
+NULL_RE = re.compile(r"\bnull\b")
+HTML_RE = re.compile(r"<.*?>")
+SPACE_RE = re.compile(r"\s+")
+SPACED_COMMA_RE = re.compile(r" , ")
+
+TOKENIZER = RegexpTokenizer(r"\w+")
+
+# Descriptions per worker task
+DEFAULT_CHUNK_SIZE = 200
+
+NLTK_RESOURCES = {
+    "stopwords": "corpora/stopwords",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "wordnet": "corpora/wordnet",
+}
+
+
+def ensure_nltk_data():
+    """Download the NLTK corpora the pipeline needs, if missing."""
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(name, quiet=True)
+
+
+@lru_cache(maxsize=1)
+def stop_words() -> frozenset:
+    """English stopwords, built once per process."""
+    return frozenset(stopwords.words("english"))
+
+
+@lru_cache(maxsize=1)
+def lemmatizer() -> WordNetLemmatizer:
+    """Shared WordNet lemmatizer, created once per process."""
+    return WordNetLemmatizer()
+
+
+@lru_cache(maxsize=200000)
+def lemma(word: str) -> str:
+    """Lemmatize one word; job descriptions reuse a small vocabulary."""
+    return lemmatizer().lemmatize(word)
+
+
+def clean_text(raw):
+    """Strip brackets, HTML tags, "null" and extra whitespace."""
+    if not isinstance(raw, str):
+        return raw
+    text = raw.replace("\r", "").replace("\n", " ")
+    text = BRACKETS_RE.sub(" ", text)
+    text = NULL_RE.sub("", text)
+    text = HTML_RE.sub(" ", text)
+    text = SPACE_RE.sub(" ", text).strip()
+    text = SPACED_COMMA_RE.sub(", ", text)
+    return text.replace(".,", ".")
+
+
+def rm_stopwords(tokens: List[str]) -> List[str]:
+    stop = stop_words()
+    return [word for word in tokens if word not in stop]
+
+
+def lemming(tokens: List[str]) -> List[str]:
+    return [lemma(word) for word in tokens]
+
+
+def clean_chunk(descriptions: pd.Series) -> pd.DataFrame:
+    """
+    Run every cleaning step over one chunk of descriptions
+
+    Args:
+        descriptions: Series of raw description strings
+
+    Returns:
+        DataFrame indexed like the input with the notebook's columns
+    """
+    cleaned = descriptions.fillna("").astype(str).map(clean_text)
+    lower = cleaned.str.lower()
+    words = lower.map(TOKENIZER.tokenize)
+    no_stop = words.map(rm_stopwords)
+    return pd.DataFrame({
+        "description": cleaned,
+        "lower_d": lower,
+        "word_tokenized": words,
+        "sentence_tokenized": cleaned.map(sent_tokenize),
+        "cleaned_stopword": no_stop,
+        "cleaned_lemmed": no_stop.map(lemming),
+    })
+
+
+def clean_descriptions(df: pd.DataFrame, column: str = "description",
+                       workers: int = None,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> pd.DataFrame:
+    """
+    Clean a description column, splitting it into chunks that are
+    processed in a process pool.
+
+    Args:
+        df: Jobs DataFrame
+        column: Name of the description column
+        workers: Process count (default: one per CPU; 1 runs in-process)
+        chunk_size: Descriptions per task
+
+    Returns:
+        DataFrame with the cleaned columns, indexed like df
+    """
+    ensure_nltk_data()
+    workers = workers or os.cpu_count() or 1
+    series = df[column]
+    chunks = [series.iloc[i:i + chunk_size] for i in range(0, len(series), chunk_size)]
+
+    if workers == 1 or len(chunks) <= 1:
+        parts = [clean_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            parts = list(executor.map(clean_chunk, chunks))
+
+    if not parts:
+        return clean_chunk(series)
+    return pd.concat(parts)
+
+
+def load_descriptions(paths: List[str]) -> pd.DataFrame:
+    """Concatenate scraped job files, tagging each row with its source."""
+    frames = [pd.read_json(path).assign(source=os.path.basename(path)) for path in paths]
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean scraped job descriptions")
+    parser.add_argument("files", nargs="+", help="indeed_jobs_*.json files")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--out", default=None, help="Optional output JSON path")
+    args = parser.parse_args()
+
+    df = load_descriptions(args.files)
+    cleaned = clean_descriptions(df, workers=args.workers, chunk_size=args.chunk_size)
+    print(f"✓ Cleaned {len(cleaned)} descriptions")
+    print(cleaned[["description", "cleaned_lemmed"]].head())
+
+    if args.out:
+        cleaned.to_json(args.out, orient="records", indent=2, force_ascii=False)
+        print(f"✓ Data saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
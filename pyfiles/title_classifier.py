@@ -0,0 +1,350 @@
+# title_classifier.py — offline job title normalizer and O*NET classifier
+# Usage:  python title_classifier.py indeed_jobs_DS.json [more.json ...]
+#                                    [--min-confidence 0.4] [--out tagged.csv]
+# Matches free-text posting titles ("Sr. Data Engineer II") against reference
+# titles with character n-gram TF-IDF vectors, without O*NET API calls.
+# References come from ../eligible-job-titles_with-keys.json, title_aliases.json
+# and, when downloaded, the O*NET database's "Occupation Data.txt" and
+# "Alternate Titles.txt" in onet_db/. tag_titles() adds onet_code,
+# onet_title, onet_role and title_confidence columns to a DataFrame, scoring
+# each distinct title once in sparse matrix products (scipy.sparse), so the
+# ~57k O*NET alternate titles fit in a few MB.
+
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ELIGIBLE_KEYS_PATH = os.path.join(SCRIPT_DIR, "..", "eligible-job-titles_with-keys.json")
+ALIASES_PATH = os.path.join(SCRIPT_DIR, "title_aliases.json")
+ONET_DB_DIR = os.path.join(SCRIPT_DIR, "onet_db")
+
+# Cosine similarity below which a title is left unclassified
+MIN_CONFIDENCE = 0.45
+NGRAM_SIZES = (3, 4)
+# Title variants scored per matrix product; bounds the similarity block,
+# which holds at most CHUNK_SIZE x references non-zeros
+CHUNK_SIZE = 512
+
+TAG_COLUMNS = ["onet_code", "onet_title", "onet_role", "title_confidence"]
+
+# Text after these separators is team, product or location detail
+QUALIFIER_RE = re.compile(r"\s+[-–—|/]\s+.*$|\s*[(\[].*?[)\]]")
+PAREN_RE = re.compile(r"\s*[(\[].*?[)\]]")
+SEGMENT_RE = re.compile(r"\s+[-–—|/]\s+|,")
+NON_WORD_RE = re.compile(r"[^a-z0-9&+#]+")
+# Seniority and level words carry no occupation information
+LEVEL_WORDS = {
+    "sr", "senior", "jr", "junior", "lead", "principal", "staff", "associate",
+    "entry", "mid", "level", "intern", "i", "ii", "iii", "iv", "v", "1", "2", "3", "4",
+    "specialist", "leader", "executive", "chief", "head", "remote", "hybrid",
+}
+ABBREVIATIONS = {
+    "eng": "engineer", "engr": "engineer", "mgr": "manager", "mgmt": "management",
+    "dev": "developer", "sw": "software", "swe": "software engineer",
+    "sde": "software engineer", "ml": "machine learning", "ai": "ai",
+    "bi": "business intelligence", "qa": "quality assurance", "hr": "human resources",
+    "ux": "ux", "sci": "scientist", "admin": "administrative", "asst": "assistant",
+    "acct": "accountant", "dir": "director", "vp": "vice president",
+}
+
+
+class TitleReference(NamedTuple):
+    code: str
+    title: str
+    role: str
+    text: str
+
+
+class TitleMatch(NamedTuple):
+    onet_code: Optional[str]
+    onet_title: Optional[str]
+    onet_role: Optional[str]
+    title_confidence: float
+
+
+def _clean_words(text: str) -> List[str]:
+    words = []
+    for word in NON_WORD_RE.split(text.lower()):
+        if not word or word in LEVEL_WORDS:
+            continue
+        words.extend(ABBREVIATIONS.get(word, word).split())
+    return words
+
+
+@lru_cache(maxsize=65536)
+def normalize_title(title: str) -> str:
+    """
+    Canonical form of a posting title
+
+    "Sr. Data Engineer II (Azure) - Remote" -> "data engineer"
+    """
+    text = QUALIFIER_RE.sub("", title or "")
+    return " ".join(_clean_words(text))
+
+
+@lru_cache(maxsize=65536)
+def title_variants(title: str) -> tuple:
+    """
+    The normalized title plus each comma- or dash-separated part of the
+    original, so "Canadian English - Data Quality Analyst" can still match
+    on its second half. Always at least one (possibly empty) variant.
+    """
+    variants = [normalize_title(title)]
+    parts = SEGMENT_RE.split(PAREN_RE.sub("", title or ""))
+    if len(parts) > 1:
+        variants += [" ".join(_clean_words(part)) for part in parts]
+    return tuple(dict.fromkeys(v for v in variants if v)) or ("",)
+
+
+def ngrams(text: str) -> Counter:
+    """Character n-grams of each padded word, plus the words themselves."""
+    grams = Counter()
+    for word in text.split():
+        padded = f" {word} "
+        grams[word] += 1
+        for n in NGRAM_SIZES:
+            grams.update(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+def load_references(eligible_path=ELIGIBLE_KEYS_PATH, aliases_path=ALIASES_PATH,
+                    onet_dir=ONET_DB_DIR) -> List[TitleReference]:
+    """
+    Reference titles from the role key file, the alias table and (if
+    present) the O*NET database text files
+
+    Returns:
+        List of TitleReference; one code may appear under many texts
+    """
+    references = []
+    roles = {}
+    if os.path.exists(eligible_path):
+        with open(eligible_path, encoding="utf-8") as f:
+            roles = json.load(f)
+        references += [TitleReference(code, role, role, role) for code, role in roles.items()]
+
+    titles = {}
+    if os.path.exists(aliases_path):
+        with open(aliases_path, encoding="utf-8") as f:
+            for entry in json.load(f)["references"]:
+                titles.setdefault(entry["code"], entry["title"])
+                references += [TitleReference(entry["code"], entry["title"], entry["role"], alias)
+                               for alias in [entry["title"]] + entry["aliases"]]
+
+    # O*NET database downloads: tab-separated, one header row
+    for name, column in (("Occupation Data.txt", "Title"), ("Alternate Titles.txt", "Alternate Title")):
+        path = os.path.join(onet_dir, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            for row in csv.DictReader(f, delimiter="\t"):
+                code = row["O*NET-SOC Code"]
+                title = titles.setdefault(code, row["Title"])
+                references.append(TitleReference(code, title, roles.get(code, ""), row[column]))
+
+    # Official titles for the role key codes where another source knows them
+    return [r._replace(title=titles.get(r.code, r.title)) for r in references]
+
+
+class TitleClassifier:
+    def __init__(self, references: List[TitleReference], min_confidence: float = MIN_CONFIDENCE):
+        self.min_confidence = min_confidence
+        texts = {}
+        for ref in references:
+            norm = normalize_title(ref.text)
+            if norm:
+                # First source wins for duplicate texts (role keys, then aliases)
+                texts.setdefault(norm, ref)
+        self.references = list(texts.values())
+        counts = [ngrams(text) for text in texts]
+
+        doc_freq = Counter(gram for grams in counts for gram in grams)
+        self.vocab = {gram: i for i, gram in enumerate(doc_freq)}
+        n_refs = len(counts)
+        self.idf = np.array([math.log((1 + n_refs) / (1 + doc_freq[g])) + 1 for g in self.vocab],
+                            dtype=np.float32)
+        # Grams no reference contains still count against a title's norm
+        self.unknown_idf = math.log(1 + n_refs) + 1
+
+        # Sparse vocab x references, unit-length columns
+        from scipy import sparse
+
+        rows, cols, values = [], [], []
+        for j, grams in enumerate(counts):
+            ids = [self.vocab[g] for g in grams]
+            tf = np.array([1 + math.log(c) for c in grams.values()], dtype=np.float32)
+            weights = tf * self.idf[ids]
+            rows += ids
+            cols += [j] * len(ids)
+            values.append(weights / np.linalg.norm(weights))
+        self.matrix = sparse.csr_matrix(
+            (np.concatenate(values) if values else np.zeros(0, dtype=np.float32), (rows, cols)),
+            shape=(len(self.vocab), n_refs), dtype=np.float32)
+
+        self.codes = np.array([r.code for r in self.references], dtype=object)
+        self.titles = np.array([r.title for r in self.references], dtype=object)
+        self.roles = np.array([r.role or None for r in self.references], dtype=object)
+
+    def _vectors(self, texts: List[str]):
+        """Unit-length TF-IDF rows over the reference vocabulary (sparse CSR)."""
+        from scipy import sparse
+
+        indptr, indices, values = [0], [], []
+        for text in texts:
+            cols, weights, extra = [], [], 0.0
+            for gram, count in ngrams(text).items():
+                weight = 1 + math.log(count)
+                col = self.vocab.get(gram)
+                if col is None:
+                    extra += (weight * self.unknown_idf) ** 2
+                else:
+                    cols.append(col)
+                    weights.append(weight * self.idf[col])
+            norm = math.sqrt(sum(w * w for w in weights) + extra) or 1.0
+            indices += cols
+            values += [w / norm for w in weights]
+            indptr.append(len(indices))
+        return sparse.csr_matrix((np.array(values, dtype=np.float32), indices, indptr),
+                                 shape=(len(texts), len(self.vocab)))
+
+    def scores(self, titles: List[str]):
+        """
+        Best reference and cosine similarity for each title
+
+        Every variant of a title (see title_variants) is scored and the best
+        one kept.
+
+        Returns:
+            Tuple of arrays: (reference index, similarity), one entry per title
+        """
+        if not titles:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        variants, owner = [], []
+        for i, title in enumerate(titles):
+            for variant in title_variants(title):
+                variants.append(variant)
+                owner.append(i)
+        owner = np.array(owner, dtype=np.int64)
+
+        best_ref = np.zeros(len(variants), dtype=np.int64)
+        best_sim = np.zeros(len(variants), dtype=np.float32)
+        for start in range(0, len(variants), CHUNK_SIZE):
+            sims = (self._vectors(variants[start:start + CHUNK_SIZE]) @ self.matrix).tocsr()
+            if sims.shape[1]:
+                best_ref[start:start + CHUNK_SIZE] = np.asarray(sims.argmax(axis=1)).ravel()
+                best_sim[start:start + CHUNK_SIZE] = sims.max(axis=1).toarray().ravel()
+
+        # Reduce variants to their title: highest similarity wins
+        ref = np.zeros(len(titles), dtype=np.int64)
+        sim = np.zeros(len(titles), dtype=np.float32)
+        order = np.lexsort((best_sim, owner))
+        last = np.r_[owner[order][1:] != owner[order][:-1], True]
+        ref[owner[order][last]] = best_ref[order][last]
+        sim[owner[order][last]] = best_sim[order][last]
+        return ref, sim
+
+    def classify(self, title: str) -> TitleMatch:
+        ref, sim = self.scores([title])
+        return self._match(ref[0], sim[0])
+
+    def _match(self, ref, sim) -> TitleMatch:
+        if sim < self.min_confidence:
+            return TitleMatch(None, None, None, round(float(sim), 3))
+        return TitleMatch(self.codes[ref], self.titles[ref], self.roles[ref], round(float(sim), 3))
+
+    def tag_titles(self, df: "pd.DataFrame", column: str = "title") -> "pd.DataFrame":
+        """
+        Pipeline stage: append onet_code, onet_title, onet_role and
+        title_confidence columns. Each distinct title is scored once.
+
+        Args:
+            df: Jobs DataFrame
+            column: Title column name
+
+        Returns:
+            The same DataFrame with the tag columns added
+        """
+        import pandas as pd
+
+        codes, uniques = pd.factorize(df[column])
+        ref, sim = self.scores([str(t) for t in uniques])
+        keep = sim >= self.min_confidence
+        # Missing titles get code -1; send them to an extra empty row, so
+        # they read None like unclassified titles
+        table = pd.DataFrame({
+            "onet_code": np.append(np.where(keep, self.codes[ref], None), None),
+            "onet_title": np.append(np.where(keep, self.titles[ref], None), None),
+            "onet_role": np.append(np.where(keep, self.roles[ref], None), None),
+            "title_confidence": np.append(sim.round(3), 0.0),
+        })
+        codes[codes == -1] = len(uniques)
+        tagged = table.iloc[codes].reset_index(drop=True)
+        for name in TAG_COLUMNS:
+            df[name] = tagged[name].to_numpy()
+        return df
+
+
+@lru_cache(maxsize=1)
+def default_classifier() -> TitleClassifier:
+    return TitleClassifier(load_references())
+
+
+def tag_titles(df: "pd.DataFrame", column: str = "title") -> "pd.DataFrame":
+    """tag_titles with the bundled reference titles."""
+    return default_classifier().tag_titles(df, column)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tag posting titles with O*NET codes offline")
+    parser.add_argument("files", nargs="+", help="Saved indeed_jobs_*.json files")
+    parser.add_argument("--min-confidence", type=float, default=MIN_CONFIDENCE)
+    parser.add_argument("--out", help="Write the tagged postings to this CSV")
+    parser.add_argument("--show", type=int, default=15, help="Example titles to print")
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    frames = []
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            frames.append(pd.DataFrame(json.load(f)).assign(source=os.path.basename(path)))
+    df = pd.concat(frames, ignore_index=True)
+
+    start = time.perf_counter()
+    classifier = TitleClassifier(load_references(), args.min_confidence)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    classifier.tag_titles(df)
+    elapsed = time.perf_counter() - start
+
+    distinct = df["title"].nunique()
+    tagged = df["onet_code"].notna().mean()
+    print(f"{len(classifier.references)} reference titles, index built in {built * 1000:.0f} ms")
+    print(f"Tagged {len(df)} postings ({distinct} distinct titles) in {elapsed * 1000:.1f} ms "
+          f"({distinct / max(elapsed, 1e-9):,.0f} titles/s); {tagged:.0%} above "
+          f"confidence {args.min_confidence}")
+    print("\nPostings per role:")
+    print(df["onet_role"].fillna("(unclassified)").value_counts().to_string())
+    print("\nExamples:")
+    sample = df.drop_duplicates("title").head(args.show)
+    for row in sample.itertuples():
+        print(f"  {row.title_confidence:.2f}  {row.onet_code or '-':<11} "
+              f"{(row.onet_role or '-'):<28} {row.title}")
+
+    if args.out:
+        df.drop(columns=["description"], errors="ignore").to_csv(args.out, index=False)
+        print(f"\n✓ Tagged postings written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,33 @@
+import importlib.util
+import weakref
+from typing import NamedTuple
+
+import blocking
 import config
+import driver_supervisor
+import metrics
+from job_record import EXPORT_HEADERS, JobRecord, as_records, to_frame
+
 
+def get_chrome_options(lean=None, cache_dir=None):
+    """
+    Returns configured Chrome options for anti-detection
 
-def get_chrome_options():
-    """Returns configured Chrome options for anti-detection"""
+    Args:
+        lean: Use the text-only scraping profile (eager page loads, capped
+            viewport, no images); defaults to config.LEAN_CHROME_PROFILE
+        cache_dir: Disk cache directory for the lean profile (see
+            chrome_cache_dir); Chrome's default when None
+    """
+    if lean is None:
+        lean = config.LEAN_CHROME_PROFILE
     options = config.webdriver.ChromeOptions()
 
     # Window settings
-    options.add_argument("--start-maximized")
+    if lean:
+        options.add_argument(f"--window-size={config.CHROME_WINDOW_SIZE}")
+    else:
+        options.add_argument("--start-maximized")
 
     # Anti-detection features
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -16,9 +37,54 @@ def get_chrome_options():
     # Headless mode (comment out to see browser)
     options.add_argument("--headless")
 
+    if lean:
+        # Return from driver.get() at DOMContentLoaded; callers already wait
+        # for the elements they read
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2})
+        options.add_argument("--disable-extensions")
+        options.add_argument("--mute-audio")
+        if cache_dir:
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+
     return options
 
 
+# Cache slots held by running drivers. A new driver takes the lowest free
+# slot, so there are never more cache directories than drivers that ever
+# ran at once, however many threads the autoscaled pool goes through
+_cache_slots = set()
+_cache_slots_lock = config.Lock()
+# driver -> callback that frees its slot (also run if the driver is lost)
+_cache_slot_release = weakref.WeakKeyDictionary()
+
+
+def claim_cache_slot():
+    """Reserve the lowest free cache slot; free it with release_cache_slot."""
+    with _cache_slots_lock:
+        slot = next(i for i in range(len(_cache_slots) + 1) if i not in _cache_slots)
+        _cache_slots.add(slot)
+    return slot
+
+
+def release_cache_slot(slot):
+    with _cache_slots_lock:
+        _cache_slots.discard(slot)
+
+
+def chrome_cache_dir(slot):
+    """
+    Disk cache directory of a cache slot. Successive drivers reuse a warm
+    cache, while concurrently running Chromes never share (and lock) the
+    same directory.
+    """
+    path = config.os.path.join(config.CHROME_CACHE_DIR, f"slot-{slot}")
+    config.os.makedirs(path, exist_ok=True)
+    return path
+
+
 # User agent string
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
 
@@ -36,7 +102,7 @@ def get_url(job_title, city, state, page=0):
     Returns:
         Formatted Indeed search URL
     """
-    template = "https://www.indeed.com/jobs?q={}&l={}"
+    template = config.INDEED_BASE_URL + "/jobs?q={}&l={}"
     if page > 0:
         template += "&start={}".format(page * config.JOBS_PER_PAGE)
 
@@ -50,25 +116,62 @@ def get_url(job_title, city, state, page=0):
     return url
 
 
-def create_driver():
+def create_driver(lean=None):
     """
     Create and configure a new Chrome WebDriver instance
     with anti-detection features
 
+    Args:
+        lean: Use the text-only scraping profile (see get_chrome_options)
+
     Returns:
-        Configured Chrome WebDriver
+        Configured Chrome WebDriver, tracked by driver_supervisor; release
+        it with quit_driver()
+
+    Raises:
+        driver_supervisor.MemoryPressureError: If memory stays short
     """
-    options = get_chrome_options()
-    driver = config.webdriver.Chrome(options=options)
+    if lean is None:
+        lean = config.LEAN_CHROME_PROFILE
+    slot = claim_cache_slot() if lean else None
+    try:
+        options = get_chrome_options(lean, None if slot is None else chrome_cache_dir(slot))
+        driver_supervisor.SUPERVISOR.admit()
+        with metrics.span("create_driver"), driver_supervisor.SUPERVISOR.launching():
+            driver = config.webdriver.Chrome(options=options)
+            driver_supervisor.SUPERVISOR.register(driver)
+    except BaseException:
+        if slot is not None:
+            release_cache_slot(slot)
+        raise
+    if slot is not None:
+        _cache_slot_release[driver] = weakref.finalize(driver, release_cache_slot, slot)
+    metrics.count("scrape_chrome_starts_total")
 
     # Set custom user agent
     driver.execute_cdp_cmd('Network.setUserAgentOverride', {
         "userAgent": USER_AGENT
     })
 
+    if lean:
+        # Drop fonts, stylesheets, media and trackers before they are requested
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            "urls": config.BLOCKED_URL_PATTERNS
+        })
+
     return driver
 
 
+def quit_driver(driver):
+    """Quit a driver from create_driver and kill any Chrome process it left."""
+    with metrics.span("driver_quit"):
+        driver_supervisor.SUPERVISOR.quit(driver)
+    release = _cache_slot_release.pop(driver, None)
+    if release:
+        release()
+
+
 def safe_print(message):
     """
     Thread-safe print function
@@ -106,69 +209,352 @@ def get_job_basic_info(post):
         return None
 
 
-def get_job_description(job_url):
+# Listing card selectors; CARD_XPATHS mirrors CARD_SELECTORS for lxml
+CARD_SELECTORS = {
+    "card": ".job_seen_beacon",
+    "title": "h2.jobTitle",
+    "company": "span[data-testid='company-name']",
+    "location": "div[data-testid='text-location']",
+    "link": "h2.jobTitle a",
+}
+CARD_XPATHS = {
+    "card": "//*[contains(concat(' ', normalize-space(@class), ' '), ' job_seen_beacon ')]",
+    "title": ".//h2[contains(concat(' ', normalize-space(@class), ' '), ' jobTitle ')]",
+    "company": ".//span[@data-testid='company-name']",
+    "location": ".//div[@data-testid='text-location']",
+    "link": ".//h2[contains(concat(' ', normalize-space(@class), ' '), ' jobTitle ')]//a[@href]",
+}
+
+# Reads every card on the page in the browser and returns them in one reply
+EXTRACT_CARDS_JS = """
+var s = arguments[0];
+return Array.prototype.map.call(document.querySelectorAll(s.card), function (card) {
+    var title = card.querySelector(s.title),
+        company = card.querySelector(s.company),
+        location = card.querySelector(s.location),
+        link = card.querySelector(s.link);
+    if (!title || !company || !location || !link) return null;
+    return [title.innerText, company.innerText, location.innerText, link.href];
+});
+"""
+
+BLOCK_TAGS = {"div", "p", "li", "ul", "ol", "h1", "h2", "h3", "h4", "table", "tr"}
+
+
+def _inner_text(element):
+    """Approximate the browser's innerText: block elements start new lines."""
+    parts = []
+
+    def walk(el):
+        block = el.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        elif el.tag == "br":
+            parts.append("\n")
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def parse_job_cards(html, base_url=""):
     """
-    Get full job description and salary by opening the job URL
-    Uses a fresh browser instance for anti-detection
+    Extract every listing card from saved page HTML with lxml
 
     Args:
-        job_url: URL of the job posting
+        html: Listing page source (e.g. driver.page_source)
+        base_url: URL the page was loaded from, used to resolve job links
 
     Returns:
-        Tuple: (salary, job_description) where salary may be empty string
+        List of (title, company, location, job_url) tuples
+    """
+    from urllib.parse import urljoin
+    import lxml.html
+
+    tree = lxml.html.fromstring(html)
+    cards = []
+    for card in tree.xpath(CARD_XPATHS["card"]):
+        fields = [card.xpath(CARD_XPATHS[name])
+                  for name in ("title", "company", "location", "link")]
+        if not all(fields):
+            continue
+        title, company, location, link = (f[0] for f in fields)
+        cards.append((_inner_text(title), _inner_text(company), _inner_text(location),
+                      urljoin(base_url, link.get("href"))))
+    return cards
+
+
+def get_job_cards(driver):
     """
-    driver = create_driver()
-    salary = ""
-    job_description = "None"
+    Extract all listing cards on the current page in a single round-trip
+    to chromedriver, falling back to parsing page_source with lxml
+
+    Args:
+        driver: WebDriver showing an Indeed results page
 
+    Returns:
+        List of (title, company, location, job_url) tuples
+    """
     try:
-        driver.get(job_url)
-        config.time.sleep(config.random.randint(
-            config.JOB_LOAD_MIN, config.JOB_LOAD_MAX))
+        with metrics.span("card_extract"):
+            rows = driver.execute_script(EXTRACT_CARDS_JS, CARD_SELECTORS)
+    except config.WebDriverException as e:
+        print(f"Card script failed, parsing page source instead: {e.msg}")
+        rows = None
+
+    if rows is None:
+        with metrics.span("card_parse_fallback"):
+            return parse_job_cards(driver.page_source, driver.current_url)
+    return [tuple(field.strip() for field in row) for row in rows if row]
+
+
+class JobDetails(NamedTuple):
+    description: str
+    salary: str
+    job_type: str
+    benefits: str
+    date_posted: str
+
+
+# Reads every detail field in the browser and returns them in one reply;
+# arguments[0] is the selector table from detail_selectors.json
+EXTRACT_DETAIL_JS = """
+var table = arguments[0], out = {};
+Object.keys(table).forEach(function (field) {
+    var spec = table[field];
+    if (!spec.selectors) return;
+    for (var i = 0; i < spec.selectors.length; i++) {
+        var sel = spec.selectors[i], attr = null, at = sel.lastIndexOf("@");
+        if (at > 0 && sel.indexOf("]", at) < 0) {
+            attr = sel.slice(at + 1);
+            sel = sel.slice(0, at);
+        }
+        var nodes = spec.all ? Array.prototype.slice.call(document.querySelectorAll(sel))
+                             : [document.querySelector(sel)].filter(Boolean);
+        var values = nodes.map(function (el) {
+            return attr ? el.getAttribute(attr) || "" : el.innerText;
+        }).filter(function (v) { return v && v.trim(); });
+        if (values.length) {
+            out[field] = values;
+            return;
+        }
+    }
+});
+return out;
+"""
 
-        config.WebDriverWait(driver, config.WEBDRIVER_TIMEOUT).until(
-            config.EC.presence_of_element_located(
-                (config.By.ID, "jobDescriptionText"))
-        )
-        job_description = driver.find_element(
-            config.By.ID, "jobDescriptionText").text
+_detail_selectors = {}
 
-        # NEW: Try to get salary from the detail page
-        try:
-            # Method 1: Try the salaryInfoAndJobType div with specific class
-            salary_element = driver.find_element(
-                config.By.CSS_SELECTOR, "span.css-1oc7tea")
-            salary = salary_element.text.strip()
-        except config.NoSuchElementException:
-            try:
-                # Method 2: Try alternative salary container
-                salary_element = driver.find_element(
-                    config.By.ID, "salaryInfoAndJobType")
-                salary_span = salary_element.find_element(
-                    config.By.CSS_SELECTOR, "span.css-1oc7tea")
-                salary = salary_span.text.strip()
-            except config.NoSuchElementException:
-                try:
-                    # Method 3: Try broader search in salary section
-                    salary_container = driver.find_element(
-                        config.By.CSS_SELECTOR, "div#salaryInfoAndJobType")
-                    salary_text = salary_container.text.split('-')[0].strip()
-                    if salary_text:
-                        salary = salary_container.text.split('\n')[0].strip()
-                except config.NoSuchElementException:
-                    salary = ""
-
-    except (config.NoSuchElementException, config.TimeoutException):
-        job_description = "None"
-        salary = ""
-    except Exception as e:
-        safe_print(f"Error getting job details: {e}")
-        job_description = "None"
-        salary = ""
+
+def load_detail_selectors(path=None):
+    """
+    Selector table for detail pages, re-read whenever the file changes so
+    it can be fixed during a long run
+
+    Returns:
+        Dict: field -> {"selectors": [...], "all", "first_line", "strip"}
+    """
+    path = path or config.DETAIL_SELECTORS_FILE
+    mtime = config.os.path.getmtime(path)
+    cached = _detail_selectors.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, encoding="utf-8") as f:
+            table = {field: spec for field, spec in config.json.load(f).items()
+                     if isinstance(spec, dict)}
+        cached = _detail_selectors[path] = (mtime, table)
+    return cached[1]
+
+
+def _split_selector(selector):
+    """'meta[itemprop=x]@content' -> ('meta[itemprop=x]', 'content')."""
+    at = selector.rfind("@")
+    if at > 0 and "]" not in selector[at:]:
+        return selector[:at], selector[at + 1:]
+    return selector, None
+
+
+def wait_selector(table, field="description"):
+    """CSS group matching any selector of a field, without @attr suffixes."""
+    return ", ".join(dict.fromkeys(
+        _split_selector(selector)[0] for selector in table[field]["selectors"]))
+
+
+def _clean_details(raw, table):
+    """JobDetails from the raw text lists found for each field."""
+    values = {}
+    for field in JobDetails._fields:
+        spec = table.get(field, {})
+        texts = []
+        for text in raw.get(field) or []:
+            text = text.strip()
+            if spec.get("first_line"):
+                text = text.split("\n")[0]
+            text = text.strip(spec.get("strip", " "))
+            if text:
+                texts.append(text)
+        if not spec.get("all"):
+            texts = texts[:1]
+        values[field] = "; ".join(dict.fromkeys(texts))
+    values["description"] = values["description"] or "None"
+    return JobDetails(**values)
+
+
+def parse_job_details(html, table=None):
+    """
+    Extract detail fields from saved page HTML with lxml, using the same
+    selector table as the in-browser script
+
+    Args:
+        html: Detail page source (e.g. driver.page_source)
+        table: Selector table (default: load_detail_selectors())
+
+    Returns:
+        JobDetails
+    """
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+
+    table = table or load_detail_selectors()
+    tree = lxml.html.fromstring(html)
+    raw = {}
+    for field, spec in table.items():
+        for selector in spec.get("selectors", []):
+            css, attr = _split_selector(selector)
+            nodes = CSSSelector(css)(tree)
+            if not spec.get("all"):
+                nodes = nodes[:1]
+            values = [(node.get(attr) or "") if attr else _inner_text(node) for node in nodes]
+            values = [v for v in values if v.strip()]
+            if values:
+                raw[field] = values
+                break
+    return _clean_details(raw, table)
+
+
+def extract_job_details(driver):
+    """
+    Read every detail field of the open job page in a single round-trip
+    to chromedriver, falling back to parsing page_source with lxml
+
+    Args:
+        driver: WebDriver showing an Indeed job detail page
+
+    Returns:
+        JobDetails
+    """
+    table = load_detail_selectors()
+    try:
+        with metrics.span("detail_extract"):
+            raw = driver.execute_script(EXTRACT_DETAIL_JS, table)
+    except config.WebDriverException as e:
+        safe_print(f"Detail script failed, parsing page source instead: {e.msg}")
+        raw = None
+    if raw is None:
+        with metrics.span("detail_parse_fallback"):
+            return parse_job_details(driver.page_source, table)
+    return _clean_details(raw, table)
+
+
+def get_job_details(job_url):
+    """
+    Get the description, salary, job type, benefits and posting date by
+    opening the job URL
+    Uses a fresh browser instance for anti-detection; waits first while
+    blocking.BREAKER is open
+
+    Args:
+        job_url: URL of the job posting
+
+    Returns:
+        JobDetails
+
+    Raises:
+        blocking.BlockedError: If a block/captcha page was served
+        TimeoutException: If the description never appeared
+        WebDriverException: If the browser failed
+    """
+    blocking.BREAKER.wait()
+    try:
+        driver = create_driver()
+    except BaseException:
+        blocking.BREAKER.release()
+        raise
+
+    try:
+        with metrics.span("detail_get"):
+            driver.get(job_url)
+        with metrics.span("detail_sleep"):
+            config.time.sleep(config.random.randint(
+                config.JOB_LOAD_MIN, config.JOB_LOAD_MAX))
+
+        description_css = wait_selector(load_detail_selectors())
+        with metrics.span("detail_wait"):
+            blocking.wait_for_page(driver, description_css)
+        blocking.BREAKER.record_success()
+        details = extract_job_details(driver)
+    except config.TimeoutException:
+        # The page answered, just without a description. Not counted as
+        # missing: the job is retried, and the timeout already shows up in
+        # scrape_phase_errors_total
+        blocking.BREAKER.record_success()
+        raise
+    except blocking.BlockedError:
+        raise
+    except BaseException:
+        blocking.BREAKER.release()
+        raise
     finally:
-        driver.quit()
+        metrics.count("scrape_detail_pages_total")
+        quit_driver(driver)
+
+    if details.description == "None":
+        metrics.count("scrape_description_missing_total")
+    if not details.salary:
+        metrics.count("scrape_salary_missing_total")
+    return details
 
-    return (salary, job_description)
+
+def get_detail_salary(driver):
+    """
+    Salary text from an open job detail page, or "" if none is shown
+    (the per-selector lookup that extract_job_details replaced; kept for
+    bench_detail_extraction.py)
+    """
+    try:
+        # Method 1: Try the salaryInfoAndJobType div with specific class
+        salary_element = driver.find_element(
+            config.By.CSS_SELECTOR, "span.css-1oc7tea")
+        return salary_element.text.strip()
+    except config.NoSuchElementException:
+        pass
+    try:
+        # Method 2: Try alternative salary container
+        salary_element = driver.find_element(
+            config.By.ID, "salaryInfoAndJobType")
+        salary_span = salary_element.find_element(
+            config.By.CSS_SELECTOR, "span.css-1oc7tea")
+        return salary_span.text.strip()
+    except config.NoSuchElementException:
+        pass
+    try:
+        # Method 3: Try broader search in salary section
+        salary_container = driver.find_element(
+            config.By.CSS_SELECTOR, "div#salaryInfoAndJobType")
+        salary_text = salary_container.text.split('-')[0].strip()
+        if salary_text:
+            return salary_container.text.split('\n')[0].strip()
+    except config.NoSuchElementException:
+        pass
+    return ""
 
 
 def process_job_with_description(job_data, index, total):
@@ -183,39 +569,95 @@ def process_job_with_description(job_data, index, total):
         total: Total number of jobs
     
     Returns:
-        Complete job record tuple
+        Complete JobRecord
     """
     safe_print(
         f"[Thread] Processing job {index + 1}/{total}: {title} at {company}")
-    config.time.sleep(config.random.uniform(
-        config.THREAD_DELAY_MIN, config.THREAD_DELAY_MAX))
+    with metrics.span("thread_sleep"):
+        config.time.sleep(config.random.uniform(
+            config.THREAD_DELAY_MIN, config.THREAD_DELAY_MAX))
 
-    salary, job_description = get_job_description(job_url)
+    start = config.time.perf_counter()
+    details = get_job_details(job_url)
+    metrics.observe("scrape_job_seconds", config.time.perf_counter() - start)
 
-    record = (title, company, location, salary, job_url, job_description)
+    record = JobRecord.create(title, company, location, details.salary, job_url,
+                              details.description, details.job_type, details.benefits,
+                              details.date_posted)
     safe_print(
-        f"[Thread] Completed job {index + 1}/{total}: {title} | Salary: {salary if salary else 'Not listed'}")
+        f"[Thread] Completed job {index + 1}/{total}: {title} | Salary: {details.salary if details.salary else 'Not listed'}")
     return record
 
 
+def retryable_errors():
+    """
+    Errors after which a job is worth another round: block pages, timeouts,
+    browser failures and drivers refused under memory pressure
+    """
+    return (blocking.BlockedError, driver_supervisor.MemoryPressureError,
+            config.TimeoutException, config.WebDriverException)
+
+
+def fetch_descriptions(executor, job_basics, process=None):
+    """
+    Fetch the details of every job on executor, retrying jobs that failed
+    with a retryable error in up to BLOCK_MAX_RETRIES later rounds (after
+    the circuit breaker's pause) instead of storing an empty description.
+    Any other error is a bug and is not retried.
+
+    Args:
+        executor: Thread pool to run the jobs on
+        job_basics: (title, company, location, url) tuples
+        process: Per-job function; defaults to process_job_with_description
+
+    Returns:
+        (records, failed_jobs): JobRecords and the job tuples not saved
+    """
+    process = process or process_job_with_description
+    retryable = retryable_errors()
+    records, failed_jobs = [], []
+    pending_jobs = job_basics
+    for round_num in range(config.BLOCK_MAX_RETRIES + 1):
+        if round_num:
+            print(f"\nRetry round {round_num}: {len(pending_jobs)} jobs...")
+            metrics.count("scrape_jobs_retried_total", len(pending_jobs))
+        future_to_job = {
+            executor.submit(process, job_data, i, len(pending_jobs)): job_data
+            for i, job_data in enumerate(pending_jobs)
+        }
+
+        retry_jobs = []
+        for future in config.as_completed(future_to_job):
+            try:
+                records.append(future.result())
+            except retryable as e:
+                retry_jobs.append(future_to_job[future])
+                safe_print(f"Error processing job ({type(e).__name__}): {e}")
+            except Exception as e:
+                failed_jobs.append(future_to_job[future])
+                safe_print(f"Error processing job, not retried ({type(e).__name__}): {e}")
+        pending_jobs = retry_jobs
+        if not pending_jobs:
+            break
+    return records, failed_jobs + pending_jobs
+
+
 def save_to_csv(records, filename="indeed_jobs.csv"):
     """
     Save job records to CSV file
 
     Args:
-        records: List of job tuples
+        records: List of JobRecords
         filename: Output CSV filename
     """
     if not records:
         print("⚠ No records to save")
         return
 
-    headers = ["Title", "Company", "Location", "Salary", "URL", "Description"]
-
     with open(filename, mode="w", newline="", encoding="utf-8") as file:
         writer = config.csv.writer(file)
-        writer.writerow(headers)
-        writer.writerows(records)
+        writer.writerow(EXPORT_HEADERS)
+        writer.writerows(as_records(records))
 
     print(f"✓ Data saved to {filename}")
     print(f"  Rows: {len(records)}")
@@ -226,15 +668,14 @@ def save_to_excel(records, filename="indeed_jobs.xlsx"):
     Save job records to Excel file with formatting
 
     Args:
-        records: List of job tuples
+        records: List of JobRecords
         filename: Output Excel filename
     """
     if not records:
         print("⚠ No records to save")
         return
 
-    df = config.pd.DataFrame(records, columns=[
-        "Title", "Company", "Location", "Salary", "URL", "Description"])
+    df = to_frame(records)
     # Save with auto-column width
     with config.pd.ExcelWriter(filename, engine='openpyxl') as writer:
         df.to_excel(writer, index=False, sheet_name='Jobs')
@@ -258,24 +699,15 @@ def save_to_json(records, filename="indeed_jobs.json"):
     Save job records to JSON file
 
     Args:
-        records: List of job tuples
+        records: List of JobRecords
         filename: Output JSON filename
     """
     if not records:
         print("⚠ No records to save")
         return
 
-    jobs_list = []
-    for record in records:
-        job_dict = {
-            "title": record[0],
-            "company": record[1],
-            "location": record[2],
-            "salary": record[3],
-            "url": record[4],
-            "description": record[5]
-        }
-        jobs_list.append(job_dict)
+    # _asdict shares the record's strings, so descriptions are not copied
+    jobs_list = [record._asdict() for record in as_records(records)]
 
     with open(filename, 'w', encoding='utf-8') as f:
         config.json.dump(jobs_list, f, indent=2, ensure_ascii=False)
@@ -308,3 +740,23 @@ def save_data(records, option, job_title):
             "0 → CSV\n1 → JSON\n2 → Excel\n3 → All formats\n4 → Quit"
         )
         save_data(records, option, job_title)
+        return
+
+    # Keep the full-text index current with every saved batch
+    try:
+        import job_index
+        changed = job_index.index_records(records, job_title)
+        print(f"✓ Search index updated ({changed} new or changed postings)")
+    except Exception as e:
+        print(f"Error updating search index: {e}")
+
+    if config.SEMANTIC_INDEX_ON_SAVE:
+        if importlib.util.find_spec("sentence_transformers") is None:
+            print("⚠ Semantic index skipped: sentence-transformers is not installed")
+            return
+        try:
+            import semantic_search
+            added = semantic_search.index_records(records, job_title)
+            print(f"✓ Semantic index updated ({added} new postings embedded)")
+        except Exception as e:
+            print(f"Error updating semantic index: {e}")
@@ -0,0 +1,226 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+
+QUEUE_DB = "work_queue.db"
+
+# Seconds a leased task stays invisible before another worker may take it
+VISIBILITY_TIMEOUT = 300
+MAX_ATTEMPTS = 3
+# Retry delay after a failure: RETRY_BACKOFF * 2 ** (attempts - 1) seconds
+RETRY_BACKOFF = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'ready',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    UNIQUE (kind, key)
+);
+CREATE INDEX IF NOT EXISTS tasks_ready ON tasks (state, available_at);
+"""
+
+
+class Task(NamedTuple):
+    id: int
+    kind: str
+    key: str
+    payload: dict
+    attempts: int
+
+
+class WorkQueue:
+    """
+    Durable task queue in a SQLite file shared by a coordinator and any
+    number of worker processes.
+
+    Tasks move ready -> leased -> done. A lease hides a task from other
+    workers for visibility_timeout seconds; if the worker dies, the task
+    becomes visible again. Failed tasks are retried with exponential
+    backoff until max_attempts, then parked in the dead-letter state.
+    """
+
+    def __init__(self, db_path: str = QUEUE_DB,
+                 visibility_timeout: float = VISIBILITY_TIMEOUT,
+                 max_attempts: int = MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        # Autocommit mode; lease() opens its own write transaction
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def enqueue(self, kind: str, payload: dict, key: Optional[str] = None,
+                requeue: bool = False) -> bool:
+        """
+        Add a task unless one with the same kind and key already exists
+
+        Args:
+            kind: Task type, e.g. "page" or "job"
+            payload: JSON-serializable task data
+            key: Deduplication key (defaults to the payload JSON)
+            requeue: Also reset an existing done or dead task with this key
+                to ready with fresh attempts (ready and leased tasks are
+                left alone)
+
+        Returns:
+            True if the task was added or requeued
+        """
+        now = time.time()
+        body = json.dumps(payload, sort_keys=True)
+        sql = ("INSERT INTO tasks (kind, key, payload, available_at, created, updated)"
+               " VALUES (?, ?, ?, ?, ?, ?)")
+        if requeue:
+            sql += (" ON CONFLICT (kind, key) DO UPDATE SET state = 'ready', attempts = 0,"
+                    " payload = excluded.payload, available_at = excluded.available_at,"
+                    " last_error = NULL, updated = excluded.updated"
+                    " WHERE tasks.state IN ('done', 'dead')")
+        else:
+            sql += " ON CONFLICT (kind, key) DO NOTHING"
+        cur = self.conn.execute(sql, (kind, key or body, body, now, now, now))
+        return cur.rowcount == 1
+
+    def lease(self, worker: str, kinds: Optional[List[str]] = None) -> Optional[Task]:
+        """
+        Take the oldest visible task, or None if nothing is available.
+        Expired leases count as visible; tasks whose lease expired on the
+        last allowed attempt are dead-lettered instead of handed out.
+        """
+        now = time.time()
+        kind_filter = ""
+        params: list = [now, now]
+        if kinds:
+            kind_filter = f" AND kind IN ({','.join('?' * len(kinds))})"
+            params += list(kinds)
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "UPDATE tasks SET state = 'dead', lease_owner = NULL, updated = ?,"
+                " last_error = COALESCE(last_error, 'lease expired')"
+                " WHERE state = 'leased' AND lease_expires <= ? AND attempts >= ?",
+                (now, now, self.max_attempts))
+            row = self.conn.execute(
+                "SELECT id, kind, key, payload, attempts FROM tasks"
+                " WHERE ((state = 'ready' AND available_at <= ?)"
+                " OR (state = 'leased' AND lease_expires <= ?))"
+                f"{kind_filter} ORDER BY id LIMIT 1", params).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                "UPDATE tasks SET state = 'leased', lease_owner = ?, lease_expires = ?,"
+                " attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker, now + self.visibility_timeout, now, row[0]))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return Task(row[0], row[1], row[2], json.loads(row[3]), row[4] + 1)
+
+    def heartbeat(self, task: Task, worker: str) -> bool:
+        """Extend a lease for long-running work; False if the lease was lost."""
+        now = time.time()
+        cur = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ?, updated = ?"
+            " WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (now + self.visibility_timeout, now, task.id, worker))
+        return cur.rowcount == 1
+
+    @contextmanager
+    def keep_leased(self, task: Task, worker: str, interval: Optional[float] = None):
+        """
+        Heartbeat a task's lease from a background thread (with its own
+        connection) while the with-block runs
+
+        Args:
+            task: Leased task
+            worker: Lease owner
+            interval: Seconds between heartbeats (default a third of the
+                visibility timeout)
+        """
+        interval = interval or self.visibility_timeout / 3
+        stop = threading.Event()
+
+        def beat():
+            queue = WorkQueue(self.db_path, self.visibility_timeout, self.max_attempts)
+            try:
+                while not stop.wait(interval):
+                    if not queue.heartbeat(task, worker):
+                        return
+            finally:
+                queue.close()
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, task: Task, worker: str) -> bool:
+        cur = self.conn.execute(
+            "UPDATE tasks SET state = 'done', lease_owner = NULL, updated = ?"
+            " WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time(), task.id, worker))
+        return cur.rowcount == 1
+
+    def fail(self, task: Task, worker: str, error: str) -> str:
+        """
+        Record a failed attempt
+
+        Returns:
+            The task's new state: "ready" (will be retried) or "dead"
+        """
+        now = time.time()
+        state = "dead" if task.attempts >= self.max_attempts else "ready"
+        delay = RETRY_BACKOFF * 2 ** (task.attempts - 1)
+        self.conn.execute(
+            "UPDATE tasks SET state = ?, available_at = ?, lease_owner = NULL,"
+            " last_error = ?, updated = ?"
+            " WHERE id = ? AND state = 'leased' AND lease_owner = ?",
+            (state, now + delay, error[:2000], now, task.id, worker))
+        return state
+
+    def counts(self) -> dict:
+        """Number of tasks per kind and state."""
+        counts = {}
+        for kind, state, n in self.conn.execute(
+                "SELECT kind, state, COUNT(*) FROM tasks GROUP BY kind, state"):
+            counts.setdefault(kind, {})[state] = n
+        return counts
+
+    def pending(self) -> int:
+        """Tasks that are still ready or leased."""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE state IN ('ready', 'leased')").fetchone()[0]
+
+    def dead_letters(self) -> List[tuple]:
+        """Dead-lettered tasks as (id, kind, key, attempts, last_error) tuples."""
+        return self.conn.execute(
+            "SELECT id, kind, key, attempts, last_error FROM tasks"
+            " WHERE state = 'dead' ORDER BY id").fetchall()
+
+    def requeue_dead(self) -> int:
+        """Give every dead-lettered task a fresh set of attempts."""
+        now = time.time()
+        return self.conn.execute(
+            "UPDATE tasks SET state = 'ready', attempts = 0, available_at = ?, updated = ?"
+            " WHERE state = 'dead'", (now, now)).rowcount
+
+    def close(self):
+        self.conn.close()